@@ -0,0 +1,66 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""
+PyInstaller spec for the shared Employee Tracker bundle
+Analyzes the GUI, tray and background entry points once and builds three small launchers over one runtime
+
+Used by `build_exe.py --profile shared` and the shared option of build_cross_platform.py:
+    pyinstaller --noconfirm EmployeeTracker.spec
+Options come from the environment, so both scripts can pass their profile settings:
+    EMPLOYEE_TRACKER_BUILD_EXCLUDES  comma-separated modules to leave out
+    EMPLOYEE_TRACKER_BUILD_ICON      icon file (default icon.ico, icon.icns on macOS)
+"""
+
+import os
+import platform
+import sys
+
+sys.path.insert(0, SPECPATH)
+import build_dependencies
+
+# Launcher name -> entry point script
+ENTRY_POINTS = [(name, target['script']) for name, target in build_dependencies.TARGETS.items()]
+BUNDLE_NAME = 'EmployeeTracker'
+
+# One bundle for all launchers, so it holds what any of them needs
+launcher_names = [name for name, _ in ENTRY_POINTS]
+HIDDEN_IMPORTS = build_dependencies.hidden_imports(launcher_names, platform.system().lower())
+EXCLUDES = build_dependencies.excludes(launcher_names)
+EXCLUDES += [module for module in os.environ.get('EMPLOYEE_TRACKER_BUILD_EXCLUDES', '').split(',') if module]
+ICON = os.environ.get('EMPLOYEE_TRACKER_BUILD_ICON', 'icon.icns' if sys.platform == 'darwin' else 'icon.ico')
+
+# One analysis of all entry points: the dependency graph is built once
+a = Analysis(
+    [script for _, script in ENTRY_POINTS],
+    pathex=['src'],
+    datas=build_dependencies.data_files(launcher_names),
+    hiddenimports=HIDDEN_IMPORTS,
+    excludes=EXCLUDES,
+)
+pyz = PYZ(a.pure)
+
+# The analysis lists every entry script; each launcher keeps the runtime hooks and its own script only
+script_names = {os.path.splitext(os.path.basename(script))[0] for _, script in ENTRY_POINTS}
+launchers = []
+for name, script in ENTRY_POINTS:
+    own_script = os.path.splitext(os.path.basename(script))[0]
+    scripts = [entry for entry in a.scripts if entry[0] == own_script or entry[0] not in script_names]
+    launchers.append(EXE(
+        pyz,
+        scripts,
+        [],
+        exclude_binaries=True,
+        name=name,
+        console=False,
+        icon=ICON,
+    ))
+
+# Libraries, Python runtime and data files are collected once and shared by all launchers
+coll = COLLECT(
+    *launchers,
+    a.binaries,
+    a.datas,
+    name=BUNDLE_NAME,
+)
+
+if sys.platform == 'darwin':
+    app = BUNDLE(coll, name=f'{BUNDLE_NAME}.app', icon=ICON)
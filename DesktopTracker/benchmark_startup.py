@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for Employee Tracker
+Launches each desktop entry point repeatedly against a local stub API and reports startup milestones
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Entry point -> (source script, milestone that means "ready to use")
+ENTRY_POINTS = {
+    'main': ('src/main.py', 'first_paint'),
+    'tray_app': ('src/tray_app.py', 'icon'),
+    'background_service': ('src/background_service.py', 'icon'),
+}
+
+# Reported milestones, in the order they happen; 'ready' is the entry point's ready milestone
+MILESTONES = ('interpreter', 'imports', 'first_api', 'ready')
+PERCENTILES = (50, 90, 95)
+
+# Resource usage recorded with the ready milestone
+FOOTPRINT = ('rss_mb', 'threads')
+
+RUN_TIMEOUT_SECONDS = 60
+
+
+class StubApiHandler(BaseHTTPRequestHandler):
+    """Answers the attendance endpoints with a fixed checked-in day"""
+
+    def do_GET(self):
+        if self.path.endswith('/attendance/today'):
+            # Like the Laravel app, dates and times are in the server's timezone, UTC here
+            now = datetime.now(timezone.utc)
+            self.send_json({'success': True, 'date': now.strftime('%Y-%m-%d'), 'timezone': 'UTC', 'data': {
+                'date': now.strftime('%Y-%m-%d'), 'check_in': '09:00:00', 'check_out': None,
+                'break_start': None, 'break_end': None,
+                'total_break_minutes': 0, 'total_work_minutes': 0, 'status': 'present',
+            }})
+        elif self.path.endswith('/user'):
+            self.send_json({'id': 1, 'name': 'Benchmark User'})
+        else:
+            self.send_json({'success': False, 'message': 'Not found'}, 404)
+
+    def do_POST(self):
+        self.send_json({'success': True, 'data': None})
+
+    def send_json(self, body, status=200):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def date_time_string(self, timestamp=None):
+        return formatdate(timestamp, usegmt=True)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_api():
+    """Start the stub API on a free localhost port; returns (server, base url)"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubApiHandler)
+    threading.Thread(target=server.serve_forever, name="stub-api", daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/api"
+
+
+def percentile(values, percent):
+    """Get a percentile with linear interpolation between the closest ranks"""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * percent / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def run_once(command, ready_milestone, env):
+    """Launch one process and return milestone times in ms since launch, or raise on failure"""
+    fd, trace_path = tempfile.mkstemp(prefix='startup-', suffix='.jsonl')
+    os.close(fd)
+    env = dict(env, EMPLOYEE_TRACKER_STARTUP_TRACE=trace_path, EMPLOYEE_TRACKER_STARTUP_EXIT='1')
+    try:
+        launched = time.time()
+        process = subprocess.Popen(command, cwd=ROOT_DIR, env=env,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        try:
+            _, stderr = process.communicate(timeout=RUN_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            _, stderr = process.communicate()
+
+        with open(trace_path) as f:
+            entries = {entry['milestone']: entry for entry in map(json.loads, f)}
+    finally:
+        os.remove(trace_path)
+
+    if ready_milestone not in entries:
+        error = stderr.decode(errors='replace').strip().splitlines()
+        raise RuntimeError(error[-1] if error else f"exited with {process.returncode} before it was ready")
+
+    entries['ready'] = entries[ready_milestone]
+    sample = {milestone: round((entries[milestone]['time'] - launched) * 1000, 1)
+              for milestone in MILESTONES if milestone in entries}
+    # Footprint once ready
+    for key in FOOTPRINT:
+        if entries['ready'].get(key) is not None:
+            sample[key] = entries['ready'][key]
+    return sample
+
+
+def benchmark(name, command, runs, warmup, env):
+    """Run an entry point several times and summarize each milestone"""
+    ready_milestone = ENTRY_POINTS[name][1]
+    samples = []
+    failures = []
+    for index in range(warmup + runs):
+        try:
+            sample = run_once(command, ready_milestone, env)
+        except Exception as e:
+            failures.append(str(e))
+            print(f"   ❌ run {index + 1}: {e}")
+            continue
+        if index >= warmup:
+            samples.append(sample)
+            print(f"   run {index - warmup + 1}: ready in {sample['ready']:.0f} ms")
+
+    summary = {}
+    for milestone in MILESTONES:
+        values = [sample[milestone] for sample in samples if milestone in sample]
+        if values:
+            summary[milestone] = {f"p{p}": round(percentile(values, p), 1) for p in PERCENTILES}
+            summary[milestone]['max'] = max(values)
+    footprint = {}
+    for key in FOOTPRINT:
+        values = [sample[key] for sample in samples if key in sample]
+        if values:
+            footprint[key] = max(values)
+    return {'command': command, 'samples': samples, 'failures': failures, 'percentiles': summary,
+            'footprint': footprint}
+
+
+def git_commit():
+    """Get the current commit, or None outside a git checkout"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def print_summary(results):
+    """Print a percentile table per entry point"""
+    header = f"{'milestone':<12}" + ''.join(f"{f'p{p}':>10}" for p in PERCENTILES) + f"{'max':>10}"
+    for name, result in results['targets'].items():
+        print(f"\n📊 {name} ({len(result['samples'])} runs, {len(result['failures'])} failed)")
+        print(header)
+        for milestone, stats in result['percentiles'].items():
+            print(f"{milestone:<12}" + ''.join(f"{stats[f'p{p}']:>10.1f}" for p in PERCENTILES) + f"{stats['max']:>10.1f}")
+        footprint = result.get('footprint', {})
+        if footprint:
+            print(f"ready with {footprint.get('rss_mb', '?')} MB resident, {footprint.get('threads', '?')} threads")
+
+
+def print_comparison(results, baseline):
+    """Print the p50 change of every milestone against an earlier results file"""
+    print(f"\n📈 Compared with {baseline.get('label')} @ {baseline.get('commit')} (p50, ms)")
+    for name, result in results['targets'].items():
+        before = baseline.get('targets', {}).get(name)
+        if not before:
+            continue
+        for milestone, stats in result['percentiles'].items():
+            old = before['percentiles'].get(milestone)
+            if old:
+                delta = stats['p50'] - old['p50']
+                print(f"   {name:<20} {milestone:<12} {old['p50']:>8.1f} -> {stats['p50']:>8.1f} ({delta:+.1f})")
+
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description="Measure cold start of the Employee Tracker entry points")
+    parser.add_argument('--targets', nargs='+', choices=sorted(ENTRY_POINTS), default=list(ENTRY_POINTS),
+                        help="entry points to launch")
+    parser.add_argument('--exe', action='append', default=[], metavar='NAME=PATH',
+                        help="launch a built executable instead of the source script, e.g. tray_app=dist/EmployeeTrackerTray")
+    parser.add_argument('--runs', type=int, default=10, help="measured runs per entry point")
+    parser.add_argument('--warmup', type=int, default=1, help="unmeasured runs before measuring")
+    parser.add_argument('--label', default='source', help="name of this build mode in the results")
+    parser.add_argument('--output', default='startup_benchmark.json', help="where to save the JSON results")
+    parser.add_argument('--compare', metavar='RESULTS.json', help="earlier results to compare against")
+    args = parser.parse_args()
+
+    commands = {name: [sys.executable, os.path.join(ROOT_DIR, script)]
+                for name, (script, _) in ENTRY_POINTS.items()}
+    for item in args.exe:
+        name, _, path = item.partition('=')
+        if name not in ENTRY_POINTS or not path:
+            parser.error(f"--exe expects NAME=PATH with NAME one of {', '.join(ENTRY_POINTS)}")
+        commands[name] = [os.path.abspath(path)]
+
+    print("🚀 Employee Tracker Cold-Start Benchmark")
+    print("=" * 60)
+
+    server, base_url = start_stub_api()
+    config_dir = tempfile.mkdtemp(prefix='tracker-benchmark-')
+    env = dict(os.environ,
+               API_BASE_URL=base_url,
+               API_TOKEN='benchmark-token',
+               EMPLOYEE_TRACKER_CONFIG=os.path.join(config_dir, 'config.env'))
+
+    results = {
+        'label': args.label,
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'runs': args.runs,
+        'targets': {},
+    }
+    try:
+        for name in args.targets:
+            print(f"\n📋 {name}: {' '.join(commands[name])}")
+            results['targets'][name] = benchmark(name, commands[name], args.runs, args.warmup, env)
+    finally:
+        server.shutdown()
+
+    print_summary(results)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\n💾 Results saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(results, json.load(f))
+
+    if any(result['failures'] and not result['samples'] for result in results['targets'].values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
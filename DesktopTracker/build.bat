@@ -13,11 +13,11 @@ if errorlevel 1 (
 
 REM Install requirements
 echo Installing requirements...
-pip install -r requirements.txt
+pip install -r requirements-build.txt
 
 REM Run build script
 echo Running build script...
-python build_exe.py
+python build_exe.py %*
 
 echo.
 echo Build completed! Check the dist/ folder for executables.
@@ -15,11 +15,11 @@ try {
 
 # Install requirements
 Write-Host "Installing requirements..." -ForegroundColor Yellow
-pip install -r requirements.txt
+pip install -r requirements-build.txt
 
 # Run build script
 Write-Host "Running build script..." -ForegroundColor Yellow
-python build_exe.py
+python build_exe.py @args
 
 Write-Host ""
 Write-Host "Build completed! Check the dist/ folder for executables." -ForegroundColor Green
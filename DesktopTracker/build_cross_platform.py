@@ -9,7 +9,29 @@ import sys
 import subprocess
 import shutil
 import platform
+import ast
+import hashlib
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+import build_dependencies
+
+# Spec file that builds all three launchers over one shared runtime, and its output folder
+SHARED_SPEC = 'EmployeeTracker.spec'
+SHARED_BUNDLE = 'EmployeeTracker'
+TARGET_NAMES = ['EmployeeTrackerGUI', 'EmployeeTrackerService', 'EmployeeTrackerTray']
+
+# Build commands for each application; what each one bundles is in build_dependencies.py
+APPS = [{'name': name, 'script': target['script']} for name, target in build_dependencies.TARGETS.items()]
+
+# Each target builds in build/<name>/; the manifest holds the input hash of its last successful build
+SRC_DIR = 'src'
+BUILD_DIR = 'build'
+MANIFEST_FILE = os.path.join(BUILD_DIR, 'build_manifest.json')
+
+# The runtime packages, and PyInstaller with its hooks, both change what ends up in a build
+REQUIREMENTS_FILES = ['requirements.txt', 'requirements-build.txt']
 
 def get_platform_info():
     """Get platform information"""
@@ -55,8 +77,182 @@ def get_pyinstaller_path():
         
         return 'pyinstaller'  # Fallback
 
-def build_for_platform(target_platform):
-    """Build executables for a specific platform"""
+def local_sources(scripts):
+    """Get the entry scripts plus every module under src/ they import, directly or not"""
+    seen = set()
+    pending = [os.path.normpath(script) for script in scripts]
+    while pending:
+        path = pending.pop()
+        if path in seen or not os.path.exists(path):
+            continue
+        seen.add(path)
+        package = os.path.relpath(os.path.dirname(path), SRC_DIR)
+        package_parts = [] if package == '.' else package.split(os.sep)
+
+        with open(path, 'rb') as f:
+            tree = ast.parse(f.read(), path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                # Relative imports are resolved against the importing module's package
+                base = package_parts[:len(package_parts) - node.level + 1] if node.level else []
+                module = '.'.join(base + ([node.module] if node.module else []))
+                modules = [module] + [f"{module}.{alias.name}" if module else alias.name for alias in node.names]
+            else:
+                continue
+            for module in modules:
+                parts = module.split('.')
+                for depth in range(1, len(parts) + 1):
+                    module_path = os.path.join(SRC_DIR, *parts[:depth])
+                    pending += [candidate for candidate in (module_path + '.py', os.path.join(module_path, '__init__.py'))
+                                if os.path.exists(candidate)]
+    return sorted(seen)
+
+def build_hash(target):
+    """Hash everything that goes into a target: its sources, the requirements, the PyInstaller options and the data files"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([target['cmd'], target['env']]).encode())
+    for path in local_sources(target['scripts']) + target['inputs']:
+        digest.update(path.encode())
+        digest.update(str(file_hash(path)).encode())
+    return digest.hexdigest()
+
+def file_hash(path):
+    """Get the content hash of one file, or None when it does not exist"""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+def load_manifest():
+    """Load the hashes of the last successful build of each target"""
+    try:
+        with open(MANIFEST_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'requirements': None, 'targets': {}}
+
+def save_manifest(manifest):
+    """Save the build manifest"""
+    os.makedirs(os.path.dirname(MANIFEST_FILE), exist_ok=True)
+    with open(MANIFEST_FILE, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+def run_build(target):
+    """Run PyInstaller for one target in its own work folder (runs in a worker process)"""
+    os.makedirs(target['workpath'], exist_ok=True)
+    log_path = os.path.join(target['workpath'], 'build.log')
+    started = time.perf_counter()
+    with open(log_path, 'w') as log:
+        returncode = subprocess.call(target['cmd'], stdout=log, stderr=subprocess.STDOUT,
+                                     env=dict(os.environ, **target['env']))
+    return returncode, time.perf_counter() - started, log_path
+
+def pyinstaller_cache_dir():
+    """Get the folder PyInstaller caches analysed binaries in, worked out the way PyInstaller does"""
+    if os.getenv('PYINSTALLER_CONFIG_DIR'):
+        cache_dir = os.getenv('PYINSTALLER_CONFIG_DIR')
+    elif platform.system() == 'Windows':
+        cache_dir = os.getenv('LOCALAPPDATA') or os.path.expanduser('~\\Application Data')
+    elif platform.system() == 'Darwin':
+        cache_dir = os.path.expanduser('~/Library/Application Support')
+    else:
+        cache_dir = os.getenv('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_dir, 'pyinstaller')
+
+def clean_build_cache(targets):
+    """Do what --clean does once, before the parallel builds start: empty PyInstaller's cache and the work folders"""
+    for path in [pyinstaller_cache_dir()] + [target['workpath'] for target in targets]:
+        shutil.rmtree(path, ignore_errors=True)
+
+def publish_outputs(target):
+    """Move a target's freshly built files from its isolated dist folder into dist/"""
+    os.makedirs("dist", exist_ok=True)
+    outputs = []
+    for entry in sorted(os.listdir(target['distpath'])):
+        destination = os.path.join("dist", entry)
+        if os.path.isdir(destination) and not os.path.islink(destination):
+            shutil.rmtree(destination)
+        elif os.path.lexists(destination):
+            os.remove(destination)
+        shutil.move(os.path.join(target['distpath'], entry), destination)
+        outputs.append(destination)
+    return outputs
+
+def build_targets(target_platform, pyinstaller_path, icon_file, data_sep, shared):
+    """Get the PyInstaller runs for this build; each one writes to its own work and dist folders"""
+    icon_path = os.path.abspath(icon_file)
+    inputs = REQUIREMENTS_FILES + ['build_dependencies.py', 'build_icons.py', 'config.env.example', icon_file]
+
+    if shared:
+        # One analysis for all entry points; the launchers share one runtime folder
+        build_dir = os.path.join(BUILD_DIR, SHARED_BUNDLE)
+        cmd = [pyinstaller_path, '--noconfirm',
+               f"--distpath={os.path.join(build_dir, 'dist')}",
+               f"--workpath={os.path.join(build_dir, 'work')}",
+               SHARED_SPEC]
+        return [{
+            'name': SHARED_BUNDLE,
+            'scripts': [app['script'] for app in APPS],
+            'cmd': cmd,
+            'env': {'EMPLOYEE_TRACKER_BUILD_ICON': icon_path},
+            'inputs': inputs + [SHARED_SPEC],
+            'workpath': os.path.join(build_dir, 'work'),
+            'distpath': os.path.join(build_dir, 'dist'),
+        }]
+
+    targets = []
+    for app in APPS:
+        build_dir = os.path.join(BUILD_DIR, app['name'])
+        cmd = [
+            pyinstaller_path,
+            '--noconfirm',
+            '--onefile',
+            '--windowed',
+            f"--name={app['name']}",
+            f"--icon={icon_path}",
+            f"--distpath={os.path.join(build_dir, 'dist')}",
+            f"--workpath={os.path.join(build_dir, 'work')}",
+            f"--specpath={build_dir}",
+        ]
+
+        # Add data files, hidden imports and the modules this app never uses
+        for source, bundle_path in build_dependencies.data_files([app['name']]):
+            cmd.append(f"--add-data={os.path.abspath(source)}{data_sep}{bundle_path}")
+        for imp in build_dependencies.hidden_imports([app['name']], target_platform):
+            cmd.append(f"--hidden-import={imp}")
+        for module in build_dependencies.excludes([app['name']]):
+            cmd.append(f"--exclude-module={module}")
+
+        cmd.append(os.path.abspath(app['script']))
+        targets.append({
+            'name': app['name'],
+            'scripts': [app['script']],
+            'cmd': cmd,
+            'env': {},
+            'inputs': inputs,
+            'workpath': os.path.join(build_dir, 'work'),
+            'distpath': os.path.join(build_dir, 'dist'),
+        })
+    return targets
+
+def print_timings(timings, wall_seconds):
+    """Print how long each target took to hash, build and publish"""
+    print("\n⏱️  Build timing")
+    print(f"{'target':<26}{'result':<12}{'hash (s)':>10}{'build (s)':>11}{'copy (s)':>10}")
+    for name, timing in timings.items():
+        print(f"{name:<26}{timing['result']:<12}{timing['hash']:>10.2f}{timing['build']:>11.1f}{timing['copy']:>10.2f}")
+    total = sum(timing['hash'] + timing['build'] + timing['copy'] for timing in timings.values())
+    print(f"   Wall time {wall_seconds:.1f} s for {total:.1f} s of work")
+
+def build_for_platform(target_platform, shared=False, force=False):
+    """Build executables for a specific platform, optionally as one shared bundle
+
+    Targets are built in parallel, each in its own work and dist folders, and targets
+    whose inputs have not changed since their last successful build are skipped.
+    """
     print(f"\n🔨 Building for {target_platform.title()}...")
     
     # Set environment variables for cross-compilation
@@ -73,79 +269,71 @@ def build_for_platform(target_platform):
     if target_platform == 'windows':
         icon_file = "icon.ico"
         data_sep = ";"
-        ext = ".exe"
     else:  # macOS
-        icon_file = "icon.png"
+        icon_file = "icon.icns"
         data_sep = ":"
-        ext = ".app"
-    
-    # Build commands for each application
-    apps = [
-        {
-            'name': 'EmployeeTrackerGUI',
-            'script': 'src/main.py',
-            'hidden_imports': ['pystray', 'PIL', 'requests', 'dotenv']
-        },
-        {
-            'name': 'EmployeeTrackerService',
-            'script': 'src/background_service.py',
-            'hidden_imports': ['pystray', 'PIL', 'requests', 'dotenv', 'tkinter']
-        },
-        {
-            'name': 'EmployeeTrackerTray',
-            'script': 'src/tray_app.py',
-            'hidden_imports': ['pystray', 'PIL', 'requests', 'dotenv', 'tkinter']
-        }
-    ]
-    
-    success_count = 0
-    
-    for app in apps:
-        print(f"\n📱 Building {app['name']}...")
-        
-        cmd = [
-            pyinstaller_path,
-            '--clean',
-            '--onefile',
-            '--windowed',
-            f"--name={app['name']}",
-            f"--icon={icon_file}",
-            f"--add-data=config.env.example{data_sep}.",
-        ]
-        
-        # Add hidden imports
-        for imp in app['hidden_imports']:
-            cmd.append(f"--hidden-import={imp}")
-        
-        cmd.append(app['script'])
-        
-        try:
-            subprocess.check_call(cmd)
-            print(f"✅ {app['name']}{ext} created successfully")
-            success_count += 1
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to build {app['name']}: {e}")
+    
+    started = time.perf_counter()
+    manifest = load_manifest()
+    requirements = [file_hash(path) for path in REQUIREMENTS_FILES]
+    targets = build_targets(target_platform, pyinstaller_path, icon_file, data_sep, shared)
+    
+    timings = {}
+    pending = []
+    for target in targets:
+        hash_started = time.perf_counter()
+        target['hash'] = build_hash(target)
+        timings[target['name']] = {'result': 'up to date', 'hash': time.perf_counter() - hash_started,
+                                   'build': 0.0, 'copy': 0.0}
+        previous = manifest['targets'].get(target['name'], {})
+        outputs_present = previous.get('outputs') and all(os.path.exists(path) for path in previous['outputs'])
+        if force or previous.get('hash') != target['hash'] or not outputs_present:
+            pending.append(target)
+        else:
+            print(f"✅ {target['name']} is up to date")
+    
+    success_count = len(targets) - len(pending)
+    if pending:
+        # New requirements can change what PyInstaller collects, so its analysis cache is dropped.
+        # The workers share that cache, so it is cleaned here rather than with --clean in each build.
+        if force or requirements != manifest['requirements']:
+            print("🧹 Cleaning the PyInstaller cache...")
+            clean_build_cache(pending)
+        print(f"\n📱 Building {', '.join(target['name'] for target in pending)}...")
+        with ProcessPoolExecutor(max_workers=len(pending)) as pool:
+            futures = {pool.submit(run_build, target): target for target in pending}
+            for future in as_completed(futures):
+                target = futures[future]
+                timing = timings[target['name']]
+                returncode, timing['build'], log_path = future.result()
+                if returncode != 0:
+                    timing['result'] = 'failed'
+                    print(f"❌ Failed to build {target['name']} (exit code {returncode}), see {log_path}")
+                    continue
+                copy_started = time.perf_counter()
+                outputs = publish_outputs(target)
+                timing['copy'] = time.perf_counter() - copy_started
+                timing['result'] = 'built'
+                manifest['targets'][target['name']] = {'hash': target['hash'], 'outputs': outputs}
+                print(f"✅ {', '.join(outputs)} created successfully")
+                build_dependencies.report_sizes(target['name'], os.path.join(target['workpath'], target['name'], 'Analysis-00.toc'))
+                success_count += 1
+    
+    if not any(timing['result'] == 'failed' for timing in timings.values()):
+        manifest['requirements'] = requirements
+    save_manifest(manifest)
+    print_timings(timings, time.perf_counter() - started)
     
     return success_count > 0
 
 def create_icons():
-    """Create icons for both platforms"""
+    """Create icons for both platforms, plus the tray icon frames bundled with the tray apps"""
     try:
-        from PIL import Image, ImageDraw
-        
-        # Create a simple icon
-        image = Image.new('RGB', (64, 64), color='blue')
-        draw = ImageDraw.Draw(image)
-        draw.ellipse((16, 16, 48, 48), fill='white')
-        draw.text((20, 20), "ET", fill='blue')
+        import build_icons
         
-        # Save as ICO for Windows
-        image.save('icon.ico', format='ICO')
-        print("✅ Windows icon created: icon.ico")
-        
-        # Save as PNG for macOS
-        image.save('icon.png', format='PNG')
-        print("✅ macOS icon created: icon.png")
+        # icon.ico for Windows, icon.icns for macOS
+        build_icons.create_app_icons()
+        build_icons.render_tray_assets()
         
         return True
     except Exception as e:
@@ -169,7 +357,14 @@ REM Copy executables
 copy "dist\\EmployeeTrackerGUI.exe" "%PROGRAMFILES%\\EmployeeTracker\\"
 copy "dist\\EmployeeTrackerService.exe" "%PROGRAMFILES%\\EmployeeTracker\\"
 copy "dist\\EmployeeTrackerTray.exe" "%PROGRAMFILES%\\EmployeeTracker\\"
-copy "config.env.example" "%PROGRAMFILES%\\EmployeeTracker\\config.env"
+
+REM Settings live in the per-user config directory; an existing file keeps its token
+if not exist "%APPDATA%\\EmployeeTracker" (
+    mkdir "%APPDATA%\\EmployeeTracker"
+)
+if not exist "%APPDATA%\\EmployeeTracker\\config.env" (
+    copy "config.env.example" "%APPDATA%\\EmployeeTracker\\config.env"
+)
 
 REM Create desktop shortcuts
 powershell -Command "$WshShell = New-Object -comObject WScript.Shell; $Shortcut = $WshShell.CreateShortcut('%USERPROFILE%\\Desktop\\Employee Tracker GUI.lnk'); $Shortcut.TargetPath = '%PROGRAMFILES%\\EmployeeTracker\\EmployeeTrackerGUI.exe'; $Shortcut.Save()"
@@ -191,7 +386,7 @@ echo 🎯 Desktop shortcuts created
 echo 🚀 Service added to startup
 echo.
 echo 📝 Next steps:
-echo    1. Configure API token in config.env
+echo    1. Configure API token in %APPDATA%\\EmployeeTracker\\config.env
 echo    2. Start the application from desktop shortcuts
 echo.
 pause
@@ -215,7 +410,14 @@ sudo mkdir -p "$APP_DIR"
 sudo cp -r "dist/EmployeeTrackerGUI.app" "$APP_DIR/"
 sudo cp -r "dist/EmployeeTrackerService.app" "$APP_DIR/"
 sudo cp -r "dist/EmployeeTrackerTray.app" "$APP_DIR/"
-sudo cp "config.env.example" "$APP_DIR/config.env"
+
+# Settings live in the per-user config directory; an existing file keeps its token
+CONFIG_DIR="$HOME/Library/Application Support/EmployeeTracker"
+mkdir -p "$CONFIG_DIR"
+if [ ! -f "$CONFIG_DIR/config.env" ]; then
+    cp "config.env.example" "$CONFIG_DIR/config.env"
+    chmod 600 "$CONFIG_DIR/config.env"
+fi
 
 # Create desktop shortcuts (macOS)
 ln -sf "$APP_DIR/EmployeeTrackerGUI.app" "$HOME/Desktop/Employee Tracker GUI.app"
@@ -256,7 +458,7 @@ echo "🎯 Desktop shortcuts created"
 echo "🚀 Service added to startup"
 echo ""
 echo "📝 Next steps:"
-echo "   1. Configure API token in $APP_DIR/config.env"
+echo "   1. Configure API token in $CONFIG_DIR/config.env"
 echo "   2. Start the application from desktop shortcuts"
 echo ""
 '''
@@ -281,12 +483,19 @@ def create_portable_packages():
     for exe in ["EmployeeTrackerGUI.exe", "EmployeeTrackerService.exe", "EmployeeTrackerTray.exe"]:
         if os.path.exists(f"dist/{exe}"):
             shutil.copy2(f"dist/{exe}", windows_dir)
+    windows_shared = os.path.isdir(f"dist/{SHARED_BUNDLE}") and not os.path.exists(f"dist/{SHARED_BUNDLE}.app")
+    if windows_shared:
+        shutil.copytree(f"dist/{SHARED_BUNDLE}", os.path.join(windows_dir, SHARED_BUNDLE))
     
-    # Copy config file
-    shutil.copy2("config.env.example", os.path.join(windows_dir, "config.env"))
+    # Copy the config template; the launcher puts it in the user's config directory
+    shutil.copy2("config.env.example", windows_dir)
     
     # Create Windows launcher
     windows_launcher = '''@echo off
+if not exist "%APPDATA%\\EmployeeTracker\\config.env" (
+    if not exist "%APPDATA%\\EmployeeTracker" mkdir "%APPDATA%\\EmployeeTracker"
+    copy "config.env.example" "%APPDATA%\\EmployeeTracker\\config.env" >nul
+)
 echo Employee Tracker Portable (Windows)
 echo ===================================
 echo.
@@ -305,6 +514,10 @@ if "%choice%"=="4" exit
 
 pause
 '''
+    if windows_shared:
+        # Shared launchers live in the bundle folder
+        for name in TARGET_NAMES:
+            windows_launcher = windows_launcher.replace(f"start {name}.exe", f'start "" "{SHARED_BUNDLE}\\{name}.exe"')
     
     with open(os.path.join(windows_dir, "launcher.bat"), 'w') as f:
         f.write(windows_launcher)
@@ -321,13 +534,23 @@ pause
     for app in ["EmployeeTrackerGUI.app", "EmployeeTrackerService.app", "EmployeeTrackerTray.app"]:
         if os.path.exists(f"dist/{app}"):
             shutil.copytree(f"dist/{app}", os.path.join(macos_dir, app))
+    macos_shared = os.path.exists(f"dist/{SHARED_BUNDLE}.app")
+    if macos_shared:
+        shutil.copytree(f"dist/{SHARED_BUNDLE}.app", os.path.join(macos_dir, f"{SHARED_BUNDLE}.app"))
     
-    # Copy config file
-    shutil.copy2("config.env.example", os.path.join(macos_dir, "config.env"))
+    # Copy the config template; the launcher puts it in the user's config directory
+    shutil.copy2("config.env.example", macos_dir)
     
     # Create macOS launcher
     macos_launcher = '''#!/bin/bash
 
+CONFIG_DIR="$HOME/Library/Application Support/EmployeeTracker"
+if [ ! -f "$CONFIG_DIR/config.env" ]; then
+    mkdir -p "$CONFIG_DIR"
+    cp "config.env.example" "$CONFIG_DIR/config.env"
+    chmod 600 "$CONFIG_DIR/config.env"
+fi
+
 echo "Employee Tracker Portable (macOS)"
 echo "================================="
 echo ""
@@ -361,6 +584,10 @@ case $choice in
         ;;
 esac
 '''
+    if macos_shared:
+        # The launchers share one .app, so they are started directly
+        for name in TARGET_NAMES:
+            macos_launcher = macos_launcher.replace(f"open {name}.app", f'"./{SHARED_BUNDLE}.app/Contents/MacOS/{name}" &')
     
     with open(os.path.join(macos_dir, "launcher.sh"), 'w') as f:
         f.write(macos_launcher)
@@ -376,19 +603,22 @@ def main():
     print("=" * 50)
     
     current_platform = get_platform_info()
+    # --force rebuilds every target even when its inputs are unchanged
+    force = '--force' in sys.argv[1:]
     
-    print(f"\n📋 Build Options:")
+    print("\n📋 Build Options:")
     print(f"1. Build for current platform ({current_platform['system'].title()})")
-    print(f"2. Build for Windows (requires Windows machine)")
-    print(f"3. Build for macOS (requires macOS machine)")
-    print(f"4. Create installer scripts only")
-    print(f"5. Exit")
+    print("2. Build for Windows (requires Windows machine)")
+    print("3. Build for macOS (requires macOS machine)")
+    print("4. Create installer scripts only")
+    print("5. Build for current platform as one shared bundle (smaller, faster to build)")
+    print("6. Exit")
     
-    choice = input("\nEnter your choice (1-5): ").strip()
+    choice = input("\nEnter your choice (1-6): ").strip()
     
     if choice == "1":
         # Build for current platform
-        if build_for_platform(current_platform['system']):
+        if build_for_platform(current_platform['system'], force=force):
             create_installer_scripts()
             create_portable_packages()
             print(f"\n✅ Build completed for {current_platform['system'].title()}!")
@@ -398,7 +628,7 @@ def main():
     elif choice == "2":
         # Build for Windows
         if current_platform['system'] == 'windows':
-            if build_for_platform('windows'):
+            if build_for_platform('windows', force=force):
                 create_installer_scripts()
                 create_portable_packages()
                 print("\n✅ Windows build completed!")
@@ -411,7 +641,7 @@ def main():
     elif choice == "3":
         # Build for macOS
         if current_platform['system'] == 'darwin':
-            if build_for_platform('darwin'):
+            if build_for_platform('darwin', force=force):
                 create_installer_scripts()
                 create_portable_packages()
                 print("\n✅ macOS build completed!")
@@ -428,6 +658,14 @@ def main():
         print("\n✅ Installer scripts created!")
     
     elif choice == "5":
+        # Build the shared bundle for current platform; the installer scripts expect single files
+        if build_for_platform(current_platform['system'], shared=True, force=force):
+            create_portable_packages()
+            print(f"\n✅ Shared bundle build completed for {current_platform['system'].title()}!")
+        else:
+            print(f"\n❌ Shared bundle build failed for {current_platform['system'].title()}")
+    
+    elif choice == "6":
         print("\n👋 Goodbye!")
         return
     
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Dependency manifests for the Employee Tracker executables
+What each executable bundles, and a size breakdown by module after each build to catch size regressions
+"""
+
+import ast
+import json
+import os
+import pkgutil
+
+# Executable name -> entry point script and whether it shows a tray icon.
+# PyInstaller finds every import in the sources on its own, including the lazy
+# ones, so a target only lists what it loads dynamically. Tkinter stays in the
+# tray targets because their settings window is a Tk window; it is imported
+# lazily, so it costs disk space but no startup time.
+TARGETS = {
+    'EmployeeTrackerGUI': {'script': 'src/main.py', 'tray': False},
+    'EmployeeTrackerService': {'script': 'src/background_service.py', 'tray': True},
+    'EmployeeTrackerTray': {'script': 'src/tray_app.py', 'tray': True},
+}
+
+# pystray picks its backend at runtime, so PyInstaller cannot see which one is used
+PYSTRAY_BACKENDS = {
+    'windows': ['pystray._win32'],
+    'darwin': ['pystray._darwin'],
+    'linux': ['pystray._appindicator', 'pystray._gtk', 'pystray._xorg'],
+}
+
+# Image formats the tray icons go through: pystray hands them to the OS as PNG or ICO (ICO embeds BMP)
+PIL_PLUGINS = ['PngImagePlugin', 'IcoImagePlugin', 'BmpImagePlugin']
+
+# Packages only needed to build or install, never at runtime
+BUILD_ONLY_PACKAGES = ['PyInstaller', 'pip', 'setuptools', 'pkg_resources', 'wheel']
+
+# Optional integrations the apps never load. python-dotenv's IPython extension
+# otherwise drags IPython, jedi, pygments and numpy into every executable when
+# IPython is installed on the build machine.
+UNUSED_INTEGRATIONS = ['dotenv.ipython', 'IPython']
+
+# The GUI has no tray icon, so it needs neither the tray library nor the imaging library
+TRAY_PACKAGES = ['pystray', 'PIL']
+
+# Prebuilt tray icon frames from build_icons.py (bundle path, source folder)
+TRAY_ICON_ASSETS = ('tracker_core/icons', 'src/tracker_core/icons')
+
+# Size growth of a module group or of the whole target that is reported as a regression
+SIZE_REGRESSION_MB = 0.5
+SIZE_REGRESSION_PERCENT = 5
+
+SIZES_FILE = 'build_sizes.json'
+
+# PyInstaller TOC entry types that end up in the executable
+COLLECTED_TYPES = ('PYMODULE', 'PYSOURCE', 'EXTENSION', 'BINARY', 'DATA')
+
+
+def unused_pil_plugins():
+    """Get the Pillow image plugins the tray icons never use"""
+    try:
+        import PIL
+    except ImportError:
+        return []
+    return sorted(f"PIL.{module.name}" for module in pkgutil.iter_modules(PIL.__path__)
+                  if module.name.endswith('ImagePlugin') and module.name not in PIL_PLUGINS)
+
+
+def hidden_imports(names, system):
+    """Get the modules PyInstaller has to be told about for these targets"""
+    if any(TARGETS[name]['tray'] for name in names):
+        return PYSTRAY_BACKENDS.get(system, PYSTRAY_BACKENDS['linux'])
+    return []
+
+
+def excludes(names):
+    """Get the modules to leave out of a bundle holding these targets"""
+    modules = BUILD_ONLY_PACKAGES + UNUSED_INTEGRATIONS
+    if any(TARGETS[name]['tray'] for name in names):
+        modules += unused_pil_plugins()
+    else:
+        modules += TRAY_PACKAGES
+    return modules
+
+
+def data_files(names):
+    """Get the (source, bundle folder) data files a bundle holding these targets ships"""
+    files = [('config.env.example', '.')]
+    if any(TARGETS[name]['tray'] for name in names):
+        bundle_path, source = TRAY_ICON_ASSETS
+        files.append((source, bundle_path))
+    return files
+
+
+def collected_entries(data):
+    """Yield every (name, path, type) entry in a loaded PyInstaller TOC structure"""
+    if isinstance(data, (list, tuple)):
+        if len(data) == 3 and all(isinstance(item, str) for item in data) and data[2] in COLLECTED_TYPES:
+            yield data
+            return
+        for item in data:
+            yield from collected_entries(item)
+    elif isinstance(data, dict):
+        for item in data.values():
+            yield from collected_entries(item)
+
+
+def module_group(name, typecode):
+    """Group a collected entry under its top-level package or folder"""
+    if typecode in ('PYMODULE', 'PYSOURCE'):
+        return name.split('.')[0]
+    # Extensions, libraries and data files are named by their path in the bundle
+    return name.replace('\\', '/').split('/')[0].split('.cpython')[0]
+
+
+def size_breakdown(analysis_toc):
+    """Get the size in bytes of everything an analysis collected, by top-level module; None when unreadable"""
+    try:
+        with open(analysis_toc, encoding='utf-8') as f:
+            data = ast.literal_eval(f.read())
+    except (OSError, ValueError, SyntaxError):
+        return None
+
+    groups = {}
+    seen = set()
+    for name, path, typecode in collected_entries(data):
+        if (name, typecode) in seen or not os.path.isfile(path):
+            continue
+        seen.add((name, typecode))
+        group = module_group(name, typecode)
+        groups[group] = groups.get(group, 0) + os.path.getsize(path)
+    return dict(sorted(groups.items(), key=lambda item: item[1], reverse=True))
+
+
+def size_regressions(breakdown, previous):
+    """Compare a breakdown with the previous build's; returns (group, previous MB, current MB) for each regression"""
+    regressions = []
+    for group, size in breakdown.items():
+        before = previous.get(group, 0)
+        if (size - before) / 1024 / 1024 >= SIZE_REGRESSION_MB:
+            regressions.append((group, before / 1024 / 1024, size / 1024 / 1024))
+
+    total, total_before = sum(breakdown.values()), sum(previous.values())
+    if total_before and (total - total_before) * 100 / total_before >= SIZE_REGRESSION_PERCENT:
+        regressions.append(('total', total_before / 1024 / 1024, total / 1024 / 1024))
+    return regressions
+
+
+def report_sizes(key, analysis_toc, top=12):
+    """Print a target's size breakdown and flag growth since its last build; returns the regressions"""
+    breakdown = size_breakdown(analysis_toc)
+    if breakdown is None:
+        print(f"⚠️  No size breakdown for {key}: {analysis_toc} could not be read")
+        return []
+
+    try:
+        with open(SIZES_FILE) as f:
+            history = json.load(f)
+    except (OSError, ValueError):
+        history = {}
+    previous = history.get(key)
+
+    print(f"\n📏 {key}: {sum(breakdown.values()) / 1024 / 1024:.1f} MB collected")
+    shown = list(breakdown.items())[:top]
+    for group, size in shown:
+        change = ""
+        if previous is not None:
+            delta = (size - previous.get(group, 0)) / 1024 / 1024
+            change = f"{delta:+.2f}" if abs(delta) >= 0.01 else ""
+        print(f"   {group:<28}{size / 1024 / 1024:>8.2f} MB {change}")
+    rest = sum(breakdown.values()) - sum(size for _, size in shown)
+    if rest:
+        print(f"   {'(everything else)':<28}{rest / 1024 / 1024:>8.2f} MB")
+
+    regressions = size_regressions(breakdown, previous) if previous is not None else []
+    for group, before, after in regressions:
+        print(f"   ⚠️  Size regression in {group}: {before:.2f} MB -> {after:.2f} MB")
+
+    history[key] = breakdown
+    with open(SIZES_FILE, 'w') as f:
+        json.dump(history, f, indent=2)
+    return regressions
@@ -10,7 +10,44 @@ import sys
 import subprocess
 import shutil
 import platform
+import argparse
+import json
+import tempfile
+import time
+from datetime import datetime
 from pathlib import Path
+import build_dependencies
+
+# Build profiles. PyInstaller 6.3 compiles bundled modules with the optimization
+# level of the interpreter it runs in, so optimized profiles run it under -OO.
+BUILD_PROFILES = {
+    # One self-extracting file; unpacks the whole bundle to a temp dir on every launch
+    'onefile': {'onefile': True, 'optimize': False, 'strip_payload': False, 'shared': False},
+    # A folder next to the executable; nothing to unpack at launch
+    'onedir': {'onefile': False, 'optimize': False, 'strip_payload': False, 'shared': False},
+    # Onedir with -OO bytecode (no docstrings or asserts) and no test/docs modules
+    'fast': {'onefile': False, 'optimize': True, 'strip_payload': True, 'shared': False},
+    # Like fast, but all three launchers are built from one analysis and share one runtime folder
+    'shared': {'onefile': False, 'optimize': True, 'strip_payload': True, 'shared': True},
+}
+DEFAULT_PROFILE = 'onefile'
+
+# Standard library test and documentation packages none of the apps import
+PAYLOAD_EXCLUDES = ['unittest', 'doctest', 'pydoc', 'pydoc_data', 'test', 'tkinter.test',
+                    'lib2to3', 'idlelib', 'turtledemo']
+
+# Executable name -> entry point name used by benchmark_startup.py
+TARGETS = {
+    'EmployeeTrackerGUI': 'main',
+    'EmployeeTrackerService': 'background_service',
+    'EmployeeTrackerTray': 'tray_app',
+}
+
+REPORT_FILE = 'build_report.json'
+
+# Spec file and output folder of the shared profile
+SHARED_SPEC = 'EmployeeTracker.spec'
+SHARED_BUNDLE = 'EmployeeTracker'
 
 def get_platform_info():
     """Get platform information"""
@@ -60,7 +97,8 @@ def install_pyinstaller():
     """Install PyInstaller if not already installed"""
     print("🔧 Installing PyInstaller...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+        # The pinned build requirements; build-only packages stay out of requirements.txt
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements-build.txt"])
         print("✅ PyInstaller installed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -68,133 +106,261 @@ def install_pyinstaller():
         return False
 
 def create_icon(platform_info):
-    """Create icon files for both platforms"""
+    """Render the application icons and the tray icon frames bundled with the tray executables"""
     try:
-        from PIL import Image, ImageDraw
-        
-        # Create a simple icon
-        image = Image.new('RGB', (64, 64), color='blue')
-        draw = ImageDraw.Draw(image)
-        draw.ellipse((16, 16, 48, 48), fill='white')
-        draw.text((20, 20), "ET", fill='blue')
-        
-        # Save as ICO for Windows
-        image.save('icon.ico', format='ICO')
-        print("✅ Icon created: icon.ico")
-        
-        # For macOS, create ICNS (optional - PyInstaller can convert ICO)
-        if platform_info['is_macos']:
-            try:
-                # Create multiple sizes for ICNS
-                sizes = [16, 32, 64, 128, 256, 512]
-                images = []
-                for size in sizes:
-                    resized = image.resize((size, size), Image.Resampling.LANCZOS)
-                    images.append(resized)
-                
-                # Save as PNG first, then convert to ICNS if possible
-                image.save('icon.png', format='PNG')
-                print("✅ Icon created: icon.png")
-            except Exception as e:
-                print(f"⚠️  Could not create PNG icon: {e}")
-        
+        import build_icons
+
+        build_icons.create_app_icons()
+        build_icons.render_tray_assets()
         return True
     except Exception as e:
         print(f"⚠️  Could not create icon: {e}")
         return False
 
-def build_gui_exe(platform_info, pyinstaller_path):
-    """Build the GUI version executable"""
-    print("\n🖥️ Building GUI version...")
-    
+def dist_dir(profile):
+    """Output folder of a build profile; the default profile keeps using dist/"""
+    return "dist" if profile == DEFAULT_PROFILE else os.path.join("dist", profile)
+
+def pyinstaller_args(platform_info, pyinstaller_path, profile, name):
+    """Get the PyInstaller command line for one executable in a build profile"""
+    options = BUILD_PROFILES[profile]
+    script = build_dependencies.TARGETS[name]['script']
+    if options['optimize']:
+        cmd = [sys.executable, "-OO", "-m", "PyInstaller"]
+    else:
+        cmd = [pyinstaller_path]
+
     # Choose icon file based on platform
-    icon_file = "icon.png" if platform_info['is_macos'] else "icon.ico"
-    
-    cmd = [
-        pyinstaller_path,
-        "--onefile",
+    icon_file = f"icon{platform_info['icon_ext']}"
+
+    cmd += [
+        "--noconfirm",
+        "--onefile" if options['onefile'] else "--onedir",
         "--windowed",
-        "--name=EmployeeTrackerGUI",
-        f"--icon={icon_file}",
-        f"--add-data=config.env.example{platform_info['data_separator']}.",
-        "--hidden-import=pystray",
-        "--hidden-import=PIL",
-        "--hidden-import=requests",
-        "--hidden-import=dotenv",
-        "src/main.py"
+        f"--name={name}",
+        f"--icon={os.path.abspath(icon_file)}",
+        f"--distpath={dist_dir(profile)}",
+        f"--workpath={os.path.join('build', profile)}",
+        f"--specpath={os.path.join('build', profile)}",
     ]
-    
+    cmd += [f"--add-data={os.path.abspath(source)}{platform_info['data_separator']}{bundle_path}"
+            for source, bundle_path in build_dependencies.data_files([name])]
+    cmd += [f"--hidden-import={module}" for module in build_dependencies.hidden_imports([name], platform_info['system'])]
+    cmd += [f"--exclude-module={module}" for module in build_dependencies.excludes([name])]
+    if options['strip_payload']:
+        cmd += [f"--exclude-module={module}" for module in PAYLOAD_EXCLUDES]
+    cmd.append(script)
+    return cmd
+
+def artifact_path(platform_info, name, profile):
+    """Get what a profile produced for one executable: an .app bundle, a file or a folder"""
+    if BUILD_PROFILES[profile]['shared']:
+        # Every launcher lives in the one shared bundle
+        bundle = f"{SHARED_BUNDLE}.app" if platform_info['is_macos'] else SHARED_BUNDLE
+        return os.path.join(dist_dir(profile), bundle)
+    if platform_info['is_macos']:
+        return os.path.join(dist_dir(profile), f"{name}.app")
+    if BUILD_PROFILES[profile]['onefile']:
+        return os.path.join(dist_dir(profile), f"{name}{platform_info['executable_ext'] if platform_info['is_windows'] else ''}")
+    return os.path.join(dist_dir(profile), name)
+
+def executable_path(platform_info, name, profile):
+    """Get the file to launch for one executable of a profile"""
+    artifact = artifact_path(platform_info, name, profile)
+    if platform_info['is_macos']:
+        return os.path.join(artifact, "Contents", "MacOS", name)
+    if BUILD_PROFILES[profile]['onefile']:
+        return artifact
+    return os.path.join(artifact, f"{name}.exe" if platform_info['is_windows'] else name)
+
+def shared_bundle_args(platform_info, pyinstaller_path, profile):
+    """Get the PyInstaller command line and environment for the shared bundle spec"""
+    options = BUILD_PROFILES[profile]
+    cmd = [sys.executable, "-OO", "-m", "PyInstaller"] if options['optimize'] else [pyinstaller_path]
+    cmd += [
+        "--noconfirm",
+        f"--distpath={dist_dir(profile)}",
+        f"--workpath={os.path.join('build', profile)}",
+        SHARED_SPEC,
+    ]
+    icon_file = f"icon{platform_info['icon_ext']}"
+    env = dict(os.environ, EMPLOYEE_TRACKER_BUILD_ICON=os.path.abspath(icon_file))
+    if options['strip_payload']:
+        env['EMPLOYEE_TRACKER_BUILD_EXCLUDES'] = ",".join(PAYLOAD_EXCLUDES)
+    return cmd, env
+
+def build_shared_bundle(platform_info, pyinstaller_path, profile):
+    """Build the GUI, background service and tray launchers over one shared runtime"""
+    print(f"\n🖥️ Building shared bundle ({profile})...")
+
+    cmd, env = shared_bundle_args(platform_info, pyinstaller_path, profile)
+
+    try:
+        subprocess.check_call(cmd, env=env)
+        print(f"✅ Shared bundle created: {artifact_path(platform_info, 'EmployeeTrackerGUI', profile)}")
+        report_build_sizes(SHARED_BUNDLE, profile)
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Failed to build shared bundle: {e}")
+        return False
+
+def report_build_sizes(name, profile):
+    """Print what a build collected by module and flag growth since the last build of the same profile"""
+    analysis_toc = os.path.join('build', profile, name, 'Analysis-00.toc')
+    build_dependencies.report_sizes(f"{name} ({profile})", analysis_toc)
+
+def build_gui_exe(platform_info, pyinstaller_path, profile=DEFAULT_PROFILE):
+    """Build the GUI version executable"""
+    print(f"\n🖥️ Building GUI version ({profile})...")
+
+    cmd = pyinstaller_args(platform_info, pyinstaller_path, profile, "EmployeeTrackerGUI")
+
     try:
         subprocess.check_call(cmd)
-        ext = platform_info['executable_ext']
-        print(f"✅ GUI executable created: dist/EmployeeTrackerGUI{ext}")
+        print(f"✅ GUI executable created: {artifact_path(platform_info, 'EmployeeTrackerGUI', profile)}")
+        report_build_sizes("EmployeeTrackerGUI", profile)
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Failed to build GUI executable: {e}")
         return False
 
-def build_background_exe(platform_info, pyinstaller_path):
+def build_background_exe(platform_info, pyinstaller_path, profile=DEFAULT_PROFILE):
     """Build the background service executable"""
-    print("\n🖥️ Building background service...")
-    
-    # Choose icon file based on platform
-    icon_file = "icon.png" if platform_info['is_macos'] else "icon.ico"
-    
-    cmd = [
-        pyinstaller_path,
-        "--onefile",
-        "--windowed",
-        "--name=EmployeeTrackerService",
-        f"--icon={icon_file}",
-        f"--add-data=config.env.example{platform_info['data_separator']}.",
-        "--hidden-import=pystray",
-        "--hidden-import=PIL",
-        "--hidden-import=requests",
-        "--hidden-import=dotenv",
-        "--hidden-import=tkinter",
-        "src/background_service.py"
-    ]
-    
+    print(f"\n🖥️ Building background service ({profile})...")
+
+    cmd = pyinstaller_args(platform_info, pyinstaller_path, profile, "EmployeeTrackerService")
+
     try:
         subprocess.check_call(cmd)
-        ext = platform_info['executable_ext']
-        print(f"✅ Background service executable created: dist/EmployeeTrackerService{ext}")
+        print(f"✅ Background service executable created: {artifact_path(platform_info, 'EmployeeTrackerService', profile)}")
+        report_build_sizes("EmployeeTrackerService", profile)
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Failed to build background service executable: {e}")
         return False
 
-def build_tray_exe(platform_info, pyinstaller_path):
+def build_tray_exe(platform_info, pyinstaller_path, profile=DEFAULT_PROFILE):
     """Build the tray application executable"""
-    print("\n🖥️ Building tray application...")
-    
-    # Choose icon file based on platform
-    icon_file = "icon.png" if platform_info['is_macos'] else "icon.ico"
-    
-    cmd = [
-        pyinstaller_path,
-        "--onefile",
-        "--windowed",
-        "--name=EmployeeTrackerTray",
-        f"--icon={icon_file}",
-        f"--add-data=config.env.example{platform_info['data_separator']}.",
-        "--hidden-import=pystray",
-        "--hidden-import=PIL",
-        "--hidden-import=requests",
-        "--hidden-import=dotenv",
-        "--hidden-import=tkinter",
-        "src/tray_app.py"
-    ]
-    
+    print(f"\n🖥️ Building tray application ({profile})...")
+
+    cmd = pyinstaller_args(platform_info, pyinstaller_path, profile, "EmployeeTrackerTray")
+
     try:
         subprocess.check_call(cmd)
-        ext = platform_info['executable_ext']
-        print(f"✅ Tray application executable created: dist/EmployeeTrackerTray{ext}")
+        print(f"✅ Tray application executable created: {artifact_path(platform_info, 'EmployeeTrackerTray', profile)}")
+        report_build_sizes("EmployeeTrackerTray", profile)
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Failed to build tray application executable: {e}")
         return False
 
+def disk_size(path):
+    """Get the size in bytes of a file or of everything in a folder"""
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for folder, _, files in os.walk(path):
+        for file_name in files:
+            file_path = os.path.join(folder, file_name)
+            if not os.path.islink(file_path):
+                total += os.path.getsize(file_path)
+    return total
+
+def create_build_report(platform_info, profiles, runs, build_seconds):
+    """Measure build time, disk size and launch time of every built profile and target"""
+    print("\n📊 Measuring build profiles...")
+    from benchmark_startup import ENTRY_POINTS, percentile, run_once, start_stub_api
+
+    server, base_url = start_stub_api()
+    config_dir = tempfile.mkdtemp(prefix='tracker-build-report-')
+    env = dict(os.environ,
+               API_BASE_URL=base_url,
+               API_TOKEN='benchmark-token',
+               EMPLOYEE_TRACKER_CONFIG=os.path.join(config_dir, 'config.env'))
+
+    report = {
+        'platform': platform.platform(),
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'runs': runs,
+        'profiles': {},
+        'targets': {},
+    }
+    for profile in profiles:
+        # The shared profile's targets are one folder, so it is only counted once
+        artifacts = {artifact_path(platform_info, name, profile) for name in TARGETS}
+        report['profiles'][profile] = {
+            'build_seconds': round(build_seconds[profile], 1),
+            'size_mb': round(sum(disk_size(artifact) for artifact in artifacts if os.path.exists(artifact)) / 1024 / 1024, 1),
+        }
+    try:
+        for name, entry_point in TARGETS.items():
+            ready_milestone = ENTRY_POINTS[entry_point][1]
+            results = report['targets'][name] = {}
+            for profile in profiles:
+                artifact = artifact_path(platform_info, name, profile)
+                if not os.path.exists(artifact):
+                    continue
+                command = [os.path.abspath(executable_path(platform_info, name, profile))]
+                ready_times = []
+                errors = []
+                # One unmeasured launch first, so every profile starts with a warm disk cache
+                for index in range(runs + 1):
+                    try:
+                        sample = run_once(command, ready_milestone, env)
+                    except Exception as e:
+                        errors.append(str(e))
+                        continue
+                    if index:
+                        ready_times.append(sample['ready'])
+                results[profile] = {
+                    'size_mb': round(disk_size(artifact) / 1024 / 1024, 1),
+                    'ready_ms_p50': round(percentile(ready_times, 50), 1) if ready_times else None,
+                    'errors': errors[:3],
+                }
+    finally:
+        server.shutdown()
+        shutil.rmtree(config_dir, ignore_errors=True)
+
+    with open(REPORT_FILE, 'w') as f:
+        json.dump(report, f, indent=2)
+    print_build_report(report)
+    print(f"\n💾 Build report saved to {REPORT_FILE}")
+    return report
+
+def print_build_report(report):
+    """Print build totals per profile, size and launch time per target, and the fastest profile of each target"""
+    profiles = report.get('profiles', {})
+    if profiles:
+        print("\n🏗️  All targets")
+        print(f"{'profile':<10}{'build (s)':>12}{'size (MB)':>12}")
+        for profile, totals in profiles.items():
+            print(f"{profile:<10}{totals['build_seconds']:>12.1f}{totals['size_mb']:>12.1f}")
+        if 'shared' in profiles:
+            shared = profiles['shared']
+            for profile, totals in profiles.items():
+                if profile == 'shared':
+                    continue
+                print(f"   💡 shared vs {profile}: {totals['build_seconds'] - shared['build_seconds']:.1f} s less build time, "
+                      f"{totals['size_mb'] - shared['size_mb']:.1f} MB less on disk")
+
+    for name, results in report['targets'].items():
+        if not results:
+            continue
+        print(f"\n📦 {name}")
+        print(f"{'profile':<10}{'size (MB)':>12}{'ready p50 (ms)':>16}")
+        for profile, result in results.items():
+            ready = result['ready_ms_p50']
+            ready_text = f"{ready:.0f}" if ready is not None else "failed"
+            print(f"{profile:<10}{result['size_mb']:>12.1f}{ready_text:>16}")
+
+        launched = {profile: result for profile, result in results.items() if result['ready_ms_p50'] is not None}
+        if launched:
+            fastest = min(launched, key=lambda profile: launched[profile]['ready_ms_p50'])
+            print(f"   🏁 Fastest: {fastest}")
+        else:
+            errors = next(iter(results.values()))['errors'] or ["unknown error"]
+            print(f"   ⚠️  No profile could be launched: {errors[0]}")
+
 def create_installer_script(platform_info):
     """Create platform-specific installer scripts"""
     if platform_info['is_windows']:
@@ -312,9 +478,9 @@ echo ""
         os.chmod('install_macos.sh', 0o755)
         print("✅ macOS installer script created: install_macos.sh")
 
-def create_portable_package(platform_info):
+def create_portable_package(platform_info, profile=DEFAULT_PROFILE):
     """Create a platform-specific portable package with all executables"""
-    print("\n📦 Creating portable package...")
+    print(f"\n📦 Creating portable package ({profile})...")
     
     # Create portable directory
     portable_dir = f"EmployeeTracker_Portable_{platform_info['system'].title()}"
@@ -323,33 +489,13 @@ def create_portable_package(platform_info):
     
     os.makedirs(portable_dir)
     
-    # Copy executables based on platform
-    ext = platform_info['executable_ext']
-    
-    if platform_info['is_macos']:
-        # Copy .app bundles
-        if os.path.exists("dist/EmployeeTrackerGUI.app"):
-            shutil.copytree("dist/EmployeeTrackerGUI.app", 
-                          os.path.join(portable_dir, "EmployeeTrackerGUI.app"))
-        
-        if os.path.exists("dist/EmployeeTrackerService.app"):
-            shutil.copytree("dist/EmployeeTrackerService.app", 
-                          os.path.join(portable_dir, "EmployeeTrackerService.app"))
-        
-        if os.path.exists("dist/EmployeeTrackerTray.app"):
-            shutil.copytree("dist/EmployeeTrackerTray.app", 
-                          os.path.join(portable_dir, "EmployeeTrackerTray.app"))
-    else:
-        # Copy .exe files
-        if os.path.exists(f"dist/EmployeeTrackerGUI{ext}"):
-            shutil.copy2(f"dist/EmployeeTrackerGUI{ext}", portable_dir)
-        
-        if os.path.exists(f"dist/EmployeeTrackerService{ext}"):
-            shutil.copy2(f"dist/EmployeeTrackerService{ext}", portable_dir)
-        
-        if os.path.exists(f"dist/EmployeeTrackerTray{ext}"):
-            shutil.copy2(f"dist/EmployeeTrackerTray{ext}", portable_dir)
-    
+    # Copy executables: .app bundles, single files or onedir folders; the shared bundle once
+    for artifact in dict.fromkeys(artifact_path(platform_info, name, profile) for name in TARGETS):
+        if os.path.isdir(artifact):
+            shutil.copytree(artifact, os.path.join(portable_dir, os.path.basename(artifact)))
+        elif os.path.exists(artifact):
+            shutil.copy2(artifact, portable_dir)
+
     # Copy config file
     shutil.copy2("config.env.example", os.path.join(portable_dir, "config.env"))
     
@@ -380,6 +526,11 @@ if "%choice%"=="4" exit
 
 pause
 '''
+        if not BUILD_PROFILES[profile]['onefile']:
+            # Onedir executables live in a folder of the same name, shared ones in the bundle folder
+            for name in TARGETS:
+                folder = SHARED_BUNDLE if BUILD_PROFILES[profile]['shared'] else name
+                launcher_content = launcher_content.replace(f"start {name}.exe", f'start "" "{folder}\\{name}.exe"')
         launcher_file = "launcher.bat"
     else:
         launcher_content = '''#!/bin/bash
@@ -417,6 +568,11 @@ case $choice in
         ;;
 esac
 '''
+        if BUILD_PROFILES[profile]['shared']:
+            # The launchers share one .app, so they are started directly
+            for name in TARGETS:
+                launcher_content = launcher_content.replace(f"open {name}.app",
+                                                            f'"./{SHARED_BUNDLE}.app/Contents/MacOS/{name}" &')
         launcher_file = "launcher.sh"
     
     with open(os.path.join(portable_dir, launcher_file), 'w') as f:
@@ -451,6 +607,15 @@ def cleanup_build_files():
 
 def main():
     """Main build function"""
+    parser = argparse.ArgumentParser(description="Build the Employee Tracker executables")
+    parser.add_argument('--profile', nargs='+', choices=sorted(BUILD_PROFILES) + ['all'], default=[DEFAULT_PROFILE],
+                        help="build profiles; the first one is packaged (default: onefile)")
+    parser.add_argument('--report', action='store_true',
+                        help="measure size and launch time of each profile (on by default with several profiles)")
+    parser.add_argument('--report-runs', type=int, default=5, help="measured launches per target and profile")
+    args = parser.parse_args()
+    profiles = list(BUILD_PROFILES) if 'all' in args.profile else list(dict.fromkeys(args.profile))
+
     print("🚀 Building Employee Tracker Executables (Cross-Platform)")
     print("=" * 60)
     
@@ -469,17 +634,32 @@ def main():
     create_icon(platform_info)
     
     # Build executables
-    gui_success = build_gui_exe(platform_info, pyinstaller_path)
-    background_success = build_background_exe(platform_info, pyinstaller_path)
-    tray_success = build_tray_exe(platform_info, pyinstaller_path)
-    
-    # Create installer script
-    if gui_success or background_success or tray_success:
+    build_seconds = {}
+    for profile in profiles:
+        started = time.perf_counter()
+        if BUILD_PROFILES[profile]['shared']:
+            # One PyInstaller run produces all three launchers
+            built = build_shared_bundle(platform_info, pyinstaller_path, profile)
+            results = (built, built, built)
+        else:
+            results = (build_gui_exe(platform_info, pyinstaller_path, profile),
+                       build_background_exe(platform_info, pyinstaller_path, profile),
+                       build_tray_exe(platform_info, pyinstaller_path, profile))
+        build_seconds[profile] = time.perf_counter() - started
+        if profile == profiles[0]:
+            gui_success, background_success, tray_success = results
+    
+    # Create installer script; it copies the single-file executables from dist/
+    if (gui_success or background_success or tray_success) and profiles[0] == DEFAULT_PROFILE:
         create_installer_script(platform_info)
     
     # Create portable package
     if gui_success or background_success or tray_success:
-        create_portable_package(platform_info)
+        create_portable_package(platform_info, profiles[0])
+
+    # Compare the profiles
+    if args.report or len(profiles) > 1:
+        create_build_report(platform_info, profiles, args.report_runs, build_seconds)
     
     # Cleanup
     cleanup_build_files()
@@ -496,7 +676,7 @@ def main():
         print(f"✅ EmployeeTrackerTray{ext} - System tray version")
     
     print(f"\n📦 Files created:")
-    print(f"   - dist/ folder with executables")
+    print(f"   - {dist_dir(profiles[0])}/ folder with executables")
     print(f"   - EmployeeTracker_Portable_{platform_info['system'].title()}/ folder (portable package)")
     
     if platform_info['is_windows']:
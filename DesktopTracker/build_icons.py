@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Icon asset pack for Employee Tracker
+Renders every tray icon frame and the application icons once at build time, so the apps only load prebuilt images
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+from tracker_core import tray_icons
+
+# Sizes written into the application icon files
+APP_ICON_SIZES = [16, 24, 32, 48, 64, 128, 256]
+APP_ICON_STATE = 'other'
+
+
+def render_tray_assets(asset_dir=tray_icons.ASSET_DIR):
+    """Render every status icon, ring base and ring arc into asset_dir; returns the number of files written"""
+    os.makedirs(asset_dir, exist_ok=True)
+    size = tray_icons.TRAY_ICON_SIZE
+    images = {}
+    for state in tray_icons.ICON_STYLES:
+        for icon_size in tray_icons.ICON_SIZES:
+            images[tray_icons.icon_asset_name(state, icon_size)] = tray_icons.render_icon(state, icon_size)
+        images[tray_icons.ring_asset_name(state, size)] = tray_icons.render_ring_base(state, size)
+    # Progress rings are only drawn at the tray size; an empty arc is just a transparent layer
+    for color in tray_icons.ARC_ASSET_NAMES:
+        for step in range(1, tray_icons.RING_STEPS + 1):
+            images[tray_icons.arc_asset_name(color, step, size)] = tray_icons.render_arc(size, step, color)
+
+    for name, image in images.items():
+        image.save(os.path.join(asset_dir, name), format='PNG', optimize=True)
+    print(f"✅ Tray icon assets created: {len(images)} files in {asset_dir}")
+    return len(images)
+
+
+def create_app_icons(output_dir='.'):
+    """Write icon.ico, icon.png and icon.icns for the executables and shortcuts"""
+    tray_icons.render_icon(APP_ICON_STATE, 512).save(os.path.join(output_dir, 'icon.png'), format='PNG')
+    # ICNS holds sizes up to 1024px for Retina displays; smaller ones are scaled from it
+    tray_icons.render_icon(APP_ICON_STATE, 1024).save(os.path.join(output_dir, 'icon.icns'), format='ICNS')
+
+    # Every ICO size is rendered on its own rather than scaled down, so small sizes stay sharp
+    ico_images = [tray_icons.render_icon(APP_ICON_STATE, size) for size in APP_ICON_SIZES]
+    ico_images[-1].save(os.path.join(output_dir, 'icon.ico'), format='ICO',
+                        sizes=[(size, size) for size in APP_ICON_SIZES], append_images=ico_images[:-1])
+    print("✅ Icons created: icon.ico, icon.png, icon.icns")
+
+
+def main():
+    """Render the tray assets and the application icons"""
+    render_tray_assets()
+    create_app_icons()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Fake API helpers for Employee Tracker test scripts
+Stand-ins for the requests session and responses the API client uses, so tests run without a server
+"""
+
+import os
+import sys
+from email.utils import formatdate
+
+import requests
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from tracker_core.settings import SettingsStore
+
+BASE_URL = 'http://tracker.test/api'
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, status_code, body, timestamp):
+        self.status_code = status_code
+        self.body = body
+        self.headers = {'Date': formatdate(timestamp, usegmt=True)}
+
+    def json(self):
+        return self.body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error", response=self)
+
+
+class FakeSession:
+    """Stand-in for requests.Session that answers from respond() and keeps the headers of every request"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.headers = []
+
+    def get(self, url, headers=None):
+        return self._send('GET', url, headers)
+
+    def post(self, url, headers=None, json=None):
+        return self._send('POST', url, headers)
+
+    def respond(self, method, path):
+        """Get the (status, body) for a request to a path under BASE_URL"""
+        raise NotImplementedError
+
+    def server_time(self):
+        """Get the epoch time the server puts in the Date header"""
+        return self.clock.time()
+
+    def _send(self, method, url, headers):
+        self.headers.append(headers)
+        status, body = self.respond(method, url[len(BASE_URL):])
+        return FakeResponse(status, body, self.server_time())
+
+
+def create_store(path, **environ):
+    """Create a settings store for the fake API whose settings come from the environment only"""
+    return SettingsStore(path, dict({'API_BASE_URL': BASE_URL, 'API_TOKEN': 'test-token'}, **environ))
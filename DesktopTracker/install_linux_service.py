@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Linux User Service Installer for Employee Tracker
+Installs the background service as a systemd user unit, with an XDG autostart entry for sessions without one
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(APP_DIR, 'src'))
+
+UNIT_NAME = 'employee-tracker'
+SERVICE_SCRIPT = os.path.join(APP_DIR, 'src', 'background_service.py')
+
+# Restart on crashes with exponential backoff: 5s, doubling up to 5 minutes.
+# RestartSteps/RestartMaxDelaySec need systemd 254; older versions warn about
+# the unknown keys and keep restarting every RestartSec.
+RESTART_SEC = 5
+RESTART_STEPS = 6
+RESTART_MAX_DELAY_SEC = 300
+START_LIMIT_INTERVAL_SEC = 3600
+START_LIMIT_BURST = 10
+
+# Session variables the tray icon needs, copied into the user manager on login
+SESSION_VARIABLES = ['DISPLAY', 'WAYLAND_DISPLAY', 'XAUTHORITY', 'DBUS_SESSION_BUS_ADDRESS']
+
+SERVICE_TEMPLATE = """[Unit]
+Description=Employee Tracker background service
+Documentation={docs}
+After=graphical-session.target
+PartOf=graphical-session.target
+# Nothing runs until the service is configured; {unit}.path starts it once config.env is saved
+ConditionPathExists={config}
+StartLimitIntervalSec={start_limit_interval}
+StartLimitBurst={start_limit_burst}
+
+[Service]
+Type=simple
+WorkingDirectory={working_dir}
+ExecStart={exec_start}
+Environment=PYTHONUNBUFFERED=1
+{environment}Restart=on-failure
+RestartSec={restart_sec}
+RestartSteps={restart_steps}
+RestartMaxDelaySec={restart_max_delay}
+
+[Install]
+WantedBy=graphical-session.target
+"""
+
+PATH_TEMPLATE = """[Unit]
+Description=Start Employee Tracker when its settings are saved
+
+[Path]
+PathChanged={config}
+Unit={unit}.service
+
+[Install]
+WantedBy=default.target
+"""
+
+DESKTOP_TEMPLATE = """[Desktop Entry]
+Type=Application
+Name=Employee Tracker
+Comment=Attendance tracking in the system tray
+Exec={exec_line}
+Icon={icon}
+Terminal=false
+X-GNOME-Autostart-enabled=true
+"""
+
+
+def systemd_quote(argument):
+    """Quote one ExecStart argument; % is doubled so systemd does not read it as a specifier"""
+    argument = argument.replace('%', '%%')
+    if argument and not any(char in argument for char in ' \t"\'\\;'):
+        return argument
+    return '"' + argument.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def systemd_path(path):
+    """Escape a path setting; systemd takes these verbatim apart from % specifiers"""
+    return path.replace('%', '%%')
+
+
+def desktop_quote(argument):
+    """Quote one Exec argument of a desktop entry; % is doubled so it is not read as a field code"""
+    if argument and not any(char in argument for char in ' \t"\'\\`$%;&|<>()'):
+        return argument
+    escaped = ''.join('\\' + char if char in '"`$\\' else char for char in argument)
+    return '"' + escaped.replace('%', '%%') + '"'
+
+
+def service_command(executable=None):
+    """Get the command that runs the background service: a built executable or this checkout's script"""
+    if executable:
+        return [os.path.abspath(executable)]
+    return [sys.executable, SERVICE_SCRIPT]
+
+
+def unit_dir():
+    """Get the systemd user unit directory"""
+    base = os.getenv('XDG_CONFIG_HOME') or os.path.expanduser('~/.config')
+    return os.path.join(base, 'systemd', 'user')
+
+
+def autostart_dir():
+    """Get the XDG autostart directory"""
+    base = os.getenv('XDG_CONFIG_HOME') or os.path.expanduser('~/.config')
+    return os.path.join(base, 'autostart')
+
+
+def has_systemd_user():
+    """Check whether this session has a systemd user manager to talk to"""
+    if not shutil.which('systemctl'):
+        return False
+    result = subprocess.run(['systemctl', '--user', 'show-environment'],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return result.returncode == 0
+
+
+def render_files(config, command, use_systemd=True, environment=None):
+    """Render the unit files and autostart entry; returns {path: content}"""
+    files = {}
+    autostart_file = os.path.join(autostart_dir(), f'{UNIT_NAME}.desktop')
+    icon = os.path.join(APP_DIR, 'icon.png')
+
+    if use_systemd:
+        environment_lines = ''.join(f"Environment={systemd_quote(f'{name}={value}')}\n"
+                                    for name, value in sorted((environment or {}).items()))
+        files[os.path.join(unit_dir(), f'{UNIT_NAME}.service')] = SERVICE_TEMPLATE.format(
+            docs=systemd_path(Path(APP_DIR, 'BACKGROUND_SERVICE.md').as_uri()),
+            unit=UNIT_NAME,
+            config=systemd_path(config),
+            start_limit_interval=START_LIMIT_INTERVAL_SEC,
+            start_limit_burst=START_LIMIT_BURST,
+            working_dir=systemd_path(APP_DIR),
+            exec_start=' '.join(systemd_quote(argument) for argument in command),
+            environment=environment_lines,
+            restart_sec=RESTART_SEC,
+            restart_steps=RESTART_STEPS,
+            restart_max_delay=RESTART_MAX_DELAY_SEC,
+        )
+        files[os.path.join(unit_dir(), f'{UNIT_NAME}.path')] = PATH_TEMPLATE.format(
+            config=systemd_path(config), unit=UNIT_NAME)
+
+        # Sessions without graphical-session.target still start the unit at login,
+        # after handing it the display variables; systemd never starts it twice
+        script = (f"systemctl --user import-environment {' '.join(SESSION_VARIABLES)}; "
+                  f"exec systemctl --user start {UNIT_NAME}.service")
+        exec_line = ' '.join(desktop_quote(argument) for argument in ['sh', '-c', script])
+    else:
+        # No user manager: the autostart entry runs the service itself
+        exec_line = ' '.join(desktop_quote(argument) for argument in command)
+    files[autostart_file] = DESKTOP_TEMPLATE.format(exec_line=exec_line, icon=icon)
+    return files
+
+
+def systemctl_commands(config):
+    """Get the systemctl calls that load and enable the units"""
+    commands = [
+        ['systemctl', '--user', 'daemon-reload'],
+        ['systemctl', '--user', 'enable', f'{UNIT_NAME}.service', f'{UNIT_NAME}.path'],
+        ['systemctl', '--user', 'start', f'{UNIT_NAME}.path'],
+    ]
+    if os.path.exists(config):
+        commands.append(['systemctl', '--user', 'start', f'{UNIT_NAME}.service'])
+    return commands
+
+
+def install(config, command, use_systemd, environment, dry_run=False):
+    """Write the unit files and enable them; with dry_run, only print what would be done"""
+    files = render_files(config, command, use_systemd, environment)
+    commands = systemctl_commands(config) if use_systemd else []
+
+    for path, content in files.items():
+        if dry_run:
+            print(f"\n📄 {path}\n{content}")
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+        print(f"✅ Written: {path}")
+
+    for command_line in commands:
+        if dry_run:
+            print(f"🔧 Would run: {' '.join(command_line)}")
+            continue
+        result = subprocess.run(command_line)
+        if result.returncode != 0:
+            print(f"⚠️  {' '.join(command_line)} failed with exit code {result.returncode}")
+            return False
+    return True
+
+
+def uninstall(dry_run=False):
+    """Stop and disable the units and remove every file the installer writes"""
+    paths = [os.path.join(unit_dir(), f'{UNIT_NAME}.service'),
+             os.path.join(unit_dir(), f'{UNIT_NAME}.path'),
+             os.path.join(autostart_dir(), f'{UNIT_NAME}.desktop')]
+    commands = []
+    if has_systemd_user():
+        commands = [['systemctl', '--user', 'disable', '--now', f'{UNIT_NAME}.path', f'{UNIT_NAME}.service']]
+
+    for command_line in commands:
+        if dry_run:
+            print(f"🔧 Would run: {' '.join(command_line)}")
+        else:
+            subprocess.run(command_line)
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        if dry_run:
+            print(f"🗑️  Would remove: {path}")
+        else:
+            os.remove(path)
+            print(f"✅ Removed: {path}")
+    if commands and not dry_run:
+        subprocess.run(['systemctl', '--user', 'daemon-reload'])
+
+
+def main(argv=None):
+    """Main installation function"""
+    parser = argparse.ArgumentParser(description="Install the Employee Tracker background service for this Linux user")
+    parser.add_argument('--dry-run', action='store_true', help="print the unit files and commands without changing anything")
+    parser.add_argument('--autostart-only', action='store_true',
+                        help="only write an XDG autostart entry that runs the service directly (no systemd)")
+    parser.add_argument('--executable', help="built EmployeeTrackerService executable to run instead of the script")
+    parser.add_argument('--uninstall', action='store_true', help="stop the service and remove the installed files")
+    args = parser.parse_args(argv)
+
+    print("🚀 Installing Employee Tracker as a Linux user service")
+    print("=" * 50)
+
+    if args.uninstall:
+        uninstall(args.dry_run)
+        return 0
+
+    from tracker_core.settings import SETTINGS_PATH_VARIABLE, settings_path
+
+    config = os.path.abspath(settings_path())
+    # A settings file outside the config directory has to be passed on to the service
+    environment = {SETTINGS_PATH_VARIABLE: config} if os.getenv(SETTINGS_PATH_VARIABLE) else {}
+    use_systemd = not args.autostart_only and (args.dry_run or has_systemd_user())
+    if not use_systemd and not args.autostart_only:
+        print("⚠️  No systemd user manager found; installing an XDG autostart entry instead")
+
+    if not install(config, service_command(args.executable), use_systemd, environment, args.dry_run):
+        return 1
+    if args.dry_run:
+        return 0
+
+    print("\n✅ Installation completed!")
+    if use_systemd:
+        print(f"\n🎯 The service starts at login once {config} exists.")
+        print(f"   Status: systemctl --user status {UNIT_NAME}.service")
+        print(f"   Logs:   journalctl --user -u {UNIT_NAME}.service")
+    else:
+        print("\n🎯 The service starts at your next login.")
+    print(f"\n🔧 To remove: python3 {os.path.basename(__file__)} --uninstall")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
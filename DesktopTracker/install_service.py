@@ -1,15 +1,16 @@
 #!/usr/bin/env python3
 """
 Windows Service Installer for Employee Tracker
-Installs the Employee Tracker as a Windows service
+Installs the Employee Tracker as a Windows service; on Linux it hands over to install_linux_service.py
 """
 
 import os
 import sys
 import subprocess
-import winreg
 from pathlib import Path
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
 def create_service_script():
     """Create a service script for Windows"""
     script_content = '''@echo off
@@ -57,19 +58,12 @@ def create_startup_shortcut():
         print(f"⚠️  Could not create startup shortcut: {e}")
 
 def create_icon():
-    """Create a simple icon file"""
+    """Create the icon files and the prebuilt tray icon frames the service loads"""
     try:
-        from PIL import Image, ImageDraw
-
-        # Create a simple icon
-        image = Image.new('RGB', (64, 64), color='blue')
-        draw = ImageDraw.Draw(image)
-        draw.ellipse((16, 16, 48, 48), fill='white')
-        draw.text((20, 20), "ET", fill='blue')
+        import build_icons
 
-        # Save as ICO
-        image.save('icon.ico', format='ICO')
-        print("✅ Icon created: icon.ico")
+        build_icons.create_app_icons()
+        build_icons.render_tray_assets()
     except Exception as e:
         print(f"⚠️  Could not create icon: {e}")
 
@@ -83,6 +77,10 @@ def install_dependencies():
 
 def main():
     """Main installation function"""
+    if sys.platform.startswith('linux'):
+        import install_linux_service
+        sys.exit(install_linux_service.main())
+
     print("🚀 Installing Employee Tracker as Windows Service")
     print("=" * 50)
 
@@ -112,8 +110,11 @@ def main():
     print("   1. Double-click start_service.vbs")
     print("   2. Or add start_service.bat to Windows startup")
 
+    # Needs python-dotenv, which the service itself requires
+    from tracker_core.settings import settings_path
+
     print("\n🔧 To configure:")
-    print("   1. Edit config.env file")
+    print(f"   1. Edit {settings_path()} (or open Settings from the tray icon)")
     print("   2. Add your API token")
     print("   3. Restart the service")
 
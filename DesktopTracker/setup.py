@@ -7,6 +7,27 @@ import os
 import subprocess
 import sys
 
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+DEFAULT_CONFIG = """# API Configuration
+API_BASE_URL=http://localhost:8080/api
+API_TOKEN=
+
+# Application Settings
+AUTO_START_BREAK_AFTER_MINUTES=240
+DAILY_TARGET_MINUTES=480
+IDLE_BREAK_MINUTES=15
+POWER_SAVER=false
+AUTO_REMINDER_ENABLED=true
+REMINDER_INTERVAL_MINUTES=30
+
+# UI Settings
+THEME=light
+WINDOW_SIZE=400x600
+ALWAYS_ON_TOP=true
+"""
+
 def install_requirements():
     """Install Python requirements"""
     print("Installing Python requirements...")
@@ -19,31 +40,31 @@ def install_requirements():
     return True
 
 def create_config():
-    """Create configuration file if it doesn't exist"""
-    config_file = "config.env"
-    if not os.path.exists(config_file):
-        print("Creating configuration file...")
-        with open(config_file, 'w') as f:
-            f.write("# API Configuration\n")
-            f.write("API_BASE_URL=http://localhost:8080/api\n")
-            f.write("API_TOKEN=\n")
-            f.write("\n")
-            f.write("# Application Settings\n")
-            f.write("AUTO_START_BREAK_AFTER_MINUTES=240\n")
-            f.write("AUTO_REMINDER_ENABLED=true\n")
-            f.write("REMINDER_INTERVAL_MINUTES=30\n")
-            f.write("\n")
-            f.write("# UI Settings\n")
-            f.write("THEME=light\n")
-            f.write("WINDOW_SIZE=400x600\n")
-            f.write("ALWAYS_ON_TOP=true\n")
-        print("✅ Configuration file created!")
+    """Create configuration file in the platform config directory if it doesn't exist"""
+    # Needs python-dotenv, so this runs after the requirements are installed
+    from tracker_core.settings import SettingsStore
+
+    store = SettingsStore()
+    config_file = store.path
+    # Written atomically and readable only by this user, since it holds the API token
+    if store.create(DEFAULT_CONFIG):
+        print(f"✅ Configuration file created: {config_file}")
     else:
-        print("✅ Configuration file already exists!")
+        print(f"✅ Configuration file already exists: {config_file}")
+    return config_file
+
+def create_log_dir():
+    """Create the folder the applications write their JSON logs to"""
+    from tracker_core.logs import log_dir
+
+    directory = log_dir()
+    os.makedirs(directory, exist_ok=True)
+    print(f"✅ Log directory: {directory}")
+    return directory
 
 def create_directories():
     """Create necessary directories"""
-    directories = ['logs', 'config']
+    directories = ['config']
     for directory in directories:
         if not os.path.exists(directory):
             os.makedirs(directory)
@@ -57,15 +78,16 @@ def main():
     # Create directories
     create_directories()
 
-    # Create config file
-    create_config()
-
     # Install requirements
     if install_requirements():
+        # Create config file
+        config_file = create_config()
+        create_log_dir()
+
         print("\n✅ Setup completed successfully!")
         print("\n📋 Next steps:")
         print("1. Get an API token from the Laravel application")
-        print("2. Edit config.env and add your API token")
+        print(f"2. Edit {config_file} and add your API token")
         print("3. Run: python src/main.py")
         print("\n🐳 Or use Docker:")
         print("1. docker-compose up --build")
@@ -4,43 +4,45 @@ Employee Tracker Desktop Application
 A simple desktop application for tracking employee attendance using the Laravel API
 """
 
+# Imported first so the startup benchmark can time interpreter startup
+from tracker_core import startup_trace
+import logging
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
-import requests
-import json
-import os
-from datetime import datetime, timedelta
-import threading
-import time
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv('config.env')
+from tkinter import ttk, messagebox
+from tracker_core.attendance import format_duration
+from tracker_core.engine import TrackerEngine
+from tracker_core import logs
+from stall_monitor import StallMonitor
+
+# TrackerEngine options this front-end runs with
+ENGINE_FEATURES = {}
 
 class EmployeeTracker:
-    def __init__(self):
+    def __init__(self, clock=None):
+        self.engine = TrackerEngine(self.deliver_notification, clock, **ENGINE_FEATURES)
+        settings = self.engine.settings_store.settings
+
         self.root = tk.Tk()
         self.root.title("Employee Tracker")
-        self.root.geometry("400x600")
+        self.root.geometry(settings.window_size)
         self.root.resizable(False, False)
 
-        # API Configuration
-        self.api_base_url = os.getenv('API_BASE_URL', 'http://localhost:8080/api')
-        self.api_token = os.getenv('API_TOKEN', '')
+        self.work_timer_job = None
+        self.label_texts = {}
 
-        # Application state
-        self.current_attendance = None
-        self.is_break_active = False
-        self.break_start_time = None
-        self.reminder_thread = None
-        self.reminder_running = False
+        # Engine events can come from the scheduler thread; widgets are only touched on the Tk thread
+        self.engine.subscribe('changed', lambda: self.root.after(0, self.update_ui))
+        self.engine.subscribe('token_missing', lambda: self.root.after(0, self.on_token_missing))
+        self.engine.subscribe('settings', self.on_settings_changed)
 
-        # Setup UI
-        self.setup_ui()
-        self.load_attendance_data()
+        # Event loop responsiveness monitor
+        self.stall_monitor = None
+        if settings.stall_monitor_enabled:
+            self.stall_monitor = StallMonitor(self.root, threshold_ms=settings.stall_threshold_ms)
 
-        # Start reminder thread
-        self.start_reminder_thread()
+        # Setup UI, then load initial data and start the timers
+        self.setup_ui()
+        self.engine.start()
 
     def setup_ui(self):
         """Setup the user interface"""
@@ -60,7 +62,7 @@ class EmployeeTracker:
         ttk.Label(token_frame, text="API Token:").grid(row=0, column=0, sticky=tk.W)
         self.token_entry = ttk.Entry(token_frame, width=40, show="*")
         self.token_entry.grid(row=0, column=1, padx=(5, 0))
-        self.token_entry.insert(0, self.api_token)
+        self.token_entry.insert(0, self.engine.api_token)
 
         ttk.Button(token_frame, text="Set Token",
                   command=self.set_api_token).grid(row=0, column=2, padx=(5, 0))
@@ -76,6 +78,12 @@ class EmployeeTracker:
         self.time_label = ttk.Label(status_frame, text="", font=('Arial', 10))
         self.time_label.grid(row=1, column=0, columnspan=2)
 
+        self.work_label = ttk.Label(status_frame, text="", font=('Arial', 10))
+        self.work_label.grid(row=2, column=0, columnspan=2)
+
+        self.break_label = ttk.Label(status_frame, text="", font=('Arial', 10))
+        self.break_label.grid(row=3, column=0, columnspan=2)
+
         # Attendance buttons
         button_frame = ttk.LabelFrame(main_frame, text="Attendance Actions", padding="5")
         button_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
@@ -116,128 +124,109 @@ class EmployeeTracker:
         """Set the API token"""
         token = self.token_entry.get().strip()
         if token:
-            self.api_token = token
-            # Save to config file
-            with open('config.env', 'w') as f:
-                f.write(f"API_BASE_URL={self.api_base_url}\n")
-                f.write(f"API_TOKEN={token}\n")
+            self.engine.set_api_token(token)
             messagebox.showinfo("Success", "API Token updated successfully!")
             self.load_attendance_data()
         else:
             messagebox.showerror("Error", "Please enter a valid API token!")
 
-    def get_headers(self):
-        """Get API headers with authentication"""
-        if not self.api_token:
-            raise Exception("API token not set!")
-        return {
-            'Authorization': f'Bearer {self.api_token}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
-
-    def make_api_request(self, method, endpoint, data=None):
-        """Make API request to the Laravel backend"""
-        try:
-            url = f"{self.api_base_url}{endpoint}"
-            headers = self.get_headers()
-
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=headers)
-            elif method.upper() == 'POST':
-                response = requests.post(url, headers=headers, json=data)
-            else:
-                raise Exception(f"Unsupported HTTP method: {method}")
-
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            messagebox.showerror("API Error", f"Failed to connect to API: {str(e)}")
-            return None
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
-            return None
+    def deliver_notification(self, title, message, category='info'):
+        """Show a queued notification on the Tk thread"""
+        show = {'error': messagebox.showerror, 'reminder': messagebox.showwarning}.get(category, messagebox.showinfo)
+        self.root.after(0, lambda: show(title, message))
+
+    def show_outcome(self, outcome):
+        """Show the result of an attendance action"""
+        if outcome is None:
+            return
+        success, message = outcome
+        if success:
+            messagebox.showinfo("Success", message)
+        else:
+            messagebox.showerror("Error", message)
 
     def check_in(self):
         """Check in for the day"""
-        result = self.make_api_request('POST', '/attendance/check-in')
-        if result and result.get('success'):
-            messagebox.showinfo("Success", "Checked in successfully!")
-            self.load_attendance_data()
-        else:
-            messagebox.showerror("Error", result.get('message', 'Failed to check in'))
+        self.show_outcome(self.engine.check_in())
 
     def check_out(self):
         """Check out for the day"""
-        result = self.make_api_request('POST', '/attendance/check-out')
-        if result and result.get('success'):
-            messagebox.showinfo("Success", "Checked out successfully!")
-            self.load_attendance_data()
-        else:
-            messagebox.showerror("Error", result.get('message', 'Failed to check out'))
+        self.show_outcome(self.engine.check_out())
 
     def start_break(self):
         """Start break"""
-        result = self.make_api_request('POST', '/attendance/break-start')
-        if result and result.get('success'):
-            self.is_break_active = True
-            self.break_start_time = datetime.now()
-            messagebox.showinfo("Success", "Break started!")
-            self.load_attendance_data()
-        else:
-            messagebox.showerror("Error", result.get('message', 'Failed to start break'))
+        self.show_outcome(self.engine.start_break())
 
     def end_break(self):
         """End break"""
-        result = self.make_api_request('POST', '/attendance/break-end')
-        if result and result.get('success'):
-            self.is_break_active = False
-            self.break_start_time = None
-            messagebox.showinfo("Success", "Break ended!")
-            self.load_attendance_data()
-        else:
-            messagebox.showerror("Error", result.get('message', 'Failed to end break'))
+        self.show_outcome(self.engine.end_break())
 
     def load_attendance_data(self):
         """Load today's attendance data"""
-        if not self.api_token:
-            self.status_label.config(text="Please set API token first")
-            return
+        self.engine.load_attendance_data()
 
-        result = self.make_api_request('GET', '/attendance/today')
-        if result and result.get('success'):
-            self.current_attendance = result.get('data')
-            self.update_ui()
-        else:
-            self.status_label.config(text="No attendance data for today")
-            self.update_button_states(False, False, False, False)
+    def on_token_missing(self):
+        """Ask for a token when there is nothing to load"""
+        self.status_label.config(text="Please set API token first")
 
     def update_ui(self):
         """Update the UI based on current attendance data"""
-        if not self.current_attendance:
+        if not self.engine.current_attendance:
+            self.status_label.config(text="No attendance data for today")
+            self.update_button_states(False, False, False, False)
+            self.update_work_timer()
             return
 
         # Update status
-        status = self.current_attendance.get('status', 'Unknown')
-        check_in = self.current_attendance.get('check_in', 'Not checked in')
-        check_out = self.current_attendance.get('check_out', 'Not checked out')
+        attendance = self.engine.current_attendance
+        check_in = attendance.time_text('check_in', 'Not checked in')
+        check_out = attendance.time_text('check_out', 'Not checked out')
 
-        self.status_label.config(text=f"Status: {status.title()}")
+        self.status_label.config(text=f"Status: {attendance.status.title()}")
         self.time_label.config(text=f"Check In: {check_in} | Check Out: {check_out}")
 
         # Update button states
-        has_checkin = bool(check_in and check_in != 'Not checked in')
-        has_checkout = bool(check_out and check_out != 'Not checked out')
-        has_break_start = bool(self.current_attendance.get('break_start'))
-        has_break_end = bool(self.current_attendance.get('break_end'))
-
-        self.update_button_states(not has_checkin, has_checkin and not has_checkout,
-                                 has_checkin and not has_break_start,
-                                 has_break_start and not has_break_end)
+        self.update_button_states(attendance.can_check_in, attendance.can_check_out,
+                                 attendance.can_start_break, attendance.can_end_break)
 
         # Update summary
         self.update_summary()
 
+        # Restart the live work timer from the new state
+        self.update_work_timer()
+
+    def set_label_text(self, label, text):
+        """Reconfigure a label only when its text changed"""
+        if self.label_texts.get(str(label)) != text:
+            self.label_texts[str(label)] = text
+            label.config(text=text)
+
+    def update_work_timer(self):
+        """Redraw the work timer now and keep it ticking while the day is running"""
+        if self.work_timer_job:
+            self.root.after_cancel(self.work_timer_job)
+            self.work_timer_job = None
+        self.tick_work_timer()
+
+    def tick_work_timer(self):
+        """Update the elapsed work and break labels from local time"""
+        self.work_timer_job = None
+        attendance = self.engine.current_attendance
+        if not attendance or not attendance.check_in:
+            self.set_label_text(self.work_label, "")
+            self.set_label_text(self.break_label, "")
+            return
+
+        # Elapsed time is computed locally against the estimated server clock
+        now = self.engine.server_clock.time()
+        self.set_label_text(self.work_label, f"Worked: {format_duration(attendance.work_seconds(now))}")
+        self.set_label_text(self.break_label, f"Break: {format_duration(attendance.break_seconds(now))}")
+
+        if not attendance.check_out:
+            # Tick on the next second boundary of the server clock
+            delay = 1000 - int(self.engine.server_clock.time() * 1000) % 1000
+            self.work_timer_job = self.root.after(delay, self.tick_work_timer)
+
     def update_button_states(self, checkin_enabled, checkout_enabled,
                            break_start_enabled, break_end_enabled):
         """Update button states"""
@@ -248,62 +237,64 @@ class EmployeeTracker:
 
     def update_summary(self):
         """Update the summary text"""
-        if not self.current_attendance:
+        if not self.engine.current_attendance:
             return
 
-        summary = f"Date: {self.current_attendance.get('date', 'N/A')}\n"
-        summary += f"Check In: {self.current_attendance.get('check_in', 'Not checked in')}\n"
-        summary += f"Check Out: {self.current_attendance.get('check_out', 'Not checked out')}\n"
-        summary += f"Break Start: {self.current_attendance.get('break_start', 'Not started')}\n"
-        summary += f"Break End: {self.current_attendance.get('break_end', 'Not ended')}\n"
-        summary += f"Total Break Minutes: {self.current_attendance.get('total_break_minutes', 0)}\n"
-        summary += f"Total Work Minutes: {self.current_attendance.get('total_work_minutes', 0)}\n"
-        summary += f"Status: {self.current_attendance.get('status', 'Unknown').title()}\n"
+        attendance = self.engine.current_attendance
+        summary = f"Date: {attendance.date}\n"
+        summary += f"Check In: {attendance.time_text('check_in', 'Not checked in')}\n"
+        summary += f"Check Out: {attendance.time_text('check_out', 'Not checked out')}\n"
+        summary += f"Break Start: {attendance.time_text('break_start', 'Not started')}\n"
+        summary += f"Break End: {attendance.time_text('break_end', 'Not ended')}\n"
+        summary += f"Total Break Minutes: {attendance.total_break_minutes}\n"
+        summary += f"Total Work Minutes: {attendance.total_work_minutes}\n"
+        summary += f"Status: {attendance.status.title()}\n"
 
         self.summary_text.config(state=tk.NORMAL)
         self.summary_text.delete(1.0, tk.END)
         self.summary_text.insert(1.0, summary)
         self.summary_text.config(state=tk.DISABLED)
 
-    def start_reminder_thread(self):
-        """Start the reminder thread"""
-        if not self.reminder_running:
-            self.reminder_running = True
-            self.reminder_thread = threading.Thread(target=self.reminder_loop, daemon=True)
-            self.reminder_thread.start()
-
-    def reminder_loop(self):
-        """Reminder loop for break reminders"""
-        while self.reminder_running:
-            try:
-                if self.current_attendance and self.current_attendance.get('check_in'):
-                    # Check if user has been working for more than 4 hours without a break
-                    check_in_time = self.current_attendance.get('check_in')
-                    if check_in_time and not self.current_attendance.get('break_start'):
-                        # Parse time and check if 4+ hours have passed
-                        check_in_dt = datetime.strptime(f"{self.current_attendance.get('date')} {check_in_time}", "%Y-%m-%d %H:%M:%S")
-                        if datetime.now() - check_in_dt > timedelta(hours=4):
-                            self.root.after(0, lambda: messagebox.showwarning(
-                                "Break Reminder",
-                                "You've been working for more than 4 hours. Consider taking a break!"
-                            ))
-            except Exception as e:
-                print(f"Reminder error: {e}")
-
-            time.sleep(1800)  # Check every 30 minutes
+    def on_settings_changed(self, settings, changed):
+        """Apply reloaded settings on the Tk thread (runs on the scheduler thread)"""
+        self.root.after(0, self.apply_settings, settings, changed)
+
+    def apply_settings(self, settings, changed):
+        """Show settings changed in the settings file; the engine has already applied them"""
+        if 'window_size' in changed:
+            self.root.geometry(settings.window_size)
+        if 'api_token' in changed:
+            self.token_entry.delete(0, tk.END)
+            self.token_entry.insert(0, settings.api_token)
+
+    def on_first_map(self, event):
+        """Record the first paint of the main window for the startup benchmark"""
+        if event.widget is self.root:
+            self.root.after_idle(startup_trace.ready, 'first_paint')
 
     def run(self):
         """Run the application"""
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.root.bind('<Map>', self.on_first_map, add='+')
+        if self.stall_monitor:
+            self.stall_monitor.start()
         self.root.mainloop()
 
     def on_closing(self):
         """Handle application closing"""
-        self.reminder_running = False
+        self.engine.stop()
+        if self.stall_monitor:
+            self.stall_monitor.stop()
+            if self.stall_monitor.stalls:
+                logging.getLogger(__name__).warning(self.stall_monitor.report())
+        if self.work_timer_job:
+            self.root.after_cancel(self.work_timer_job)
         self.root.destroy()
 
 def main():
     """Main function"""
+    startup_trace.mark('imports')
+    logs.setup_logging('gui')
     app = EmployeeTracker()
     app.run()
 
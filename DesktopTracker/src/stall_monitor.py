@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Stall Monitor
+Measures Tk event loop responsiveness and records what blocked it
+"""
+
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the scheduling lag histogram buckets in milliseconds
+LAG_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class StallMonitor:
+    """Schedules a heartbeat on the Tk loop and samples the stack when it stalls"""
+
+    def __init__(self, root, interval_ms=250, threshold_ms=200, max_stalls=50):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.threshold_ms = threshold_ms
+
+        # The monitor is created on the thread that runs the Tk loop
+        self.loop_thread_id = threading.get_ident()
+
+        self.histogram = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self.max_lag_ms = 0.0
+        self.beats = 0
+        self.stalls = deque(maxlen=max_stalls)
+        self.current_stall = None
+
+        self.expected_at = None
+        self.job = None
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.watchdog = None
+
+    def start(self):
+        """Start the heartbeat and the watchdog thread"""
+        self._schedule()
+        self.watchdog = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self.watchdog.start()
+
+    def stop(self):
+        """Stop monitoring"""
+        self.stop_event.set()
+        if self.job:
+            try:
+                self.root.after_cancel(self.job)
+            except Exception:
+                pass
+            self.job = None
+
+    def _schedule(self):
+        """Schedule the next heartbeat"""
+        with self.lock:
+            self.expected_at = time.monotonic() + self.interval_ms / 1000
+        self.job = self.root.after(self.interval_ms, self._beat)
+
+    def _beat(self):
+        """Heartbeat callback; runs on the Tk loop"""
+        lag_ms = max(0.0, (time.monotonic() - self.expected_at) * 1000)
+        self.beats += 1
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        self.histogram[self._bucket(lag_ms)] += 1
+
+        with self.lock:
+            stall, self.current_stall = self.current_stall, None
+        if stall:
+            stall['duration_ms'] = round(lag_ms + self.interval_ms)
+            self.stalls.append(stall)
+            logger.warning("Event loop stalled for %d ms; main thread was in:\n%s",
+                           stall['duration_ms'], stall['stack'])
+
+        if not self.stop_event.is_set():
+            self._schedule()
+
+    def _watch(self):
+        """Watchdog loop; samples the Tk thread stack once per stall"""
+        while not self.stop_event.wait(self.threshold_ms / 1000):
+            with self.lock:
+                overdue_ms = (time.monotonic() - self.expected_at) * 1000
+                if overdue_ms < self.threshold_ms or self.current_stall is not None:
+                    continue
+                frame = sys._current_frames().get(self.loop_thread_id)
+                self.current_stall = {
+                    'started': time.time() - overdue_ms / 1000,
+                    'stack': ''.join(traceback.format_stack(frame)) if frame else '',
+                }
+
+    def _bucket(self, lag_ms):
+        """Get the histogram bucket index for a lag"""
+        for index, bound in enumerate(LAG_BUCKETS_MS):
+            if lag_ms <= bound:
+                return index
+        return len(LAG_BUCKETS_MS)
+
+    def report(self):
+        """Format the lag histogram and recorded stalls"""
+        lines = [f"Heartbeats: {self.beats}, max lag: {self.max_lag_ms:.0f} ms, stalls: {len(self.stalls)}"]
+        lower = 0
+        for bound, count in zip(LAG_BUCKETS_MS + (None,), self.histogram):
+            label = f"{lower}-{bound} ms" if bound else f">{lower} ms"
+            lines.append(f"  {label:>14}: {count}")
+            lower = bound
+        for stall in self.stalls:
+            started = time.strftime('%H:%M:%S', time.localtime(stall['started']))
+            lines.append(f"\nStall at {started} ({stall['duration_ms']} ms):\n{stall['stack']}")
+        return '\n'.join(lines)
@@ -0,0 +1,7 @@
+"""
+Employee Tracker Core
+API client, attendance state, timers and caches shared by the GUI, tray and background front-ends
+
+Kept free of imports so that `from tracker_core import startup_trace` stays cheap; import
+TrackerEngine from tracker_core.engine.
+"""
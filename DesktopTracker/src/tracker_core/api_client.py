@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker API Client
+HTTP transport for the Laravel API that also tracks the server clock and request metrics
+"""
+
+import logging
+
+import requests
+
+from . import logs, startup_trace
+from .clock import Clock
+from .metrics import MetricsRegistry
+from .server_clock import ServerClock
+
+logger = logging.getLogger(__name__)
+
+
+class ApiClient:
+    """Sends API requests over a shared session and estimates the server clock offset"""
+
+    def __init__(self, base_url, clock=None, session=None, metrics=None):
+        self.base_url = base_url
+        self.clock = clock or Clock()
+        self.metrics = metrics or MetricsRegistry()
+        self.server_clock = ServerClock(self.clock)
+        # Reuses connections between requests
+        self.session = session or requests.Session()
+        self.calls = 0
+
+    def request(self, method, endpoint, headers, data=None):
+        """Send a request and return the decoded JSON; raises on HTTP errors"""
+        # The id goes out as a header and onto every log record made for this request
+        with logs.correlation(logs.new_correlation_id()) as request_id:
+            return self._send(method.upper(), endpoint, dict(headers, **{logs.CORRELATION_HEADER: request_id}), data)
+
+    def _send(self, method, endpoint, headers, data):
+        """Send one request inside its correlation context"""
+        url = f"{self.base_url}{endpoint}"
+
+        self.calls += 1
+        sent_at = self.clock.time()
+        started = self.clock.monotonic()
+        try:
+            if method == 'GET':
+                response = self.session.get(url, headers=headers)
+            elif method == 'POST':
+                response = self.session.post(url, headers=headers, json=data)
+            else:
+                raise Exception(f"Unsupported HTTP method: {method}")
+        except requests.exceptions.RequestException as e:
+            self.metrics.inc('tracker_api_errors_total', method=method, endpoint=endpoint, error=type(e).__name__)
+            logger.warning("%s %s failed: %s", method, endpoint, e,
+                           extra={'method': method, 'endpoint': endpoint, 'error': type(e).__name__})
+            raise
+
+        # Endpoints are fixed paths, so they are safe to use as labels
+        duration = self.clock.monotonic() - started
+        self.metrics.observe('tracker_api_request_duration_seconds', duration, method=method, endpoint=endpoint)
+        self.metrics.inc('tracker_api_responses_total', method=method, endpoint=endpoint,
+                         status=response.status_code)
+        logger.log(logging.WARNING if response.status_code >= 400 else logging.INFO,
+                   "%s %s -> %s", method, endpoint, response.status_code,
+                   extra={'method': method, 'endpoint': endpoint, 'status': response.status_code,
+                          'duration_ms': round(duration * 1000, 1)})
+
+        # Every response carries a Date header, so the offset estimate is free
+        self.server_clock.observe(response.headers.get('Date'), sent_at, self.clock.time())
+
+        response.raise_for_status()
+        startup_trace.mark('first_api')
+        return response.json()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Attendance Helpers
+Today's attendance record and local work and break time calculations
+"""
+
+import time
+
+# Default daily work target used for progress displays
+DAILY_TARGET_MINUTES = 480
+
+# Work time without a break after which a break reminder is shown
+BREAK_REMINDER_MINUTES = 240
+
+
+class AttendanceRecord:
+    """Today's attendance, parsed once when the API response arrives
+
+    The API sends times as "H:i:s" on the server's date in the server's
+    timezone; they are turned into epoch seconds with the server clock, so
+    elapsed time is plain arithmetic against `ServerClock.time()` whatever
+    timezone the client is in. The state and the action flags the menus and
+    buttons check are computed up front.
+    """
+
+    __slots__ = ('date', 'status', 'check_in', 'check_out', 'break_start', 'break_end',
+                 'total_break_minutes', 'total_work_minutes', 'state',
+                 'can_check_in', 'can_check_out', 'can_start_break', 'can_end_break')
+
+    TIME_FIELDS = ('check_in', 'check_out', 'break_start', 'break_end')
+
+    def __init__(self, data, server_clock, server_date=None):
+        # The date always comes from the server: the response's own date, the
+        # record's (a plain date or an ISO timestamp), or the server clock
+        self.date = str(server_date or data.get('date') or server_clock.today())[:10]
+        self.status = data.get('status') or 'unknown'
+        self.total_break_minutes = data.get('total_break_minutes') or 0
+        self.total_work_minutes = data.get('total_work_minutes') or 0
+
+        for field in self.TIME_FIELDS:
+            value = data.get(field)
+            if value:
+                # "H:i:s" from the server; seconds are optional
+                hour, minute, second = (list(map(int, str(value).split(':'))) + [0])[:3]
+                value = server_clock.timestamp(self.date, hour, minute, second)
+            setattr(self, field, value or None)
+
+        if self.check_out:
+            self.state = 'checked_out'
+        elif self.break_start and not self.break_end:
+            self.state = 'on_break'
+        elif self.check_in:
+            self.state = 'working'
+        else:
+            self.state = 'not_checked_in'
+
+        self.can_check_in = not self.check_in
+        self.can_check_out = bool(self.check_in) and not self.check_out
+        self.can_start_break = bool(self.check_in) and not self.break_start
+        self.can_end_break = bool(self.break_start) and not self.break_end
+
+    @classmethod
+    def from_api(cls, data, server_clock, server_date=None):
+        """Parse the `data` of an /attendance/today response; None when there is no record"""
+        return cls(data, server_clock, server_date) if data else None
+
+    def __repr__(self):
+        return f"AttendanceRecord({self.date}, {self.state})"
+
+    def time_text(self, field, default):
+        """Format a time field as H:M:S on the local clock for display"""
+        value = getattr(self, field)
+        if value is None:
+            return default
+        return time.strftime('%H:%M:%S', time.localtime(value))
+
+    def break_seconds(self, now):
+        """Get the total break time in seconds, including a running break"""
+        total = self.total_break_minutes * 60
+        if self.break_start and not self.break_end:
+            total += max(0, now - self.break_start)
+        return int(total)
+
+    def work_seconds(self, now):
+        """Get the worked time in seconds since check-in, excluding breaks"""
+        if not self.check_in:
+            return 0
+        end = self.check_out or now
+        return max(0, int(end - self.check_in - self.break_seconds(end)))
+
+    def break_reminder_due(self, after_minutes=BREAK_REMINDER_MINUTES):
+        """Get when the break reminder is due in server epoch seconds, or None if no reminder is needed"""
+        if self.state != 'working' or self.break_start:
+            return None
+        return self.check_in + after_minutes * 60
+
+
+def format_duration(seconds):
+    """Format a duration in seconds as H:MM:SS"""
+    seconds = max(0, int(seconds))
+    return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Clock
+Injectable time source, with a virtual clock for accelerated testing
+"""
+
+import time
+from datetime import datetime
+
+
+class Clock:
+    """The real system clock"""
+
+    # Virtual clocks run scheduler timers themselves instead of a thread
+    drives_timers = False
+
+    def time(self):
+        """Get the wall clock time as an epoch timestamp"""
+        return time.time()
+
+    def monotonic(self):
+        """Get a monotonic time for measuring intervals"""
+        return time.monotonic()
+
+    def now(self):
+        """Get the wall clock time as a naive local datetime"""
+        return datetime.fromtimestamp(self.time())
+
+
+class VirtualClock(Clock):
+    """A clock that only moves when advanced, running due timers on the way"""
+
+    drives_timers = True
+
+    def __init__(self, start=None):
+        if isinstance(start, datetime):
+            start = start.timestamp()
+        self.current = time.time() if start is None else start
+        self.schedulers = []
+
+    def time(self):
+        return self.current
+
+    def monotonic(self):
+        return self.current
+
+    def attach(self, scheduler):
+        """Let this clock run a scheduler's timers"""
+        if scheduler not in self.schedulers:
+            self.schedulers.append(scheduler)
+
+    def detach(self, scheduler):
+        """Stop running a scheduler's timers"""
+        if scheduler in self.schedulers:
+            self.schedulers.remove(scheduler)
+
+    def advance(self, seconds):
+        """Move time forward, firing every timer that falls due in order"""
+        self.advance_to(self.current + seconds)
+
+    def advance_to(self, target):
+        """Move time forward to an epoch timestamp or datetime"""
+        if isinstance(target, datetime):
+            target = target.timestamp()
+
+        while True:
+            due = [d for d in (s.next_due() for s in self.schedulers) if d is not None]
+            if not due or min(due) > target:
+                break
+            self.current = max(self.current, min(due))
+            for scheduler in list(self.schedulers):
+                scheduler.run_due()
+
+        self.current = max(self.current, target)
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Engine
+Attendance state, API access and timers behind the GUI, tray and background front-ends
+"""
+
+import logging
+import os
+import threading
+
+import requests
+
+from . import logs
+from .api_client import ApiClient
+from .attendance import AttendanceRecord
+from .clock import Clock
+from .idle import IdleSampler, detect_idle_source
+from .metrics import DUMP_FILE, MetricsRegistry, MetricsService
+from .notifications import NotificationQueue
+from .power import PowerManager, SUSPENDED_INTERVAL_SECONDS, detect_power_source
+from .reminders import BreakReminder, DayRollover
+from .scheduler import Scheduler
+from .settings import SettingsStore, SettingsWatcher
+
+logger = logging.getLogger(__name__)
+
+# Action name -> (endpoint, success message, fallback failure message)
+ACTIONS = {
+    'check_in': ('/attendance/check-in', "Checked in successfully!", "Failed to check in"),
+    'check_out': ('/attendance/check-out', "Checked out successfully!", "Failed to check out"),
+    'start_break': ('/attendance/break-start', "Break started!", "Failed to start break"),
+    'end_break': ('/attendance/break-end', "Break ended!", "Failed to end break"),
+}
+
+# Events front-ends can subscribe to:
+#   changed        attendance was (re)loaded
+#   token_missing  a load was skipped because no API token is set
+#   tick           once a minute while the workday is running
+#   reminder       (title, message) when the break reminder fires
+#   settings       (settings, changed field names) after a settings reload was applied
+EVENTS = ('changed', 'token_missing', 'tick', 'reminder', 'settings')
+
+TICK_TIMER = 'progress-ring'
+
+
+class TrackerEngine:
+    """Owns the API client, attendance state, scheduler and notification queue for one front-end
+
+    Front-ends call the action methods and subscribe to events; they never
+    talk to the API or the scheduler directly. Events are emitted on the
+    thread that caused them (the caller's, or the scheduler thread for
+    timers), so GUI front-ends must hand them over to their UI thread.
+    """
+
+    def __init__(self, deliver, clock=None, settings_store=None, session=None,
+                 auto_break=False, power_management=False, idle_source=None, power_source=None,
+                 watch_settings=True):
+        # Settings are loaded once and reloaded when the file changes
+        self.settings_store = settings_store or SettingsStore()
+        settings = self.settings_store.load()
+        self.api_token = settings.api_token
+        self.daily_target_minutes = settings.daily_target_minutes
+        self.idle_break_minutes = settings.idle_break_minutes
+        logs.set_level(settings.log_level)
+
+        # Application state; current_attendance is an AttendanceRecord or None
+        self.current_attendance = None
+        self.is_break_active = False
+        self.break_start_time = None
+        self.api_online = True
+        self.listeners = {event: [] for event in EVENTS}
+
+        self.clock = clock or Clock()
+        self.metrics = MetricsRegistry()
+        self.api = ApiClient(settings.api_base_url, self.clock, session, self.metrics)
+        self.server_clock = self.api.server_clock
+        self.scheduler = Scheduler(self.clock)
+        self.break_reminder = BreakReminder(self.scheduler, self.server_clock, self.show_break_reminder,
+                                            settings.auto_start_break_after_minutes,
+                                            settings.reminder_interval_minutes,
+                                            settings.auto_reminder_enabled)
+        self.day_rollover = DayRollover(self.scheduler, self.server_clock, self.roll_over_day)
+        self.notifications = NotificationQueue(deliver, clock=self.clock.monotonic)
+        self.metrics.gauge('tracker_queue_depth', self.notifications.depth, queue='notifications')
+        self.metrics.gauge('tracker_queue_depth', lambda: len(self.scheduler.timers), queue='timers')
+        # Exporter and dumps are opt-in; the dump is written next to the settings file
+        self.metrics_service = MetricsService(self.metrics, self.scheduler,
+                                              os.path.join(os.path.dirname(self.settings_store.path), DUMP_FILE))
+        self.metrics_settings = (settings.metrics_port, settings.metrics_dump_minutes)
+
+        # Power saver mode, only for front-ends that offer it
+        self.power = None
+        if power_management:
+            self.power = PowerManager(self.scheduler, power_source or detect_power_source(), settings.power_saver,
+                                      metrics=self.metrics)
+
+        # The settings poll backs off while power saver suspends deferrable work
+        self.settings_watcher = None
+        if watch_settings:
+            self.settings_watcher = SettingsWatcher(self.settings_store, self.scheduler, self.apply_settings,
+                                                    suspended=self.power.suspended if self.power else None)
+
+        # Automatic breaks while the user is idle
+        self.auto_break = auto_break
+        self.auto_break_active = False
+        self.idle_source = idle_source
+        self.idle_sampler = None
+        self.create_idle_sampler()
+
+    def start(self):
+        """Load today's attendance and start the timers"""
+        self.load_attendance_data()
+        self.scheduler.start()
+        self.metrics_service.configure(*self.metrics_settings)
+        if self.settings_watcher:
+            self.settings_watcher.start()
+
+    def stop(self):
+        """Stop all timers and background threads"""
+        if self.settings_watcher:
+            self.settings_watcher.stop()
+        self.metrics_service.stop()
+        self.scheduler.stop()
+        self.notifications.stop()
+
+    def subscribe(self, event, callback):
+        """Call `callback` whenever `event` is emitted"""
+        self.listeners[event].append(callback)
+
+    def emit(self, event, *args):
+        """Call every listener of an event"""
+        for callback in self.listeners[event]:
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.exception("Event error (%s): %s", event, e)
+
+    def notify(self, title, message, category='info'):
+        """Queue a notification for the front-end"""
+        # De-duplicated, coalesced and rate limited before delivery
+        self.notifications.post(title, message, category)
+
+    def notify_outcome(self, outcome):
+        """Queue a notification for the outcome of an action"""
+        if outcome is None:
+            return
+        success, message = outcome
+        if success:
+            self.notify("Success", message, 'success')
+        else:
+            self.notify("Error", message, 'error')
+
+    def can_check_in(self):
+        """Check if user can check in"""
+        return not self.current_attendance or self.current_attendance.can_check_in
+
+    def can_check_out(self):
+        """Check if user can check out"""
+        return bool(self.current_attendance) and self.current_attendance.can_check_out
+
+    def can_start_break(self):
+        """Check if user can start break"""
+        return bool(self.current_attendance) and self.current_attendance.can_start_break
+
+    def can_end_break(self):
+        """Check if user can end break"""
+        return bool(self.current_attendance) and self.current_attendance.can_end_break
+
+    def get_headers(self):
+        """Get API headers with authentication"""
+        if not self.api_token:
+            raise Exception("API token not set!")
+        return {
+            'Authorization': f'Bearer {self.api_token}',
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        }
+
+    def make_api_request(self, method, endpoint, data=None):
+        """Make API request to the Laravel backend"""
+        try:
+            result = self.api.request(method, endpoint, self.get_headers(), data)
+            self.api_online = True
+            return result
+        except requests.exceptions.RequestException as e:
+            # An HTTP error response still means the server is reachable
+            self.api_online = isinstance(e, requests.exceptions.HTTPError)
+            self.notify("API Error", f"Failed to connect to API: {str(e)}", 'error')
+            return None
+        except Exception as e:
+            logger.exception("%s %s failed", method, endpoint)
+            self.notify("Error", f"An error occurred: {str(e)}", 'error')
+            return None
+
+    def perform(self, action):
+        """Run an attendance action; returns (success, message), or None if the request failed"""
+        endpoint, success_message, failure_message = ACTIONS[action]
+        result = self.make_api_request('POST', endpoint)
+        if result and result.get('success'):
+            if action == 'start_break':
+                self.is_break_active = True
+                self.break_start_time = self.clock.now()
+            elif action == 'end_break':
+                self.is_break_active = False
+                self.break_start_time = None
+            self.load_attendance_data()
+            return True, success_message
+        if result:
+            return False, result.get('message', failure_message)
+        return None
+
+    def check_in(self):
+        """Check in for the day"""
+        return self.perform('check_in')
+
+    def check_out(self):
+        """Check out for the day"""
+        return self.perform('check_out')
+
+    def start_break(self):
+        """Start break"""
+        return self.perform('start_break')
+
+    def end_break(self):
+        """End break"""
+        return self.perform('end_break')
+
+    def load_attendance_data(self):
+        """Load today's attendance data; returns False if no API token is set"""
+        if not self.api_token:
+            self.emit('token_missing')
+            return False
+
+        result = self.make_api_request('GET', '/attendance/today')
+        if result and result.get('success'):
+            # Times in the response are wall clock times in the server's timezone
+            self.server_clock.set_timezone(result.get('timezone'))
+            self.current_attendance = AttendanceRecord.from_api(result.get('data'), self.server_clock,
+                                                                result.get('date'))
+        else:
+            self.current_attendance = None
+        self.schedule_timers()
+        self.emit('changed')
+        return True
+
+    def set_api_token(self, token):
+        """Use a new API token and save it to the settings file"""
+        self.api_token = token
+        # Only the token changes; every other setting in the file is kept
+        self.settings_store.save(api_token=token)
+
+    def day_running(self):
+        """Check whether the user is checked in and not yet checked out"""
+        attendance = self.current_attendance
+        return bool(attendance) and attendance.state in ('working', 'on_break')
+
+    def schedule_timers(self):
+        """Reschedule timers after an attendance state change"""
+        self.break_reminder.update(self.current_attendance)
+        self.day_rollover.schedule()
+        self.schedule_tick()
+        self.update_idle_sampler()
+
+    def schedule_tick(self):
+        """Tick on the next minute boundary while the day is running and someone listens"""
+        if self.listeners['tick'] and self.day_running():
+            self.scheduler.schedule(TICK_TIMER, (self.clock.time() // 60 + 1) * 60, self.tick, coalesce=True)
+        else:
+            self.scheduler.cancel(TICK_TIMER)
+
+    def tick(self):
+        """Emit the minute tick and schedule the next one"""
+        if self.power and self.power.suspended():
+            # Nothing is shown while locked; on battery the display can lag behind
+            self.scheduler.schedule_in(TICK_TIMER, SUSPENDED_INTERVAL_SECONDS, self.tick, coalesce=True)
+            return
+        self.emit('tick')
+        self.schedule_tick()
+
+    def roll_over_day(self):
+        """Drop yesterday's attendance and load the new day (runs on the scheduler thread)"""
+        self.current_attendance = None
+        self.load_attendance_data()
+
+    def show_break_reminder(self, title, message):
+        """Show the break reminder (runs on the scheduler thread)"""
+        self.emit('reminder', title, message)
+        self.notify(title, message, 'reminder')
+
+    def apply_settings(self, settings, changed):
+        """Apply settings changed in the settings file (runs on the scheduler thread)"""
+        self.api.base_url = settings.api_base_url
+        self.api_token = settings.api_token
+        self.daily_target_minutes = settings.daily_target_minutes
+        self.break_reminder.after_minutes = settings.auto_start_break_after_minutes
+        self.break_reminder.repeat_minutes = settings.reminder_interval_minutes
+        self.break_reminder.enabled = settings.auto_reminder_enabled
+        if self.power and 'power_saver' in changed:
+            self.power.set_saver(settings.power_saver)
+        if 'log_level' in changed:
+            logs.set_level(settings.log_level)
+        if changed & {'metrics_port', 'metrics_dump_minutes'}:
+            self.metrics_settings = (settings.metrics_port, settings.metrics_dump_minutes)
+            self.metrics_service.configure(*self.metrics_settings)
+
+        self.idle_break_minutes = settings.idle_break_minutes
+        self.create_idle_sampler()
+        if self.idle_sampler and self.idle_break_minutes > 0:
+            self.idle_sampler.threshold_seconds = self.idle_break_minutes * 60
+
+        if changed & {'api_base_url', 'api_token'}:
+            self.load_attendance_data()
+        else:
+            self.schedule_timers()
+        self.emit('settings', settings, changed)
+
+    def create_idle_sampler(self):
+        """Create the idle sampler if automatic breaks are on and idle time is available"""
+        if not self.auto_break or self.idle_sampler or self.idle_break_minutes <= 0:
+            return
+        self.idle_source = self.idle_source or detect_idle_source()
+        if self.idle_source:
+            self.idle_sampler = IdleSampler(self.scheduler, self.idle_source, self.idle_break_minutes * 60,
+                                            self.on_user_idle, self.on_user_active)
+
+    def update_idle_sampler(self):
+        """Sample idle time only while an automatic break could start or end"""
+        if not self.can_end_break():
+            self.auto_break_active = False
+        if not self.idle_sampler:
+            return
+        if self.idle_break_minutes > 0 and (self.auto_break_active or
+                                            (self.can_start_break() and self.can_check_out())):
+            self.idle_sampler.start()
+        else:
+            self.idle_sampler.stop()
+
+    def on_user_idle(self, idle_seconds):
+        """Start a break once the user has been idle long enough (runs on the scheduler thread)"""
+        if self.can_start_break() and self.can_check_out():
+            self.auto_break_active = True
+            self.notify_outcome(self.start_break())
+            if not self.can_end_break():
+                self.auto_break_active = False
+
+    def on_user_active(self, away_seconds):
+        """End an automatic break when the user returns (runs on the scheduler thread)"""
+        if self.auto_break_active and self.can_end_break():
+            self.auto_break_active = False
+            self.notify_outcome(self.end_break())
+
+    def set_power_saver(self, enabled):
+        """Switch power saver mode and re-align the pending timers"""
+        self.power.set_saver(enabled)
+        self.schedule_timers()
+
+    def power_stats(self, ui=None):
+        """Get the engine's wakeup, CPU and network counters"""
+        return self.power.stats(self.api, self.notifications, ui, self.idle_sampler)
+
+    def resource_usage(self):
+        """Get the thread count and this engine's scheduler and API counters"""
+        return {
+            'threads': threading.active_count(),
+            'scheduler': self.scheduler.stats(),
+            'api_calls': self.api.calls,
+        }
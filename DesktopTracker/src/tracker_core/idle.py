@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Idle Detection
+Pluggable idle time sources and an adaptive, low-wakeup idle sampler
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class IdleSource:
+    """Reports how many seconds the user has been idle"""
+
+    name = 'none'
+
+    def idle_seconds(self):
+        raise NotImplementedError
+
+
+class FakeIdleSource(IdleSource):
+    """Idle source driven by tests"""
+
+    name = 'fake'
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.last_input = clock.time()
+
+    def touch(self):
+        """Simulate user input now"""
+        self.last_input = self.clock.time()
+
+    def idle_seconds(self):
+        return max(0.0, self.clock.time() - self.last_input)
+
+
+class WindowsIdleSource(IdleSource):
+    """Idle time from GetLastInputInfo"""
+
+    name = 'windows'
+
+    class LASTINPUTINFO(ctypes.Structure):
+        _fields_ = [('cbSize', ctypes.c_uint), ('dwTime', ctypes.c_uint)]
+
+    def __init__(self):
+        self.user32 = ctypes.windll.user32
+        self.kernel32 = ctypes.windll.kernel32
+        self.info = self.LASTINPUTINFO()
+        self.info.cbSize = ctypes.sizeof(self.info)
+
+    def idle_seconds(self):
+        if not self.user32.GetLastInputInfo(ctypes.byref(self.info)):
+            return 0.0
+        # Both tick counts wrap at 2^32 ms
+        return ((self.kernel32.GetTickCount() - self.info.dwTime) & 0xFFFFFFFF) / 1000
+
+
+class X11IdleSource(IdleSource):
+    """Idle time from the X11 screensaver extension"""
+
+    name = 'x11'
+
+    class XScreenSaverInfo(ctypes.Structure):
+        _fields_ = [('window', ctypes.c_ulong), ('state', ctypes.c_int),
+                    ('kind', ctypes.c_int), ('til_or_since', ctypes.c_ulong),
+                    ('idle', ctypes.c_ulong), ('eventMask', ctypes.c_ulong)]
+
+    def __init__(self):
+        xlib = ctypes.util.find_library('X11')
+        xss = ctypes.util.find_library('Xss')
+        if not xlib or not xss:
+            raise OSError("libX11/libXss not found")
+        self.xlib = ctypes.cdll.LoadLibrary(xlib)
+        self.xss = ctypes.cdll.LoadLibrary(xss)
+        self.xlib.XOpenDisplay.restype = ctypes.c_void_p
+        self.xlib.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        self.xlib.XDefaultRootWindow.restype = ctypes.c_ulong
+        self.xss.XScreenSaverAllocInfo.restype = ctypes.POINTER(self.XScreenSaverInfo)
+        self.xss.XScreenSaverQueryInfo.argtypes = [ctypes.c_void_p, ctypes.c_ulong,
+                                                   ctypes.POINTER(self.XScreenSaverInfo)]
+
+        # The display connection is opened once and reused for every sample
+        self.display = self.xlib.XOpenDisplay(None)
+        if not self.display:
+            raise OSError("Cannot open X display")
+        self.root = self.xlib.XDefaultRootWindow(self.display)
+        self.info = self.xss.XScreenSaverAllocInfo()
+
+    def idle_seconds(self):
+        self.xss.XScreenSaverQueryInfo(self.display, self.root, self.info)
+        return self.info.contents.idle / 1000
+
+
+class WaylandIdleSource(IdleSource):
+    """Idle time from the GNOME Mutter idle monitor over D-Bus"""
+
+    name = 'wayland'
+
+    COMMAND = ['gdbus', 'call', '--session',
+               '--dest', 'org.gnome.Mutter.IdleMonitor',
+               '--object-path', '/org/gnome/Mutter/IdleMonitor/Core',
+               '--method', 'org.gnome.Mutter.IdleMonitor.GetIdletime']
+
+    def __init__(self):
+        if not shutil.which('gdbus'):
+            raise OSError("gdbus not found")
+        # Fail early if the compositor doesn't provide the idle monitor
+        self.idle_seconds()
+
+    def idle_seconds(self):
+        output = subprocess.run(self.COMMAND, capture_output=True, text=True,
+                                timeout=5, check=True).stdout
+        match = re.search(r'(\d+)', output)
+        if not match:
+            raise OSError(f"Unexpected idle monitor reply: {output!r}")
+        return int(match.group(1)) / 1000
+
+
+def detect_idle_source():
+    """Get the idle source for this desktop, or None if idle time is unavailable"""
+    if sys.platform == 'win32':
+        candidates = [WindowsIdleSource]
+    elif os.getenv('WAYLAND_DISPLAY'):
+        # XWayland only sees input to X clients, so prefer the compositor
+        candidates = [WaylandIdleSource, X11IdleSource]
+    elif os.getenv('DISPLAY'):
+        candidates = [X11IdleSource]
+    else:
+        candidates = []
+
+    for source_class in candidates:
+        try:
+            return source_class()
+        except Exception:
+            continue
+    return None
+
+
+class IdleSampler:
+    """Samples idle time only as often as the idle state can actually change
+
+    While the user is active, the next sample is taken when the idle
+    threshold could first be reached (threshold minus current idle time),
+    so sampling cost doesn't depend on how often input happens. While
+    idle, the interval backs off until input is seen again.
+    """
+
+    TIMER = 'idle-sampler'
+
+    def __init__(self, scheduler, source, threshold_seconds, on_idle, on_active,
+                 min_interval=5, max_interval=60):
+        self.scheduler = scheduler
+        self.source = source
+        self.threshold_seconds = threshold_seconds
+        self.on_idle = on_idle
+        self.on_active = on_active
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+        self.running = False
+        self.is_idle = False
+        self.idle_started = None
+        self.interval = min_interval
+
+        self.samples = 0
+        self.cpu_seconds = 0.0
+        self.errors = 0
+        self.started_at = None
+
+    def start(self):
+        """Start sampling"""
+        if self.running:
+            return
+        self.running = True
+        self.started_at = self.scheduler.clock.monotonic()
+        self.scheduler.schedule_in(self.TIMER, 0, self._sample)
+
+    def stop(self):
+        """Stop sampling"""
+        self.running = False
+        self.is_idle = False
+        self.scheduler.cancel(self.TIMER)
+
+    def _sample(self):
+        """Take one sample and schedule the next one"""
+        if not self.running:
+            return
+
+        started = time.thread_time()
+        try:
+            idle = self.source.idle_seconds()
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Idle sampling error: %s", e)
+            self.scheduler.schedule_in(self.TIMER, self.max_interval, self._sample)
+            return
+        finally:
+            self.samples += 1
+            self.cpu_seconds += time.thread_time() - started
+
+        now = self.scheduler.clock.time()
+        if not self.is_idle:
+            if idle >= self.threshold_seconds:
+                self.is_idle = True
+                self.idle_started = now - idle
+                self.interval = self.min_interval
+                self.on_idle(idle)
+                delay = self.interval
+            else:
+                # Idle time can't reach the threshold any sooner than this
+                delay = max(self.min_interval, self.threshold_seconds - idle)
+        else:
+            if idle + self.min_interval < now - self.idle_started:
+                # Input happened since the idle period started
+                self.is_idle = False
+                self.on_active(now - self.idle_started - idle)
+                delay = max(self.min_interval, self.threshold_seconds - idle)
+            else:
+                self.interval = min(self.interval * 2, self.max_interval)
+                delay = self.interval
+
+        if self.running:
+            self.scheduler.schedule_in(self.TIMER, delay, self._sample)
+
+    def stats(self):
+        """Get the sampler's wakeup and CPU cost"""
+        running_for = (self.scheduler.clock.monotonic() - self.started_at) if self.started_at else 0
+        hours = running_for / 3600
+        return {
+            'source': self.source.name,
+            'samples': self.samples,
+            'errors': self.errors,
+            'cpu_ms': round(self.cpu_seconds * 1000, 3),
+            'samples_per_hour': round(self.samples / hours, 1) if hours else 0.0,
+            'idle': self.is_idle,
+        }
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Logging
+JSON log lines written from a background thread, rotated by size and age and compressed once rotated
+"""
+
+import atexit
+import contextlib
+import contextvars
+import copy
+import json
+import logging
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+
+from .settings import config_dir
+
+# Set to a folder to write the logs somewhere other than the config directory
+LOG_DIR_VARIABLE = 'EMPLOYEE_TRACKER_LOG_DIR'
+
+# Rotate when the file reaches this size or this age, whichever comes first,
+# and keep this many compressed files per front-end
+MAX_BYTES = 1024 * 1024
+MAX_AGE_SECONDS = 24 * 3600
+BACKUP_COUNT = 7
+
+# Warnings and errors are also shown on stderr for runs from a terminal
+CONSOLE_LEVEL = logging.WARNING
+
+# Sent with every API request and logged on both sides, so client and Laravel logs can be matched
+CORRELATION_HEADER = 'X-Request-Id'
+
+# LogRecord attributes that are not extra fields
+RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {'message', 'asctime', 'correlation_id'}
+
+correlation_id = contextvars.ContextVar('correlation_id', default=None)
+listener = None
+
+
+def log_dir():
+    """Get the folder the log files are written to"""
+    return os.getenv(LOG_DIR_VARIABLE) or os.path.join(config_dir(), 'logs')
+
+
+def new_correlation_id():
+    """Get a fresh id for one request"""
+    return uuid.uuid4().hex
+
+
+@contextlib.contextmanager
+def correlation(request_id):
+    """Tag every log record made in this block with a correlation id"""
+    token = correlation_id.set(request_id)
+    try:
+        yield request_id
+    finally:
+        correlation_id.reset(token)
+
+
+class CorrelationFilter(logging.Filter):
+    """Copies the current correlation id onto the record in the calling thread, before it is queued"""
+
+    def filter(self, record):
+        if not hasattr(record, 'correlation_id'):
+            record.correlation_id = correlation_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, thread, message, correlation id and extra fields"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if getattr(record, 'correlation_id', None):
+            entry['correlation_id'] = record.correlation_id
+        for key, value in vars(record).items():
+            if key not in RECORD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+def compress_rotated(source, dest):
+    """Gzip a rotated log file and remove the original"""
+    import gzip
+    import shutil
+
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+
+def create_file_handler(path, max_bytes=MAX_BYTES, max_age_seconds=MAX_AGE_SECONDS, backup_count=BACKUP_COUNT):
+    """Create a handler that rotates by size and age and compresses the rotated files"""
+    from logging.handlers import RotatingFileHandler
+
+    class RotatingJsonFileHandler(RotatingFileHandler):
+        """Size rotation from RotatingFileHandler plus a maximum file age"""
+
+        def __init__(self):
+            super().__init__(path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True)
+            self.namer = lambda name: name + '.gz'
+            self.rotator = compress_rotated
+            # A file left over from the last run keeps its age
+            started = os.path.getmtime(path) if os.path.exists(path) else time.time()
+            self.rollover_at = started + max_age_seconds
+
+        def shouldRollover(self, record):
+            if time.time() >= self.rollover_at and os.path.exists(self.baseFilename):
+                return True
+            return super().shouldRollover(record)
+
+        def doRollover(self):
+            super().doRollover()
+            self.rollover_at = time.time() + max_age_seconds
+
+    return RotatingJsonFileHandler()
+
+
+def queue_handler(records):
+    """Create a handler that puts records on a queue without formatting them"""
+    from logging.handlers import QueueHandler
+
+    class StructuredQueueHandler(QueueHandler):
+        """Keeps extra fields and the traceback apart from the message, unlike QueueHandler.prepare"""
+
+        def prepare(self, record):
+            record = copy.copy(record)
+            record.msg = record.getMessage()
+            record.args = None
+            if record.exc_info:
+                # Tracebacks can't be pickled or outlive their frames; the text is enough
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+                record.exc_info = None
+            return record
+
+    return StructuredQueueHandler(records)
+
+
+def setup_logging(name, level=logging.INFO, directory=None):
+    """Send every log record to logs/<name>.log through a queue drained by one background thread"""
+    global listener
+    import queue
+    from logging.handlers import QueueListener
+
+    if listener:
+        return listener
+
+    directory = directory or log_dir()
+    handlers = []
+    try:
+        os.makedirs(directory, exist_ok=True)
+        file_handler = create_file_handler(os.path.join(directory, f'{name}.log'))
+        file_handler.setFormatter(JsonFormatter())
+        handlers.append(file_handler)
+    except OSError as e:
+        print(f"Log files unavailable, logging to the console only: {e}", file=sys.stderr)
+    console = logging.StreamHandler()
+    console.setLevel(CONSOLE_LEVEL)
+    console.setFormatter(logging.Formatter('%(levelname)s %(name)s: %(message)s'))
+    handlers.append(console)
+
+    # The calling thread only puts the record on the queue; formatting and disk I/O happen on the listener thread
+    records = queue.SimpleQueue()
+    handler = queue_handler(records)
+    handler.addFilter(CorrelationFilter())
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(level)
+
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(stop_logging)
+    return listener
+
+
+def set_level(level_name):
+    """Change the root log level, e.g. from the LOG_LEVEL setting"""
+    level = logging.getLevelName(str(level_name).upper())
+    if not isinstance(level, int):
+        logging.getLogger(__name__).warning("Unknown log level %r", level_name)
+        return
+    logging.getLogger().setLevel(level)
+
+
+def stop_logging():
+    """Write out everything still queued and stop the logging thread"""
+    global listener
+    if listener:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+        listener = None
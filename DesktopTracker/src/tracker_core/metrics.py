@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Metrics
+Client-side request metrics with an opt-in localhost Prometheus endpoint and periodic dumps to disk
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the API latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Metric name -> (type, help text)
+METRICS = {
+    'tracker_api_request_duration_seconds': ('histogram', "API request latency until the response arrived"),
+    'tracker_api_responses_total': ('counter', "API responses by HTTP status code"),
+    'tracker_api_errors_total': ('counter', "API requests that got no response, by error type"),
+    'tracker_cache_requests_total': ('counter', "Cache lookups by cache and result (hit or miss)"),
+    'tracker_queue_depth': ('gauge', "Items waiting in a client queue"),
+}
+
+# The exporter only ever listens on the loopback interface
+EXPORTER_HOST = '127.0.0.1'
+DUMP_FILE = 'metrics.json'
+DUMP_TIMER = 'metrics-dump'
+
+
+def escape_label(value):
+    """Escape a label value for the exposition format"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(labels):
+    """Render a label tuple as {name="value",...}"""
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{escape_label(value)}"' for name, value in labels) + '}'
+
+
+def format_number(value):
+    """Render a sample value the way Prometheus expects"""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    """Thread-safe counters, histograms and gauges; gauges are read from callbacks when rendered"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.lock = threading.Lock()
+        # name -> {label tuple: value}
+        self.counters = {}
+        # name -> {label tuple: [bucket counts..., sum, count]}
+        self.histograms = {}
+        # name -> [(labels, callback), ...]
+        self.gauges = {}
+
+    def inc(self, name, amount=1, **labels):
+        """Add to a counter"""
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        """Record one histogram observation"""
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            series = self.histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = [0] * len(self.buckets) + [0.0, 0]
+            data = series[key]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    data[index] += 1
+            data[-2] += value
+            data[-1] += 1
+
+    def gauge(self, name, callback, **labels):
+        """Read a gauge from callback() whenever the metrics are rendered or dumped"""
+        with self.lock:
+            self.gauges.setdefault(name, []).append((tuple(sorted(labels.items())), callback))
+
+    def value(self, name, **labels):
+        """Get a counter value, or a histogram's observation count"""
+        key = tuple(sorted(labels.items()))
+        with self.lock:
+            if name in self.histograms:
+                data = self.histograms[name].get(key)
+                return data[-1] if data else 0
+            return self.counters.get(name, {}).get(key, 0)
+
+    def read_gauges(self):
+        """Call every gauge callback; returns {name: {labels: value}}"""
+        with self.lock:
+            gauges = {name: list(entries) for name, entries in self.gauges.items()}
+        values = {}
+        for name, entries in gauges.items():
+            for labels, callback in entries:
+                try:
+                    values.setdefault(name, {})[labels] = callback()
+                except Exception as e:
+                    logger.warning("Metrics gauge error (%s): %s", name, e)
+        return values
+
+    def render(self):
+        """Get every metric in the Prometheus text exposition format"""
+        gauges = self.read_gauges()
+        with self.lock:
+            counters = {name: dict(series) for name, series in self.counters.items()}
+            histograms = {name: {key: list(data) for key, data in series.items()}
+                          for name, series in self.histograms.items()}
+
+        lines = []
+        for name in sorted(set(counters) | set(histograms) | set(gauges)):
+            kind, help_text = METRICS.get(name, ('untyped', name))
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in sorted(counters.get(name, {}).items()):
+                lines.append(f"{name}{format_labels(labels)} {format_number(value)}")
+            for labels, value in sorted(gauges.get(name, {}).items()):
+                lines.append(f"{name}{format_labels(labels)} {format_number(value)}")
+            for labels, data in sorted(histograms.get(name, {}).items()):
+                # Every observation is counted in each bucket it fits, so the counts are already cumulative
+                for bound, count in zip(self.buckets, data[:-2]):
+                    le = labels + (('le', format_number(float(bound))),)
+                    lines.append(f"{name}_bucket{format_labels(le)} {count}")
+                lines.append(f"{name}_bucket{format_labels(labels + (('le', '+Inf'),))} {data[-1]}")
+                lines.append(f"{name}_sum{format_labels(labels)} {format_number(data[-2])}")
+                lines.append(f"{name}_count{format_labels(labels)} {data[-1]}")
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self):
+        """Get every metric as JSON-friendly data"""
+        def series(entries):
+            return [dict(labels, value=value) for labels, value in sorted(entries.items())]
+
+        gauges = self.read_gauges()
+        with self.lock:
+            return {
+                'counters': {name: series(entries) for name, entries in self.counters.items()},
+                'gauges': {name: series(entries) for name, entries in gauges.items()},
+                'histograms': {
+                    name: [dict(labels, buckets=dict(zip((str(bound) for bound in self.buckets), data[:-2])),
+                                sum=round(data[-2], 6), count=data[-1])
+                           for labels, data in sorted(entries.items())]
+                    for name, entries in self.histograms.items()
+                },
+            }
+
+
+class MetricsExporter:
+    """Serves the registry at http://127.0.0.1:<port>/metrics on a background thread"""
+
+    def __init__(self, registry, port):
+        self.registry = registry
+        self.port = port
+        self.server = None
+        self.thread = None
+
+    def start(self):
+        """Start listening; returns False if the port can't be bound"""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        try:
+            self.server = ThreadingHTTPServer((EXPORTER_HOST, self.port), Handler)
+        except OSError as e:
+            logger.error("Metrics exporter cannot listen on %s:%s: %s", EXPORTER_HOST, self.port, e)
+            return False
+        self.server.daemon_threads = True
+        # Port 0 picks a free port
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, name="metrics-exporter", daemon=True)
+        self.thread.start()
+        return True
+
+    def stop(self):
+        """Stop listening"""
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+class MetricsService:
+    """Runs the exporter and the periodic dump as the settings ask; both are off by default"""
+
+    def __init__(self, registry, scheduler, dump_path):
+        self.registry = registry
+        self.scheduler = scheduler
+        self.dump_path = dump_path
+        self.exporter = None
+        self.port = 0
+        self.dump_minutes = 0
+        self.dumps = 0
+
+    def configure(self, port, dump_minutes):
+        """Start, restart or stop the exporter and the dump timer for new settings"""
+        if port != self.port or (port and not self.exporter):
+            if self.exporter:
+                self.exporter.stop()
+                self.exporter = None
+            if port > 0:
+                exporter = MetricsExporter(self.registry, port)
+                if exporter.start():
+                    self.exporter = exporter
+            self.port = port
+
+        if dump_minutes != self.dump_minutes:
+            self.dump_minutes = dump_minutes
+            if dump_minutes > 0:
+                self.scheduler.schedule_in(DUMP_TIMER, dump_minutes * 60, self.dump, coalesce=True)
+            else:
+                self.scheduler.cancel(DUMP_TIMER)
+
+    def dump(self):
+        """Write a snapshot to the dump file and schedule the next one (runs on the scheduler thread)"""
+        if self.dump_minutes > 0:
+            self.scheduler.schedule_in(DUMP_TIMER, self.dump_minutes * 60, self.dump, coalesce=True)
+        snapshot = self.registry.snapshot()
+        snapshot['time'] = self.scheduler.clock.time()
+        try:
+            directory = os.path.dirname(self.dump_path) or '.'
+            os.makedirs(directory, exist_ok=True)
+            # Written next to the target and renamed, so a collector never reads half a file
+            fd, temp_path = tempfile.mkstemp(prefix='.metrics-', dir=directory)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(snapshot, f, indent=2)
+            os.replace(temp_path, self.dump_path)
+            self.dumps += 1
+        except OSError as e:
+            logger.warning("Metrics dump error: %s", e)
+
+    def stop(self):
+        """Stop the exporter and write a last dump if dumps are on"""
+        if self.exporter:
+            self.exporter.stop()
+            self.exporter = None
+        self.port = 0
+        if self.dump_minutes > 0:
+            self.dump_minutes = 0
+            self.scheduler.cancel(DUMP_TIMER)
+            self.dump()
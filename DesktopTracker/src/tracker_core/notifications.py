@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Notifications
+Notification queue with de-duplication, burst coalescing and per-category rate limits
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Maximum notifications per window (count, seconds) for each category
+RATE_LIMITS = {
+    'error': (3, 300),
+    'reminder': (2, 600),
+    'success': (10, 60),
+    'info': (5, 60),
+}
+
+# How long to collect a burst before delivering it as one notification.
+# Only errors are held back; user-triggered feedback is shown immediately.
+BURST_SECONDS = {
+    'error': 2.0,
+}
+
+# Identical reminders and errors within this window are dropped; feedback
+# the user asked for, like a check-in confirmation, is always shown
+DEDUPE_SECONDS = 300
+DEDUPE_CATEGORIES = ('error', 'reminder')
+
+
+class NotificationQueue:
+    """Delivers notifications on a worker thread after filtering and coalescing them"""
+
+    def __init__(self, deliver, rate_limits=None, burst_seconds=None,
+                 dedupe_seconds=DEDUPE_SECONDS, clock=time.monotonic, dedupe_categories=DEDUPE_CATEGORIES):
+        self.deliver = deliver
+        self.rate_limits = rate_limits or RATE_LIMITS
+        self.burst_seconds = BURST_SECONDS if burst_seconds is None else burst_seconds
+        self.dedupe_seconds = dedupe_seconds
+        self.dedupe_categories = dedupe_categories
+        self.clock = clock
+
+        # category -> (due time, [(title, message), ...])
+        self.pending = {}
+        self.recent = {}
+        self.sent = {}
+        self.counters = {
+            'posted': 0,
+            'delivered': 0,
+            'duplicates': 0,
+            'coalesced': 0,
+            'rate_limited': 0,
+        }
+
+        self.condition = threading.Condition()
+        self.running = False
+        self.thread = None
+        self.wakeups = 0
+
+    def start(self):
+        """Start the delivery thread"""
+        with self.condition:
+            if self.running:
+                return
+            self.running = True
+        self.thread = threading.Thread(target=self._run, name="notifications", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop the delivery thread, dropping anything still pending"""
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+
+    def post(self, title, message, category='info'):
+        """Queue a notification; returns False if it was dropped as a duplicate"""
+        if not self.running:
+            self.start()
+
+        with self.condition:
+            self.counters['posted'] += 1
+            now = self.clock()
+            key = (title, message)
+
+            if category in self.dedupe_categories:
+                last_sent = self.recent.get(key)
+                queued = key in self.pending.get(category, (None, []))[1]
+                if queued or (last_sent is not None and now - last_sent < self.dedupe_seconds):
+                    self.counters['duplicates'] += 1
+                    return False
+
+            if category not in self.pending:
+                self.pending[category] = (now + self.burst_seconds.get(category, 0), [])
+            self.pending[category][1].append(key)
+            self.condition.notify()
+            return True
+
+    def depth(self):
+        """Get the number of notifications waiting for delivery"""
+        with self.condition:
+            return sum(len(items) for _, items in self.pending.values())
+
+    def _run(self):
+        """Deliver due batches until stopped"""
+        while True:
+            with self.condition:
+                batch = self._next_batch()
+                if batch is None:
+                    return
+                ready = self._prepare(batch)
+
+            # Deliver outside the lock so a slow backend never blocks post()
+            for title, message, category in ready:
+                try:
+                    self.deliver(title, message, category)
+                except Exception as e:
+                    logger.exception("Notification error: %s", e)
+
+    def _next_batch(self):
+        """Wait until at least one category is due and take it (lock held)"""
+        while self.running:
+            if not self.pending:
+                self.condition.wait()
+                self.wakeups += 1
+                continue
+
+            now = self.clock()
+            due = [category for category, (due_at, _) in self.pending.items() if due_at <= now]
+            if due:
+                return [(category, self.pending.pop(category)[1]) for category in due]
+
+            next_due = min(due_at for due_at, _ in self.pending.values())
+            self.condition.wait(next_due - now)
+            self.wakeups += 1
+        return None
+
+    def _prepare(self, batch):
+        """Coalesce and rate limit a batch into (title, message, category) tuples (lock held)"""
+        now = self.clock()
+        if len(self.recent) > 100:
+            self.recent = {key: sent_at for key, sent_at in self.recent.items()
+                           if now - sent_at < self.dedupe_seconds}
+
+        ready = []
+        for category, items in batch:
+            if category in self.dedupe_categories:
+                for key in items:
+                    self.recent[key] = now
+
+            title, message = items[0]
+            if len(items) > 1:
+                # One summary instead of a toast per message
+                self.counters['coalesced'] += len(items) - 1
+                title = f"{title} (+{len(items) - 1} more)"
+
+            if not self._allow(category, now):
+                self.counters['rate_limited'] += 1
+                continue
+
+            self.counters['delivered'] += 1
+            ready.append((title, message, category))
+        return ready
+
+    def _allow(self, category, now):
+        """Check and record the rate limit for a category (lock held)"""
+        limit, window = self.rate_limits.get(category, self.rate_limits['info'])
+        sent = self.sent.setdefault(category, deque())
+        while sent and now - sent[0] >= window:
+            sent.popleft()
+        if len(sent) >= limit:
+            return False
+        sent.append(now)
+        return True
+
+    def stats(self):
+        """Get the notification counters, including how many were suppressed"""
+        with self.condition:
+            stats = dict(self.counters)
+            stats['suppressed'] = stats['duplicates'] + stats['coalesced'] + stats['rate_limited']
+            stats['pending'] = sum(len(items) for _, items in self.pending.values())
+            return stats
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Power Management
+Wakeup, CPU and network accounting, and a power saver mode for the background service
+"""
+
+import ctypes
+import glob
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+# In power saver mode the deadlines of deferrable timers (the tick, the metrics
+# dump and the day rollover) are rounded up to multiples of this, so they share one wakeup
+COALESCE_SECONDS = 300
+
+# How long a battery/lock reading is trusted before it is read again
+STATE_CACHE_SECONDS = 60
+
+# Deferrable work runs this often while the session is locked or on battery
+SUSPENDED_INTERVAL_SECONDS = 900
+
+
+class PowerSource:
+    """Reports whether the machine is on battery and whether the session is locked"""
+
+    name = 'none'
+
+    def on_battery(self):
+        return False
+
+    def session_locked(self):
+        return False
+
+
+class FakePowerSource(PowerSource):
+    """Power source driven by tests"""
+
+    name = 'fake'
+
+    def __init__(self, battery=False, locked=False):
+        self.battery = battery
+        self.locked = locked
+
+    def on_battery(self):
+        return self.battery
+
+    def session_locked(self):
+        return self.locked
+
+
+class WindowsPowerSource(PowerSource):
+    """Battery state from GetSystemPowerStatus and lock state from the input desktop"""
+
+    name = 'windows'
+
+    class SYSTEM_POWER_STATUS(ctypes.Structure):
+        _fields_ = [('ACLineStatus', ctypes.c_ubyte), ('BatteryFlag', ctypes.c_ubyte),
+                    ('BatteryLifePercent', ctypes.c_ubyte), ('SystemStatusFlag', ctypes.c_ubyte),
+                    ('BatteryLifeTime', ctypes.c_ulong), ('BatteryFullLifeTime', ctypes.c_ulong)]
+
+    DESKTOP_SWITCHDESKTOP = 0x0100
+
+    def __init__(self):
+        self.user32 = ctypes.windll.user32
+        self.kernel32 = ctypes.windll.kernel32
+        self.status = self.SYSTEM_POWER_STATUS()
+
+    def on_battery(self):
+        if not self.kernel32.GetSystemPowerStatus(ctypes.byref(self.status)):
+            return False
+        return self.status.ACLineStatus == 0
+
+    def session_locked(self):
+        # The input desktop can't be opened or switched to while the session is locked
+        desktop = self.user32.OpenInputDesktop(0, False, self.DESKTOP_SWITCHDESKTOP)
+        if not desktop:
+            return True
+        try:
+            return not self.user32.SwitchDesktop(desktop)
+        finally:
+            self.user32.CloseDesktop(desktop)
+
+
+class LinuxPowerSource(PowerSource):
+    """Battery state from sysfs and lock state from logind"""
+
+    name = 'linux'
+
+    def __init__(self):
+        self.supplies = glob.glob('/sys/class/power_supply/*')
+        self.loginctl = shutil.which('loginctl')
+        self.session = os.getenv('XDG_SESSION_ID', 'auto')
+
+    def _read(self, supply, attribute):
+        try:
+            with open(os.path.join(supply, attribute)) as f:
+                return f.read().strip()
+        except OSError:
+            return ''
+
+    def on_battery(self):
+        for supply in self.supplies:
+            if self._read(supply, 'type') == 'Mains' and self._read(supply, 'online') == '1':
+                return False
+        return any(self._read(supply, 'type') == 'Battery' and self._read(supply, 'status') == 'Discharging'
+                   for supply in self.supplies)
+
+    def session_locked(self):
+        if not self.loginctl:
+            return False
+        output = subprocess.run([self.loginctl, 'show-session', self.session, '-p', 'LockedHint', '--value'],
+                                capture_output=True, text=True, timeout=5).stdout
+        return output.strip() == 'yes'
+
+
+class MacPowerSource(PowerSource):
+    """Battery state from pmset; the lock state isn't available without extra frameworks"""
+
+    name = 'macos'
+
+    def on_battery(self):
+        output = subprocess.run(['pmset', '-g', 'batt'], capture_output=True, text=True, timeout=5).stdout
+        return "'Battery Power'" in output
+
+
+def detect_power_source():
+    """Get the power source for this platform"""
+    try:
+        if sys.platform == 'win32':
+            return WindowsPowerSource()
+        if sys.platform == 'darwin':
+            return MacPowerSource()
+        return LinuxPowerSource()
+    except Exception:
+        return PowerSource()
+
+
+class PowerManager:
+    """Switches the scheduler into power saver mode and accounts for the client's wakeups"""
+
+    def __init__(self, scheduler, source=None, saver=False, coalesce_seconds=COALESCE_SECONDS, metrics=None):
+        self.scheduler = scheduler
+        self.metrics = metrics
+        self.clock = scheduler.clock
+        self.source = source or PowerSource()
+        self.coalesce_seconds = coalesce_seconds
+        self.saver = False
+        self.state = None
+        self.state_read_at = None
+        self.errors = 0
+        self.started_at = self.clock.monotonic()
+        self.cpu_started = time.process_time()
+        self.set_saver(saver)
+
+    def set_saver(self, enabled):
+        """Turn power saver mode on or off; applies to timers scheduled from now on"""
+        self.saver = enabled
+        self.scheduler.coalesce_seconds = self.coalesce_seconds if enabled else 0
+
+    def read_state(self):
+        """Get (on_battery, session_locked), reading the platform at most once per cache window"""
+        now = self.clock.monotonic()
+        hit = self.state is not None and now - self.state_read_at < STATE_CACHE_SECONDS
+        if self.metrics:
+            self.metrics.inc('tracker_cache_requests_total', cache='power_state', result='hit' if hit else 'miss')
+        if not hit:
+            try:
+                self.state = (self.source.on_battery(), self.source.session_locked())
+            except Exception as e:
+                self.errors += 1
+                logger.warning("Power state error: %s", e)
+                self.state = (False, False)
+            self.state_read_at = now
+        return self.state
+
+    def suspended(self):
+        """Check whether deferrable work should be skipped right now"""
+        if not self.saver:
+            return False
+        on_battery, locked = self.read_state()
+        return on_battery or locked
+
+    def stats(self, api=None, notifications=None, ui=None, idle_sampler=None):
+        """Get wakeups, CPU time and network calls, in total and per hour"""
+        hours = (self.clock.monotonic() - self.started_at) / 3600
+        scheduler = self.scheduler.stats()
+        wakeups = {'scheduler': scheduler['wakeups']}
+        if notifications:
+            wakeups['notifications'] = notifications.wakeups
+        if ui:
+            wakeups['ui'] = ui.wakeups
+
+        def per_hour(value):
+            return round(value / hours, 1) if hours else 0.0
+
+        stats = {
+            'mode': 'power saver' if self.saver else 'normal',
+            'source': self.source.name,
+            'suspended': self.suspended(),
+            'hours': round(hours, 2),
+            'wakeups': wakeups,
+            'wakeups_per_hour': per_hour(sum(wakeups.values())),
+            'timers_run': scheduler['timers_run'],
+            'scheduler_cpu_ms': scheduler['cpu_ms'],
+            'process_cpu_ms': round((time.process_time() - self.cpu_started) * 1000, 1),
+            'network_calls': api.calls if api else 0,
+            'network_calls_per_hour': per_hour(api.calls) if api else 0.0,
+        }
+        if idle_sampler:
+            stats['idle_samples_per_hour'] = idle_sampler.stats()['samples_per_hour']
+        return stats
+
+
+def format_report(stats):
+    """Format power stats as a short multi-line report"""
+    wakeups = ", ".join(f"{name} {count}" for name, count in stats['wakeups'].items())
+    lines = [
+        f"Mode: {stats['mode']}{' (suspended)' if stats['suspended'] else ''}",
+        f"Running: {stats['hours']} h",
+        f"Wakeups: {stats['wakeups_per_hour']}/h ({wakeups})",
+        f"Timers run: {stats['timers_run']}",
+        f"CPU: {stats['process_cpu_ms']} ms total, {stats['scheduler_cpu_ms']} ms in timers",
+        f"Network calls: {stats['network_calls']} ({stats['network_calls_per_hour']}/h)",
+    ]
+    if 'idle_samples_per_hour' in stats:
+        lines.append(f"Idle samples: {stats['idle_samples_per_hour']}/h")
+    return "\n".join(lines)
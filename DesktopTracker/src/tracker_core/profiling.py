@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Profiling
+Time-boxed cProfile and tracemalloc captures of a running client, written as reports to the logs folder
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+
+from . import logs
+
+logger = logging.getLogger(__name__)
+
+# Set to a number of seconds to profile the launch and then the running app,
+# e.g. EMPLOYEE_TRACKER_PROFILE=120; any other non-empty value uses DEFAULT_SECONDS
+PROFILE_VARIABLE = 'EMPLOYEE_TRACKER_PROFILE'
+
+DEFAULT_SECONDS = 60
+MAX_SECONDS = 600
+
+# Stack depth kept per allocation, and how much of each report is written
+TRACEMALLOC_FRAMES = 10
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 30
+
+START_TIMER = 'profile-start'
+STOP_TIMER = 'profile-stop'
+
+# cProfile hooks every thread since Python 3.12; before that it only sees the
+# thread that enabled it, so captures run on the scheduler thread, where timers,
+# settings reloads and tray icon updates happen. The UI, notification and tray
+# threads are not in those captures, which the menu item and reports say.
+ALL_THREADS = sys.version_info >= (3, 12)
+CAPTURE_SCOPE = "all threads" if ALL_THREADS else "the scheduler thread"
+
+launch_capture = None
+launch_seconds = None
+
+
+def requested_seconds(value=None):
+    """Get the capture length asked for by EMPLOYEE_TRACKER_PROFILE, or None if profiling is off"""
+    value = os.getenv(PROFILE_VARIABLE, '') if value is None else value
+    if not value.strip() or value.strip().lower() in ('0', 'false', 'no', 'off'):
+        return None
+    try:
+        seconds = int(value)
+    except ValueError:
+        return DEFAULT_SECONDS
+    return max(1, min(seconds, MAX_SECONDS))
+
+
+class ProfileCapture:
+    """One cProfile run plus a tracemalloc snapshot diff; start and stop it on the same thread"""
+
+    def __init__(self, name, directory=None):
+        self.name = name
+        self.directory = directory
+        self.profiler = None
+        self.snapshot = None
+        self.own_tracemalloc = False
+        self.label = None
+        self.started_at = None
+        self.reports = []
+
+    @property
+    def running(self):
+        """Check whether a capture is in progress"""
+        return self.profiler is not None
+
+    def start(self, label='capture'):
+        """Start profiling and tracing allocations; returns False if a capture is already running"""
+        if self.running:
+            return False
+        import cProfile
+        import tracemalloc
+
+        self.own_tracemalloc = not tracemalloc.is_tracing()
+        if self.own_tracemalloc:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        self.snapshot = tracemalloc.take_snapshot()
+        self.label = label
+        self.started_at = time.time()
+        self.profiler = cProfile.Profile()
+        try:
+            self.profiler.enable()
+        except ValueError as e:
+            # Another profiler is active, e.g. a debugger
+            logger.warning("Profiling unavailable: %s", e)
+            self.profiler = None
+            self._stop_tracemalloc()
+            return False
+        logger.info("Profiling started (%s)", label)
+        return True
+
+    def stop(self):
+        """Stop the capture and write its reports; returns the report paths"""
+        if not self.running:
+            return []
+        import tracemalloc
+
+        self.profiler.disable()
+        profiler, self.profiler = self.profiler, None
+        started, snapshot = self.snapshot, tracemalloc.take_snapshot()
+        traced, peak = tracemalloc.get_traced_memory()
+        self._stop_tracemalloc()
+
+        directory = self.directory or logs.log_dir()
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(self.started_at))
+        base = os.path.join(directory, f'profile-{self.name}-{stamp}-{self.label}')
+        try:
+            os.makedirs(directory, exist_ok=True)
+            profiler.dump_stats(base + '.pstats')
+            self._write_profile(profiler, base + '-profile.txt')
+            self._write_allocations(started, snapshot, traced, peak, base + '-allocations.txt')
+        except OSError as e:
+            logger.error("Profile reports could not be written: %s", e)
+            return []
+        self.reports = [base + '.pstats', base + '-profile.txt', base + '-allocations.txt']
+        logger.info("Profile written to %s.*", base)
+        return self.reports
+
+    def _stop_tracemalloc(self):
+        """Stop tracing allocations unless something else started it"""
+        import tracemalloc
+
+        if self.own_tracemalloc:
+            tracemalloc.stop()
+        self.snapshot = None
+
+    def _header(self):
+        """Lines that describe the capture"""
+        seconds = time.time() - self.started_at
+        threads = "all threads" if ALL_THREADS else f"the {threading.current_thread().name} thread"
+        return [f"Employee Tracker {self.name} ({self.label}), {seconds:.1f} s of {threads}",
+                f"Started {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.started_at))}, "
+                f"Python {sys.version.split()[0]}", ""]
+
+    def _write_profile(self, profiler, path):
+        """Write the functions with the most cumulative time"""
+        import io
+        import pstats
+
+        output = io.StringIO()
+        stats = pstats.Stats(profiler, stream=output)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(self._header()) + '\n')
+            f.write(output.getvalue())
+
+    def _write_allocations(self, started, snapshot, traced, peak, path):
+        """Write where memory grew during the capture"""
+        import tracemalloc
+
+        # The tracer's own bookkeeping is not the app's memory
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        differences = snapshot.filter_traces(ignore).compare_to(started.filter_traces(ignore), 'lineno')
+        lines = self._header()
+        lines.append(f"Traced memory: {traced / 1024:.1f} KiB now, {peak / 1024:.1f} KiB peak")
+        lines.append(f"Top {TOP_ALLOCATIONS} allocation changes since the capture started:")
+        lines.extend(str(difference) for difference in differences[:TOP_ALLOCATIONS])
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+
+def schedule_capture(capture, scheduler, seconds=DEFAULT_SECONDS, on_done=None):
+    """Run a time-boxed capture on the scheduler thread; returns False if one is already running"""
+    if capture.running or any(scheduler.due_time(name) is not None for name in (START_TIMER, STOP_TIMER)):
+        return False
+
+    def begin():
+        if capture.start():
+            scheduler.schedule_in(STOP_TIMER, seconds, finish)
+
+    def finish():
+        reports = capture.stop()
+        if on_done:
+            on_done(reports)
+
+    scheduler.schedule_in(START_TIMER, 0, begin)
+    return True
+
+
+def profile_launch(name):
+    """Start profiling the launch on this thread when EMPLOYEE_TRACKER_PROFILE is set"""
+    global launch_capture, launch_seconds
+    launch_seconds = requested_seconds()
+    if launch_seconds is None:
+        return None
+    launch_capture = ProfileCapture(name)
+    launch_capture.start('launch')
+    return launch_capture
+
+
+def finish_launch(capture, scheduler, on_done=None):
+    """Write the launch profile once the app is about to enter its event loop, then profile the running app"""
+    global launch_capture
+    if launch_capture is None:
+        return False
+    # Stopped on the thread that started it, before that thread blocks in the event loop
+    launch_capture.stop()
+    launch_capture = None
+    return schedule_capture(capture, scheduler, launch_seconds, on_done)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Reminders
+Break reminder and day rollover timers computed from attendance state
+"""
+
+import threading
+
+from .attendance import BREAK_REMINDER_MINUTES
+
+# How often the reminder repeats while the user still hasn't taken a break
+REMINDER_REPEAT_MINUTES = 30
+
+BREAK_REMINDER_TITLE = "Break Reminder"
+BREAK_REMINDER_MESSAGE = "You've been working for more than {duration}. Consider taking a break!"
+
+
+def format_minutes(minutes):
+    """Format minutes as e.g. 4 hours, 1 hour 30 minutes or 45 minutes"""
+    hours, minutes = divmod(int(minutes), 60)
+    parts = []
+    if hours:
+        parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
+    if minutes or not hours:
+        parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
+    return ' '.join(parts)
+
+
+def break_reminder_message(after_minutes):
+    """Build the reminder text for the configured working time"""
+    return BREAK_REMINDER_MESSAGE.format(duration=format_minutes(after_minutes))
+
+
+class BreakReminder:
+    """Schedules the break reminder at its exact due time"""
+
+    TIMER = 'break-reminder'
+
+    def __init__(self, scheduler, server_clock, notify, after_minutes=BREAK_REMINDER_MINUTES,
+                 repeat_minutes=REMINDER_REPEAT_MINUTES, enabled=True):
+        self.scheduler = scheduler
+        self.server_clock = server_clock
+        self.notify = notify
+        self.after_minutes = after_minutes
+        self.repeat_minutes = repeat_minutes
+        self.enabled = enabled
+        self.attendance = None
+        self.last_fired = None
+        self.lock = threading.Lock()
+
+    def due(self):
+        """Get the reminder due time in server epoch seconds, or None"""
+        if not self.enabled or not self.attendance:
+            return None
+        return self.attendance.break_reminder_due(self.after_minutes)
+
+    def update(self, attendance):
+        """Reschedule the reminder after an attendance state change"""
+        with self.lock:
+            self.attendance = attendance
+            due = self.due()
+            if due is None:
+                self.scheduler.cancel(self.TIMER)
+                return
+
+            # Attendance times are server times; the scheduler runs on the local clock
+            due_at = self.server_clock.to_local(due)
+            if self.last_fired is not None:
+                # Don't repeat sooner than the reminder interval after a refresh
+                due_at = max(due_at, self.last_fired + self.repeat_minutes * 60)
+            self.scheduler.schedule(self.TIMER, due_at, self._fire)
+
+    def _fire(self):
+        """Show the reminder and schedule the next repeat"""
+        with self.lock:
+            if self.due() is None:
+                return
+            self.last_fired = self.scheduler.clock.time()
+            self.scheduler.schedule(self.TIMER, self.last_fired + self.repeat_minutes * 60, self._fire)
+            message = break_reminder_message(self.after_minutes)
+        self.notify(BREAK_REMINDER_TITLE, message)
+
+
+class DayRollover:
+    """Invalidates cached attendance once at the server's day boundary"""
+
+    TIMER = 'day-rollover'
+
+    # Wait a little past midnight so the server has started the new day
+    GRACE_SECONDS = 5
+
+    def __init__(self, scheduler, server_clock, on_rollover):
+        self.scheduler = scheduler
+        self.server_clock = server_clock
+        self.on_rollover = on_rollover
+
+    def schedule(self):
+        """(Re)schedule the rollover using the latest clock offset"""
+        due_at = self.server_clock.next_day_boundary() + self.GRACE_SECONDS
+        # Nobody waits on the refresh, so power saver mode may push it back a few minutes
+        self.scheduler.schedule(self.TIMER, due_at, self._fire, coalesce=True)
+
+    def _fire(self):
+        """Run the rollover and schedule the next one"""
+        try:
+            self.on_rollover()
+        finally:
+            self.schedule()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Scheduler
+Heap-based timer scheduler that sleeps until the next deadline
+"""
+
+import heapq
+import itertools
+import logging
+import math
+import threading
+import time
+
+from .clock import Clock
+
+logger = logging.getLogger(__name__)
+
+# Re-check the wall clock at least this often while timers are pending.
+# Deadlines are wall-clock times but Condition.wait() counts monotonic time,
+# which stops while the machine sleeps and ignores clock changes, so waiting
+# the whole delay could run a timer hours late after a resume. No event
+# reports a resume or clock change to this thread, so it looks itself. With
+# no timers pending the scheduler thread does not wake up at all.
+MAX_WAIT_SECONDS = 900
+
+
+class Scheduler:
+    """Runs named timers at absolute wall-clock deadlines on a single thread"""
+
+    def __init__(self, clock=None, max_wait=MAX_WAIT_SECONDS):
+        self.clock = clock or Clock()
+        self.max_wait = max_wait
+        self.heap = []
+        self.timers = {}
+        self.sequence = itertools.count()
+        self.condition = threading.Condition()
+        self.running = False
+        self.thread = None
+
+        # Power saver mode rounds the deadlines of deferrable timers up to
+        # multiples of this so timers that fall close together share one wakeup
+        self.coalesce_seconds = 0
+        self.wakeups = 0
+        self.timers_run = 0
+        self.cpu_seconds = 0.0
+
+    def start(self):
+        """Start the scheduler thread"""
+        with self.condition:
+            if self.running:
+                return
+            self.running = True
+        if self.clock.drives_timers:
+            # A virtual clock runs the timers as it is advanced
+            self.clock.attach(self)
+            return
+        self.thread = threading.Thread(target=self._run, name="scheduler", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop the scheduler thread immediately"""
+        with self.condition:
+            self.running = False
+            self.heap.clear()
+            self.timers.clear()
+            self.condition.notify()
+        if self.clock.drives_timers:
+            self.clock.detach(self)
+
+    def schedule(self, name, due, callback, coalesce=False):
+        """Schedule a timer at an epoch timestamp, replacing any timer with the same name
+
+        Only timers scheduled with `coalesce` may run up to `coalesce_seconds`
+        late in power saver mode; every other timer runs on time.
+        """
+        with self.condition:
+            if coalesce and self.coalesce_seconds:
+                due = math.ceil(due / self.coalesce_seconds) * self.coalesce_seconds
+            entry = (due, next(self.sequence), name)
+            self.timers[name] = (entry, callback)
+            heapq.heappush(self.heap, entry)
+            # Only wake the thread if the new timer is now the earliest one
+            if self.heap[0] is entry:
+                self.condition.notify()
+
+    def schedule_in(self, name, delay, callback, coalesce=False):
+        """Schedule a timer `delay` seconds from now"""
+        self.schedule(name, self.clock.time() + delay, callback, coalesce)
+
+    def cancel(self, name):
+        """Cancel a timer; its heap entry is discarded lazily"""
+        with self.condition:
+            self.timers.pop(name, None)
+
+    def due_time(self, name):
+        """Get the deadline of a pending timer, or None"""
+        with self.condition:
+            timer = self.timers.get(name)
+            return timer[0][0] if timer else None
+
+    def next_due(self):
+        """Get the earliest pending deadline, or None"""
+        with self.condition:
+            self._discard_stale()
+            return self.heap[0][0] if self.heap else None
+
+    def run_due(self):
+        """Run every timer that is due now; used by clocks that drive timers"""
+        woke = False
+        while True:
+            with self.condition:
+                self._discard_stale()
+                if not self.running or not self.heap or self.heap[0][0] > self.clock.time():
+                    return
+                entry = heapq.heappop(self.heap)
+                callback = self.timers.pop(entry[2])[1]
+                if not woke:
+                    # All timers due at the same moment count as one wakeup
+                    woke = True
+                    self.wakeups += 1
+                self.timers_run += 1
+            started = time.thread_time()
+            try:
+                callback()
+            except Exception as e:
+                logger.exception("Timer error: %s", e)
+            self.cpu_seconds += time.thread_time() - started
+
+    def stats(self):
+        """Get the scheduler's wakeup and CPU counters"""
+        with self.condition:
+            return {
+                'wakeups': self.wakeups,
+                'timers_run': self.timers_run,
+                'pending': len(self.timers),
+                'cpu_ms': round(self.cpu_seconds * 1000, 3),
+                'coalesce_seconds': self.coalesce_seconds,
+            }
+
+    def _discard_stale(self):
+        """Drop cancelled or replaced entries from the top of the heap (lock held)"""
+        while self.heap and self.timers.get(self.heap[0][2], (None,))[0] is not self.heap[0]:
+            heapq.heappop(self.heap)
+
+    def _next_due(self):
+        """Wait for the next due timer and take it (lock held)"""
+        while self.running:
+            self._discard_stale()
+            if not self.heap:
+                self.condition.wait()
+                self.wakeups += 1
+                continue
+
+            delay = self.heap[0][0] - self.clock.time()
+            if delay > 0:
+                self.condition.wait(min(delay, self.max_wait))
+                self.wakeups += 1
+                continue
+
+            entry = heapq.heappop(self.heap)
+            self.timers_run += 1
+            return self.timers.pop(entry[2])[1]
+        return None
+
+    def _run(self):
+        """Run timers as they become due"""
+        while True:
+            with self.condition:
+                callback = self._next_due()
+            if callback is None:
+                return
+            try:
+                callback()
+            except Exception as e:
+                logger.exception("Timer error: %s", e)
+            # This thread only runs timers, so its CPU time is the scheduler's cost
+            self.cpu_seconds = time.thread_time()
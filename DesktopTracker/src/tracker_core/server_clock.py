@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Server Clock
+Estimates the offset between the local clock and the API server clock, and keeps the server's timezone
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+
+from .clock import Clock
+
+logger = logging.getLogger(__name__)
+
+# Offsets that jump by more than this are taken as-is instead of smoothed
+OFFSET_RESET_SECONDS = 30
+
+# The Laravel app's default timezone (config/app.php), used until the API reports its own
+DEFAULT_TIMEZONE = 'UTC'
+
+
+def load_timezone(name):
+    """Get the tzinfo for an IANA timezone name, or None if it is unknown"""
+    if name in ('UTC', 'Z', '+00:00'):
+        return timezone.utc
+    try:
+        from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+    except ImportError:
+        return None
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+class ServerClock:
+    """Tracks the server clock offset from HTTP response Date headers, and the timezone of its wall clock"""
+
+    def __init__(self, clock=None, smoothing=0.25):
+        self.clock = clock or Clock()
+        self.offset = 0.0
+        self.samples = 0
+        self.smoothing = smoothing
+        self.timezone_name = DEFAULT_TIMEZONE
+        self.timezone = timezone.utc
+
+    def set_timezone(self, name):
+        """Use the timezone the API formats its dates and times in"""
+        if not name or name == self.timezone_name:
+            return
+        tzinfo = load_timezone(name)
+        if tzinfo is None:
+            logger.warning("Unknown server timezone %r, keeping %s", name, self.timezone_name)
+            return
+        self.timezone_name = name
+        self.timezone = tzinfo
+
+    def observe(self, date_header, sent_at, received_at):
+        """Update the offset from a response Date header and request timing"""
+        if not date_header:
+            return
+        try:
+            server_time = parsedate_to_datetime(date_header).timestamp()
+        except (TypeError, ValueError):
+            return
+
+        # The Date header has 1s resolution; assume it was stamped halfway
+        # through the round trip and halfway through that second
+        offset = server_time + 0.5 - (sent_at + received_at) / 2
+
+        if self.samples == 0 or abs(offset - self.offset) > OFFSET_RESET_SECONDS:
+            self.offset = offset
+        else:
+            self.offset += self.smoothing * (offset - self.offset)
+        self.samples += 1
+
+    def time(self):
+        """Get the estimated server time as an epoch timestamp"""
+        return self.clock.time() + self.offset
+
+    def now(self):
+        """Get the estimated server time on the server's wall clock, as an aware datetime"""
+        return datetime.fromtimestamp(self.time(), self.timezone)
+
+    def timestamp(self, day, hour=0, minute=0, second=0):
+        """Get the epoch timestamp of a server wall clock time on a server date (YYYY-MM-DD)"""
+        year, month, day_of_month = map(int, str(day)[:10].split('-'))
+        return datetime(year, month, day_of_month, hour, minute, second, tzinfo=self.timezone).timestamp()
+
+    def today(self):
+        """Get the server's current date"""
+        return self.now().date()
+
+    def to_local(self, server_timestamp):
+        """Convert a server epoch timestamp to the local clock"""
+        return server_timestamp - self.offset
+
+    def next_day_boundary(self):
+        """Get the local timestamp of the next midnight in the server's timezone"""
+        tomorrow = self.today() + timedelta(days=1)
+        return self.to_local(self.timestamp(tomorrow.isoformat()))
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Settings
+Typed settings loaded from the platform config directory, with atomic writes and hot reload
+"""
+
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+from dotenv import dotenv_values
+
+from .power import SUSPENDED_INTERVAL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+APP_NAME = 'EmployeeTracker'
+SETTINGS_FILE = 'config.env'
+
+# Set to a file path to use a settings file outside the platform config directory
+SETTINGS_PATH_VARIABLE = 'EMPLOYEE_TRACKER_CONFIG'
+
+# How often the settings file is checked when file change notifications aren't available
+POLL_SECONDS = 30
+
+# Wait this long after a change notification so editors can finish writing
+RELOAD_DELAY_SECONDS = 0.5
+
+# Attribute name -> (config.env key, type, default)
+FIELDS = {
+    'api_base_url': ('API_BASE_URL', str, 'http://localhost:8080/api'),
+    'api_token': ('API_TOKEN', str, ''),
+    'auto_start_break_after_minutes': ('AUTO_START_BREAK_AFTER_MINUTES', int, 240),
+    'daily_target_minutes': ('DAILY_TARGET_MINUTES', int, 480),
+    'idle_break_minutes': ('IDLE_BREAK_MINUTES', int, 15),
+    'power_saver': ('POWER_SAVER', bool, False),
+    'auto_reminder_enabled': ('AUTO_REMINDER_ENABLED', bool, True),
+    'reminder_interval_minutes': ('REMINDER_INTERVAL_MINUTES', int, 30),
+    'theme': ('THEME', str, 'light'),
+    'window_size': ('WINDOW_SIZE', str, '400x600'),
+    'always_on_top': ('ALWAYS_ON_TOP', bool, True),
+    'stall_monitor_enabled': ('STALL_MONITOR_ENABLED', bool, True),
+    'stall_threshold_ms': ('STALL_THRESHOLD_MS', int, 200),
+    'metrics_port': ('METRICS_PORT', int, 0),
+    'metrics_dump_minutes': ('METRICS_DUMP_MINUTES', int, 0),
+    'log_level': ('LOG_LEVEL', str, 'INFO'),
+    'diagnostics_menu': ('DIAGNOSTICS_MENU', bool, False),
+}
+
+
+def config_dir():
+    """Get the per-user configuration directory for this platform"""
+    if sys.platform == 'win32':
+        base = os.getenv('APPDATA') or os.path.expanduser('~\\AppData\\Roaming')
+        return os.path.join(base, APP_NAME)
+    if sys.platform == 'darwin':
+        return os.path.expanduser(f'~/Library/Application Support/{APP_NAME}')
+    base = os.getenv('XDG_CONFIG_HOME') or os.path.expanduser('~/.config')
+    return os.path.join(base, 'employee-tracker')
+
+
+def settings_path():
+    """Get the path of the settings file"""
+    return os.getenv(SETTINGS_PATH_VARIABLE) or os.path.join(config_dir(), SETTINGS_FILE)
+
+
+def legacy_paths():
+    """Get the config.env locations used before the platform config directory"""
+    if getattr(sys, 'frozen', False):
+        app_dir = os.path.dirname(sys.executable)
+    else:
+        # DesktopTracker/src/tracker_core/settings.py -> DesktopTracker
+        app_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return [os.path.abspath(SETTINGS_FILE), os.path.join(app_dir, SETTINGS_FILE)]
+
+
+def parse_value(key, kind, raw, default):
+    """Convert a raw string setting to its type, falling back to the default"""
+    if raw is None or raw.strip() == '':
+        return default
+    if kind is bool:
+        value = raw.strip().lower()
+        if value in ('true', '1', 'yes', 'on'):
+            return True
+        if value in ('false', '0', 'no', 'off'):
+            return False
+    elif kind is int:
+        try:
+            return int(raw)
+        except ValueError:
+            pass
+    else:
+        return raw
+    logger.warning("Invalid value %r for %s, using %r", raw, key, default)
+    return default
+
+
+def format_value(value):
+    """Convert a typed setting back to its config.env form"""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+class Settings:
+    """Typed, read-only snapshot of the settings file"""
+
+    def __init__(self, values=None):
+        values = values or {}
+        for name, (key, kind, default) in FIELDS.items():
+            setattr(self, name, parse_value(key, kind, values.get(key), default))
+
+    def replace(self, **changes):
+        """Get a copy with some fields changed"""
+        settings = Settings()
+        settings.__dict__.update(vars(self))
+        settings.__dict__.update(changes)
+        return settings
+
+    def changed_fields(self, other):
+        """Get the names of the fields that differ from another snapshot"""
+        return {name for name in FIELDS if getattr(self, name) != getattr(other, name)}
+
+    def __eq__(self, other):
+        return isinstance(other, Settings) and not self.changed_fields(other)
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={'***' if name == 'api_token' and value else repr(value)}"
+                           for name, value in vars(self).items())
+        return f"Settings({fields})"
+
+
+class SettingsStore:
+    """Loads the settings file once and writes changes back without losing unknown keys"""
+
+    def __init__(self, path=None, environ=None):
+        # An old config.env is only moved into the default location
+        self.migrate_legacy = path is None and not os.getenv(SETTINGS_PATH_VARIABLE)
+        self.path = path or settings_path()
+        self.environ = os.environ if environ is None else environ
+        self.settings = Settings()
+        self.signature = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        """Read the settings file; environment variables override it"""
+        with self.lock:
+            self._migrate()
+            values = dotenv_values(self.path) if os.path.exists(self.path) else {}
+            for key, _, _ in FIELDS.values():
+                if key in self.environ:
+                    values[key] = self.environ[key]
+            self.settings = Settings(values)
+            self.signature = self._signature()
+            return self.settings
+
+    def save(self, **changes):
+        """Write changed fields atomically, keeping comments and keys this version doesn't know"""
+        with self.lock:
+            updates = {}
+            for name, value in changes.items():
+                if name not in FIELDS:
+                    raise KeyError(f"Unknown setting: {name}")
+                updates[FIELDS[name][0]] = format_value(value)
+
+            lines = []
+            if os.path.exists(self.path):
+                with open(self.path, encoding='utf-8') as f:
+                    lines = f.read().splitlines()
+
+            remaining = dict(updates)
+            for index, line in enumerate(lines):
+                key = line.split('=', 1)[0].strip()
+                if key.startswith('export '):
+                    key = key[len('export '):].strip()
+                if '=' in line and not line.lstrip().startswith('#') and key in remaining:
+                    lines[index] = f"{key}={remaining.pop(key)}"
+            lines.extend(f"{key}={value}" for key, value in remaining.items())
+
+            self._write('\n'.join(lines) + '\n')
+            self.settings = self.settings.replace(**changes)
+            # Our own write is not an external change
+            self.signature = self._signature()
+            return self.settings
+
+    def create(self, content):
+        """Write a new settings file atomically; returns False if one already exists"""
+        with self.lock:
+            self._migrate()
+            if os.path.exists(self.path):
+                return False
+            self._write(content)
+            self.signature = self._signature()
+            return True
+
+    def changed(self):
+        """Check whether the file was modified since it was last loaded or saved"""
+        return self._signature() != self.signature
+
+    def _write(self, content):
+        """Write to a temp file in the same directory and rename it over the settings file"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix='.config-', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            if os.path.exists(self.path):
+                shutil.copymode(self.path, temp_path)
+            else:
+                # The file holds the API token
+                os.chmod(temp_path, 0o600)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _signature(self):
+        """Get the file's modification time and size, or None if it doesn't exist"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _migrate(self):
+        """Copy an old working-directory config.env to the config directory (lock held)"""
+        if not self.migrate_legacy or os.path.exists(self.path):
+            return
+        for legacy in legacy_paths():
+            if os.path.exists(legacy):
+                with open(legacy, encoding='utf-8') as f:
+                    self._write(f.read())
+                logger.info("Moved settings from %s to %s", legacy, self.path)
+                return
+
+
+class SettingsWatcher:
+    """Reloads the settings file when it changes and reports the new settings
+
+    Uses watchdog file change notifications when it is installed and
+    otherwise checks the file's modification time on a scheduler timer,
+    which backs off while `suspended()` says deferrable work should wait.
+    Either way the reload runs on the scheduler thread.
+    """
+
+    TIMER = 'settings-reload'
+
+    def __init__(self, store, scheduler, on_change, poll_seconds=POLL_SECONDS, use_watchdog=True, suspended=None):
+        self.store = store
+        self.scheduler = scheduler
+        self.on_change = on_change
+        self.poll_seconds = poll_seconds
+        self.suspended = suspended
+        self.use_watchdog = use_watchdog
+        self.observer = None
+        self.running = False
+
+    def start(self):
+        """Start watching the settings file"""
+        if self.running:
+            return
+        self.running = True
+        self.observer = self._start_observer() if self.use_watchdog else None
+        if not self.observer:
+            self.scheduler.schedule_in(self.TIMER, self.poll_seconds, self._poll)
+
+    def stop(self):
+        """Stop watching"""
+        self.running = False
+        self.scheduler.cancel(self.TIMER)
+        if self.observer:
+            self.observer.stop()
+            self.observer = None
+
+    def _start_observer(self):
+        """Watch the config directory with watchdog, or return None if it isn't available"""
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            return None
+
+        watcher = self
+        target = os.path.abspath(self.store.path)
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                paths = {getattr(event, 'src_path', None), getattr(event, 'dest_path', None)}
+                if target in {os.path.abspath(path) for path in paths if path}:
+                    # Coalesce the burst of events a single save produces
+                    watcher.scheduler.schedule_in(watcher.TIMER, RELOAD_DELAY_SECONDS, watcher.check)
+
+        try:
+            directory = os.path.dirname(target)
+            os.makedirs(directory, exist_ok=True)
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(Handler(), directory, recursive=False)
+            observer.start()
+            return observer
+        except Exception as e:
+            logger.info("Settings watcher unavailable, polling instead: %s", e)
+            return None
+
+    def _poll(self):
+        """Check the file and schedule the next poll"""
+        self.check()
+        if self.running:
+            delay = SUSPENDED_INTERVAL_SECONDS if self.suspended and self.suspended() else self.poll_seconds
+            self.scheduler.schedule_in(self.TIMER, delay, self._poll)
+
+    def check(self):
+        """Reload the settings if the file changed; returns True if they did"""
+        if not self.running or not self.store.changed():
+            return False
+        previous = self.store.settings
+        try:
+            settings = self.store.load()
+        except Exception as e:
+            logger.exception("Settings reload error: %s", e)
+            return False
+        changed = settings.changed_fields(previous)
+        if changed:
+            self.on_change(settings, changed)
+        return bool(changed)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Startup Trace
+Records cold-start milestones for benchmark_startup.py; does nothing unless it is enabled
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+# File to append milestones to, set by the benchmark
+TRACE_VARIABLE = 'EMPLOYEE_TRACKER_STARTUP_TRACE'
+
+# Exit as soon as the app is ready, so each benchmark run is a fresh cold start
+EXIT_VARIABLE = 'EMPLOYEE_TRACKER_STARTUP_EXIT'
+
+trace_path = os.getenv(TRACE_VARIABLE)
+recorded = set()
+lock = threading.Lock()
+
+
+def rss_mb():
+    """Get the resident memory of this process in MB, or None if it can't be read"""
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            from ctypes import wintypes
+
+            class ProcessMemoryCounters(ctypes.Structure):
+                _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD)] + [
+                    (name, ctypes.c_size_t) for name in (
+                        'PeakWorkingSetSize', 'WorkingSetSize', 'QuotaPeakPagedPoolUsage',
+                        'QuotaPagedPoolUsage', 'QuotaPeakNonPagedPoolUsage', 'QuotaNonPagedPoolUsage',
+                        'PagefileUsage', 'PeakPagefileUsage')]
+
+            counters = ProcessMemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return None
+            return round(counters.WorkingSetSize / 1024 / 1024, 1)
+        if os.path.exists('/proc/self/statm'):
+            with open('/proc/self/statm') as f:
+                pages = int(f.read().split()[1])
+            return round(pages * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024, 1)
+
+        # macOS only reports the peak, in bytes
+        import resource
+        return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 / 1024, 1)
+    except Exception:
+        return None
+
+
+def resource_usage():
+    """Get the resident memory and thread count of this process"""
+    return {'rss_mb': rss_mb(), 'threads': threading.active_count()}
+
+
+def mark(milestone, **extra):
+    """Record the first time a startup milestone is reached"""
+    if not trace_path:
+        return
+    with lock:
+        if milestone in recorded:
+            return
+        recorded.add(milestone)
+        # Wall clock time, so the benchmark can compare it with its own launch time
+        entry = dict(extra, milestone=milestone, time=time.time(), pid=os.getpid())
+        with open(trace_path, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
+
+
+def ready(milestone):
+    """Record the last startup milestone with the process footprint and exit if the benchmark asked for it"""
+    if trace_path:
+        mark(milestone, **resource_usage())
+    if trace_path and os.getenv(EXIT_VARIABLE):
+        os._exit(0)
+
+
+# Importing this module first thing is how entry points mark interpreter startup
+mark('interpreter')
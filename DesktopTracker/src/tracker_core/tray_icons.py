@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Tray Icons
+Pre-rendered, cached tray icon variants shared by the tray front-ends
+"""
+
+import os
+import threading
+from PIL import Image
+
+# Rendered size of the tray icon. Backends scale down, so rendering at
+# twice the classic 64px keeps the icon crisp on HiDPI displays.
+TRAY_ICON_SIZE = 128
+ICON_SIZES = (64, TRAY_ICON_SIZE)
+
+# Background color and glyph for every icon state
+ICON_STYLES = {
+    'none': ('gray', '?'),
+    'present': ('green', '✓'),
+    'late': ('orange', '!'),
+    'other': ('blue', 'ET'),
+    'syncing': ('steelblue', '…'),
+    'offline': ('firebrick', 'x'),
+}
+
+# Progress ring drawn around the status circle. The ring is quantized so a
+# day only ever needs RING_STEPS + 1 precomputed arc frames per color.
+RING_STEPS = 48
+RING_TRACK_COLOR = (255, 255, 255, 80)
+RING_WORK_COLOR = (255, 255, 255, 255)
+RING_BREAK_COLOR = (255, 200, 0, 255)
+
+# Composited progress icons kept around; old frames are dropped first
+MAX_PROGRESS_FRAMES = 16
+
+# Prebuilt frames written by build_icons.py. When they are there the icons are
+# only loaded, so ImageDraw and ImageFont are never imported; without them
+# (e.g. running from a fresh checkout) every frame is drawn on first use.
+ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'icons')
+ARC_ASSET_NAMES = {RING_WORK_COLOR: 'work', RING_BREAK_COLOR: 'break'}
+
+
+def icon_state(attendance, online=True):
+    """Map an AttendanceRecord to one of the ICON_STYLES keys"""
+    if not online:
+        return 'offline'
+    if not attendance:
+        return 'none'
+    status = attendance.status
+    if status in ('present', 'late'):
+        return status
+    return 'other'
+
+
+def _load_font(size):
+    """Load a font scaled to the icon, falling back to the bitmap default"""
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        # Pillow < 10.1 only ships the fixed-size bitmap font
+        return ImageFont.load_default()
+
+
+def render_icon(state, size=TRAY_ICON_SIZE):
+    """Render a single icon variant"""
+    # Drawing modules are only loaded once an icon actually has to be rendered
+    from PIL import ImageDraw
+
+    color, glyph = ICON_STYLES[state]
+    scale = size / 64
+
+    image = Image.new('RGB', (size, size), color=color)
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((16 * scale, 16 * scale, 48 * scale, 48 * scale), fill='white')
+
+    # Center the glyph inside the white circle
+    font = _load_font(int(20 * scale))
+    left, top, right, bottom = draw.textbbox((0, 0), glyph, font=font)
+    x = (size - (right - left)) / 2 - left
+    y = (size - (bottom - top)) / 2 - top
+    draw.text((x, y), glyph, fill=color, font=font)
+
+    return image
+
+
+def ring_progress(work_seconds, break_seconds, target_seconds):
+    """Quantize worked and elapsed (work + break) time into ring steps"""
+    def step(seconds):
+        if target_seconds <= 0:
+            return RING_STEPS
+        return min(RING_STEPS, int(seconds * RING_STEPS // target_seconds))
+
+    return step(work_seconds), step(work_seconds + break_seconds)
+
+
+def icon_asset_name(state, size):
+    """File name of a prebuilt status icon"""
+    return f"{state}-{size}.png"
+
+
+def ring_asset_name(state, size):
+    """File name of a prebuilt status icon with the empty ring track"""
+    return f"ring-{state}-{size}.png"
+
+
+def arc_asset_name(color, step, size):
+    """File name of a prebuilt ring arc layer"""
+    return f"arc-{ARC_ASSET_NAMES[color]}-{step}-{size}.png"
+
+
+def load_asset(asset_dir, name):
+    """Load a prebuilt frame; returns None when there is none"""
+    if not asset_dir:
+        return None
+    try:
+        image = Image.open(os.path.join(asset_dir, name))
+        image.load()
+    except OSError:
+        return None
+    return image
+
+
+def _ring_box(size):
+    """Get the bounding box of the progress ring"""
+    margin = 6 * size / 64
+    return (margin, margin, size - margin, size - margin)
+
+
+def render_arc(size, step, color):
+    """Render a transparent layer holding an arc of `step` ring steps"""
+    layer = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    if step > 0:
+        from PIL import ImageDraw
+        draw = ImageDraw.Draw(layer)
+        width = max(2, int(6 * size / 64))
+        end = -90 + 360 * step / RING_STEPS
+        draw.arc(_ring_box(size), -90, end, fill=color, width=width)
+    return layer
+
+
+def render_ring_base(state, size):
+    """Render a status icon with the empty ring track as an RGBA base layer"""
+    return Image.alpha_composite(render_icon(state, size).convert('RGBA'),
+                                 render_arc(size, RING_STEPS, RING_TRACK_COLOR))
+
+
+class IconCache:
+    """Loads or renders each icon variant once and hands out the cached image"""
+
+    def __init__(self, asset_dir=ASSET_DIR):
+        self.asset_dir = asset_dir
+        self._images = {}
+        self._ring_bases = {}
+        self._arcs = {}
+        self._progress = {}
+
+    def get(self, state, size=TRAY_ICON_SIZE):
+        """Get the cached image for a state, loading or rendering it on first use"""
+        key = (state, size)
+        image = self._images.get(key)
+        if image is None:
+            image = load_asset(self.asset_dir, icon_asset_name(state, size)) or render_icon(state, size)
+            self._images[key] = image
+        return image
+
+    def get_progress(self, state, work_step, elapsed_step, size=TRAY_ICON_SIZE):
+        """Get a status icon with the progress ring composited on top"""
+        key = (state, work_step, elapsed_step, size)
+        image = self._progress.get(key)
+        if image is None:
+            # Break arc runs up to the elapsed time, the work arc covers its start
+            image = Image.alpha_composite(self._ring_base(state, size),
+                                          self._arc(size, elapsed_step, RING_BREAK_COLOR))
+            image = Image.alpha_composite(image, self._arc(size, work_step, RING_WORK_COLOR))
+            image = image.convert('RGB')
+            if len(self._progress) >= MAX_PROGRESS_FRAMES:
+                self._progress.pop(next(iter(self._progress)))
+            self._progress[key] = image
+        return image
+
+    def _ring_base(self, state, size):
+        """Get the status icon with the empty ring track as an RGBA base layer"""
+        key = (state, size)
+        base = self._ring_bases.get(key)
+        if base is None:
+            base = load_asset(self.asset_dir, ring_asset_name(state, size)) or render_ring_base(state, size)
+            self._ring_bases[key] = base
+        return base
+
+    def _arc(self, size, step, color):
+        """Get a cached arc frame"""
+        key = (size, step, color)
+        layer = self._arcs.get(key)
+        if layer is None:
+            if step > 0 and color in ARC_ASSET_NAMES:
+                layer = load_asset(self.asset_dir, arc_asset_name(color, step, size))
+            layer = layer or render_arc(size, step, color)
+            self._arcs[key] = layer
+        return layer
+
+    def __len__(self):
+        return len(self._images)
+
+
+class TrayIconUpdater:
+    """Swaps the tray icon only when its state actually changes"""
+
+    def __init__(self, cache=None):
+        self.cache = cache if cache is not None else IconCache()
+        self.current_key = None
+        self.lock = threading.Lock()
+        # Counters for verifying redundant platform icon updates stay at zero
+        self.icon_updates = 0
+        self.skipped_updates = 0
+        self.redundant_updates = 0
+
+    def initial_icon(self, state='syncing'):
+        """Get the icon to create the tray with and remember its state"""
+        self.current_key = (state, None)
+        return self.cache.get(state)
+
+    def apply(self, tray_icon, state, progress=None):
+        """Set the tray icon for a state; returns True if the icon was swapped
+
+        `progress` is an optional (work_step, elapsed_step) pair from
+        ring_progress(); the icon only changes when a step changes.
+        """
+        key = (state, progress)
+        with self.lock:
+            if key == self.current_key:
+                self.skipped_updates += 1
+                return False
+
+            if progress is None:
+                image = self.cache.get(state)
+            else:
+                image = self.cache.get_progress(state, *progress)
+            if tray_icon.icon is image:
+                self.redundant_updates += 1
+            tray_icon.icon = image
+            self.current_key = key
+            self.icon_updates += 1
+            return True
+
+    def stats(self):
+        """Get the update counters"""
+        return {
+            'key': self.current_key,
+            'icon_updates': self.icon_updates,
+            'skipped_updates': self.skipped_updates,
+            'redundant_updates': self.redundant_updates,
+            'cached_images': len(self.cache),
+        }
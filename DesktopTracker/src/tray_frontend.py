@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker Tray Front-End
+The system tray icon, menu and settings window shared by the tray app and the background service
+"""
+
+import signal
+import threading
+import pystray
+from ui_thread import UIThread
+from tracker_core import profiling, startup_trace
+from tracker_core.engine import TrackerEngine
+from tracker_core.tray_icons import TrayIconUpdater, icon_state, ring_progress
+import sys
+
+
+class TrayFrontend:
+    """Shows a TrackerEngine as a system tray icon; subclasses add menu items and status lines"""
+
+    # Names the log file and profile reports
+    app_name = 'tray'
+
+    def __init__(self, clock=None, **engine_options):
+        self.engine = TrackerEngine(self.deliver_notification, clock, **engine_options)
+        self.profile_capture = profiling.ProfileCapture(self.app_name)
+        self.tray_icon = None
+        self.icon_updater = TrayIconUpdater()
+        self.ui = UIThread()
+        self.settings_window = None
+        self.settings_status_text = None
+
+        # The ring is redrawn after every load and on each minute tick
+        self.engine.subscribe('changed', self.update_tray_icon)
+        self.engine.subscribe('tick', self.update_tray_icon)
+        self.engine.subscribe('token_missing', self.on_token_missing)
+        self.engine.subscribe('settings', self.on_settings_applied)
+
+        # Create system tray icon
+        self.create_tray_icon()
+
+        # Load initial data and start the timers
+        self.engine.start()
+
+    def create_tray_icon(self):
+        """Create system tray icon"""
+        # Start with the syncing icon until the first data load
+        image = self.icon_updater.initial_icon()
+        engine = self.engine
+
+        # Create menu
+        menu = pystray.Menu(
+            pystray.MenuItem("Employee Tracker", self.show_status),
+            pystray.Menu.SEPARATOR,
+            pystray.MenuItem("Check In", self.check_in, enabled=lambda item: engine.can_check_in()),
+            pystray.MenuItem("Check Out", self.check_out, enabled=lambda item: engine.can_check_out()),
+            pystray.MenuItem("Start Break", self.start_break, enabled=lambda item: engine.can_start_break()),
+            pystray.MenuItem("End Break", self.end_break, enabled=lambda item: engine.can_end_break()),
+            pystray.Menu.SEPARATOR,
+            pystray.MenuItem("Settings", self.show_settings),
+            *self.extra_menu_items(),
+            pystray.MenuItem("Refresh", self.refresh),
+            # Hidden unless DIAGNOSTICS_MENU=true; SIGUSR1 does the same on Linux and macOS
+            pystray.MenuItem(f"Profile {profiling.CAPTURE_SCOPE} for {profiling.DEFAULT_SECONDS} s",
+                             self.start_profiling,
+                             visible=lambda item: engine.settings_store.settings.diagnostics_menu),
+            pystray.Menu.SEPARATOR,
+            pystray.MenuItem("Exit", self.quit_app)
+        )
+
+        # Create tray icon
+        self.tray_icon = pystray.Icon("EmployeeTracker", image, "Employee Tracker", menu)
+
+    def extra_menu_items(self):
+        """Menu items a front-end adds below Settings"""
+        return []
+
+    def check_in(self, icon=None, item=None):
+        """Check in for the day"""
+        self.engine.notify_outcome(self.engine.check_in())
+
+    def check_out(self, icon=None, item=None):
+        """Check out for the day"""
+        self.engine.notify_outcome(self.engine.check_out())
+
+    def start_break(self, icon=None, item=None):
+        """Start break"""
+        self.engine.notify_outcome(self.engine.start_break())
+
+    def end_break(self, icon=None, item=None):
+        """End break"""
+        self.engine.notify_outcome(self.engine.end_break())
+
+    def refresh(self, icon=None, item=None):
+        """Reload today's attendance data"""
+        self.engine.load_attendance_data()
+
+    def on_token_missing(self):
+        """Ask for a token when there is nothing to load"""
+        self.engine.notify("Configuration", "Please set API token in settings")
+
+    def on_settings_applied(self, settings, changed):
+        """Redraw after a settings reload (runs on the scheduler thread)"""
+        self.update_tray_icon()
+        if 'diagnostics_menu' in changed:
+            self.tray_icon.update_menu()
+        self.engine.notify("Settings", "Settings reloaded")
+
+    def update_tray_icon(self):
+        """Update tray icon based on current status"""
+        attendance = self.engine.current_attendance
+        state = icon_state(attendance, self.engine.api_online)
+        progress = None
+        if attendance and attendance.check_in:
+            # Progress ring toward the daily target, with the break in its own color
+            now = self.engine.server_clock.time()
+            progress = ring_progress(attendance.work_seconds(now),
+                                     attendance.break_seconds(now),
+                                     self.engine.daily_target_minutes * 60)
+        self.icon_updater.apply(self.tray_icon, state, progress)
+
+    def show_status(self, icon=None, item=None):
+        """Show current status in a popup"""
+        attendance = self.engine.current_attendance
+        if not attendance:
+            self.engine.notify("Status", "No attendance data for today")
+            return
+
+        status = attendance.status.title()
+        check_in = attendance.time_text('check_in', 'Not checked in')
+        check_out = attendance.time_text('check_out', 'Not checked out')
+        work_minutes = attendance.total_work_minutes
+        break_minutes = attendance.total_break_minutes
+
+        message = f"Status: {status}\n"
+        message += f"Check In: {check_in}\n"
+        message += f"Check Out: {check_out}\n"
+        message += f"Work Hours: {work_minutes // 60}h {work_minutes % 60}m\n"
+        message += f"Break Time: {break_minutes}m"
+
+        self.engine.notify("Today's Status", message)
+
+    def show_settings(self, icon=None, item=None):
+        """Show settings dialog"""
+        # Runs on the shared UI thread so the tray thread is never blocked
+        self.ui.call(self.open_settings_window)
+
+    def open_settings_window(self):
+        """Open the settings window, reusing it if it was opened before"""
+        # Tk is only loaded once a window is actually needed
+        import tkinter as tk
+        from tkinter import ttk, messagebox
+
+        if self.ui.is_open(self.settings_window):
+            self.update_settings_status()
+            self.ui.raise_window(self.settings_window)
+            return
+
+        settings_window = tk.Toplevel(self.ui.root)
+        settings_window.title("Employee Tracker Settings")
+        settings_window.geometry("400x300")
+        settings_window.resizable(False, False)
+
+        # Make window stay on top
+        settings_window.attributes('-topmost', self.engine.settings_store.settings.always_on_top)
+        settings_window.protocol("WM_DELETE_WINDOW", settings_window.withdraw)
+
+        # API Token section
+        token_frame = ttk.LabelFrame(settings_window, text="API Configuration", padding="10")
+        token_frame.pack(fill=tk.X, padx=10, pady=10)
+
+        ttk.Label(token_frame, text="API Token:").pack(anchor=tk.W)
+        token_entry = ttk.Entry(token_frame, width=50, show="*")
+        token_entry.pack(fill=tk.X, pady=(5, 0))
+        token_entry.insert(0, self.engine.api_token)
+
+        def save_token():
+            token = token_entry.get().strip()
+            if token:
+                self.engine.set_api_token(token)
+                self.engine.notify("Settings", "API Token updated successfully!")
+                # Reload off the UI thread so the window stays responsive
+                threading.Thread(target=self.engine.load_attendance_data, daemon=True).start()
+                settings_window.withdraw()
+            else:
+                messagebox.showerror("Error", "Please enter a valid API token!", parent=settings_window)
+
+        ttk.Button(token_frame, text="Save Token", command=save_token).pack(pady=(10, 0))
+
+        # Status section
+        status_frame = ttk.LabelFrame(settings_window, text="Current Status", padding="10")
+        status_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        self.settings_status_text = tk.Text(status_frame, height=8, state=tk.DISABLED)
+        self.settings_status_text.pack(fill=tk.BOTH, expand=True)
+
+        # Close button
+        ttk.Button(settings_window, text="Close", command=settings_window.withdraw).pack(pady=10)
+
+        self.settings_window = settings_window
+        self.update_settings_status()
+
+    def settings_status_lines(self):
+        """Lines for the settings window status section"""
+        attendance = self.engine.current_attendance
+        if not attendance:
+            lines = ["No attendance data available"]
+        else:
+            lines = [
+                f"Date: {attendance.date}",
+                f"Check In: {attendance.time_text('check_in', 'Not checked in')}",
+                f"Check Out: {attendance.time_text('check_out', 'Not checked out')}",
+                f"Break Start: {attendance.time_text('break_start', 'Not started')}",
+                f"Break End: {attendance.time_text('break_end', 'Not ended')}",
+                f"Total Work Minutes: {attendance.total_work_minutes}",
+                f"Total Break Minutes: {attendance.total_break_minutes}",
+                f"Status: {attendance.status.title()}",
+            ]
+
+        icon = self.icon_updater.stats()
+        lines.append(f"Tray Icon: {icon['icon_updates']} redraws, {icon['skipped_updates']} skipped, "
+                     f"{icon['cached_images']} cached images")
+        return lines
+
+    def update_settings_status(self):
+        """Fill the settings window status section"""
+        import tkinter as tk
+
+        self.settings_status_text.config(state=tk.NORMAL)
+        self.settings_status_text.delete(1.0, tk.END)
+        self.settings_status_text.insert(1.0, "\n".join(self.settings_status_lines()))
+        self.settings_status_text.config(state=tk.DISABLED)
+
+    def deliver_notification(self, title, message, category='info'):
+        """Show system notification (runs on the notification thread)"""
+        try:
+            self.tray_icon.notify(message, title)
+        except Exception:
+            # Fallback to messagebox on the UI thread if notification fails
+            from tkinter import messagebox
+            show = {'error': messagebox.showerror, 'reminder': messagebox.showwarning}.get(category, messagebox.showinfo)
+            self.ui.call(show, title, message)
+
+    def start_profiling(self, icon=None, item=None):
+        """Profile the service and trace its allocations for a while, then write reports to the logs folder"""
+        if profiling.schedule_capture(self.profile_capture, self.engine.scheduler, profiling.DEFAULT_SECONDS,
+                                      self.on_profile_written):
+            self.engine.notify("Profiling",
+                               f"Profiling {profiling.CAPTURE_SCOPE} for {profiling.DEFAULT_SECONDS} seconds")
+        else:
+            self.engine.notify("Profiling", "A profile is already being captured")
+
+    def on_profile_written(self, reports):
+        """Say where the reports went (runs on the scheduler thread)"""
+        if reports:
+            self.engine.notify("Profiling", f"Profile written to {reports[0]}")
+
+    def on_profile_signal(self, signum, frame):
+        """SIGUSR1 starts a capture; the handler runs on the main thread, so it only schedules it"""
+        self.start_profiling()
+
+    def quit_app(self, icon=None, item=None):
+        """Quit the application"""
+        self.engine.stop()
+        self.ui.stop()
+        self.tray_icon.stop()
+        sys.exit(0)
+
+    def on_tray_ready(self, icon):
+        """Show the icon once the tray loop is running"""
+        icon.visible = True
+        startup_trace.ready('icon')
+
+    def run(self):
+        """Run the application"""
+        if hasattr(signal, 'SIGUSR1'):
+            signal.signal(signal.SIGUSR1, self.on_profile_signal)
+        profiling.finish_launch(self.profile_capture, self.engine.scheduler, self.on_profile_written)
+        self.tray_icon.run(setup=self.on_tray_ready)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Employee Tracker UI Thread
+A single long-lived hidden Tk root that the tray front-ends open their windows on
+"""
+
+import logging
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class UIThread:
+    """Runs a hidden Tk root on a dedicated thread and executes queued commands on it"""
+
+    def __init__(self):
+        self.root = None
+        self.thread = None
+        self.error = None
+        self.commands = queue.Queue()
+        self.ready = threading.Event()
+        self.lock = threading.Lock()
+        self.wakeups = 0
+
+    def start(self):
+        """Start the UI thread and wait until its Tk root is ready"""
+        with self.lock:
+            if not self.thread:
+                self.thread = threading.Thread(target=self._run, name="ui", daemon=True)
+                self.thread.start()
+        self.ready.wait()
+        return self.error is None
+
+    def _run(self):
+        """Create the hidden root and run its event loop"""
+        # Imported here so the tray starts without loading Tk until a window is needed
+        import tkinter as tk
+
+        try:
+            self.root = tk.Tk()
+            self.root.withdraw()
+            self.root.bind('<<UICommand>>', self._drain)
+        except Exception as e:
+            self.error = e
+            self.root = None
+            self.ready.set()
+            return
+
+        self.ready.set()
+        self.root.mainloop()
+
+    def call(self, func, *args):
+        """Queue a function to run on the UI thread; returns False if Tk is unavailable"""
+        if not self.start():
+            logger.error("UI unavailable: %s", self.error)
+            return False
+
+        import tkinter as tk
+
+        self.commands.put((func, args))
+        try:
+            # Wakes the Tk loop only when there is work, so an idle UI thread costs nothing
+            self.root.event_generate('<<UICommand>>', when='tail')
+        except (RuntimeError, tk.TclError):
+            # Tk is shutting down
+            return False
+        return True
+
+    def _drain(self, event=None):
+        """Run every queued command"""
+        self.wakeups += 1
+        while True:
+            try:
+                func, args = self.commands.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                func(*args)
+            except Exception as e:
+                logger.exception("UI command error: %s", e)
+
+    def is_open(self, window):
+        """Check whether a window created on this thread still exists"""
+        import tkinter as tk
+
+        try:
+            return bool(window and window.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def raise_window(self, window):
+        """Show a hidden window and bring it to the front"""
+        window.deiconify()
+        window.lift()
+        window.focus_force()
+
+    def stop(self):
+        """Stop the Tk event loop"""
+        if self.root:
+            self.call(self.root.quit)
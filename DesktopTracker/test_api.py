@@ -6,16 +6,38 @@ Tests the connection to the Laravel API backend
 
 import requests
 import json
+import shutil
 import sys
-from dotenv import load_dotenv
 import os
+import tempfile
 
-# Load environment variables
-load_dotenv('config.env')
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from tracker_core.settings import SETTINGS_PATH_VARIABLE, SettingsStore, settings_path
+
+# Run by hand, the checks use the user's settings file; under pytest, a temporary one
+test_config_dir = None
+
+def setup_module():
+    """Point the settings at a temporary file under pytest, so the suite never reads, migrates or writes the user's config"""
+    global test_config_dir
+    if not os.getenv(SETTINGS_PATH_VARIABLE):
+        test_config_dir = tempfile.mkdtemp(prefix='tracker-test-')
+        os.environ[SETTINGS_PATH_VARIABLE] = os.path.join(test_config_dir, 'config.env')
+
+def teardown_module():
+    """Remove the temporary settings file"""
+    global test_config_dir
+    if test_config_dir:
+        os.environ.pop(SETTINGS_PATH_VARIABLE, None)
+        shutil.rmtree(test_config_dir, ignore_errors=True)
+        test_config_dir = None
 
 def test_api_connection():
     """Test basic API connection"""
-    api_base_url = os.getenv('API_BASE_URL', 'http://localhost:8080/api')
+    settings = SettingsStore().load()
+    api_base_url = settings.api_base_url
 
     print("🔍 Testing API Connection")
     print("=" * 30)
@@ -49,12 +71,13 @@ def test_api_connection():
 
 def test_with_token():
     """Test API with authentication token"""
-    api_base_url = os.getenv('API_BASE_URL', 'http://localhost:8080/api')
-    api_token = os.getenv('API_TOKEN', '')
+    settings = SettingsStore().load()
+    api_base_url = settings.api_base_url
+    api_token = settings.api_token
 
     if not api_token:
-        print("\n⚠️  No API token found in config.env")
-        print("   Please add your API token to config.env")
+        print("\n⚠️  No API token found in the settings file")
+        print(f"   Please add your API token to {settings_path()}")
         return False
 
     print(f"\n🔑 Testing with API Token")
@@ -90,8 +113,9 @@ def test_with_token():
 
 def test_attendance_endpoints():
     """Test attendance API endpoints"""
-    api_base_url = os.getenv('API_BASE_URL', 'http://localhost:8080/api')
-    api_token = os.getenv('API_TOKEN', '')
+    settings = SettingsStore().load()
+    api_base_url = settings.api_base_url
+    api_token = settings.api_token
 
     if not api_token:
         print("\n⚠️  Skipping attendance tests - No API token")
@@ -6,13 +6,34 @@ Tests the background service functionality
 
 import sys
 import os
+import shutil
+import tempfile
 import time
 import threading
-from dotenv import load_dotenv
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+from tracker_core.settings import SETTINGS_PATH_VARIABLE, SettingsStore, settings_path
+
+# Run by hand, the checks use the user's settings file; under pytest, a temporary one
+test_config_dir = None
+
+def setup_module():
+    """Point the settings at a temporary file under pytest, so the suite never reads, migrates or writes the user's config"""
+    global test_config_dir
+    if not os.getenv(SETTINGS_PATH_VARIABLE):
+        test_config_dir = tempfile.mkdtemp(prefix='tracker-test-')
+        os.environ[SETTINGS_PATH_VARIABLE] = os.path.join(test_config_dir, 'config.env')
+
+def teardown_module():
+    """Remove the temporary settings file"""
+    global test_config_dir
+    if test_config_dir:
+        os.environ.pop(SETTINGS_PATH_VARIABLE, None)
+        shutil.rmtree(test_config_dir, ignore_errors=True)
+        test_config_dir = None
+
 def test_imports():
     """Test if all required modules can be imported"""
     print("🧪 Testing imports...")
@@ -51,16 +72,16 @@ def test_config():
     """Test configuration loading"""
     print("\n🔧 Testing configuration...")
 
-    load_dotenv('config.env')
+    settings = SettingsStore().load()
 
-    api_base_url = os.getenv('API_BASE_URL', 'http://localhost:8080/api')
-    api_token = os.getenv('API_TOKEN', '')
+    api_base_url = settings.api_base_url
+    api_token = settings.api_token
 
     print(f"API Base URL: {api_base_url}")
     print(f"API Token: {'Set' if api_token else 'Not set'}")
 
     if not api_token:
-        print("⚠️  API token not set. Please configure config.env")
+        print(f"⚠️  API token not set. Please configure {settings_path()}")
         return False
 
     return True
@@ -69,9 +90,9 @@ def test_api_connection():
     """Test API connection"""
     print("\n🌐 Testing API connection...")
 
-    load_dotenv('config.env')
-    api_base_url = os.getenv('API_BASE_URL', 'http://localhost:8080/api')
-    api_token = os.getenv('API_TOKEN', '')
+    settings = SettingsStore().load()
+    api_base_url = settings.api_base_url
+    api_token = settings.api_token
 
     if not api_token:
         print("❌ No API token configured")
@@ -186,7 +207,7 @@ def main():
         print("⚠️  Some tests failed. Please check the issues above.")
         print("\n🔧 Common fixes:")
         print("   1. Install dependencies: pip install -r requirements.txt")
-        print("   2. Configure API token in config.env")
+        print(f"   2. Configure API token in {settings_path()}")
         print("   3. Start Laravel backend: php artisan serve --port=8080")
 
 if __name__ == "__main__":
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Virtual clock test harness for Employee Tracker
+Runs simulated workdays against a fake API to test time-based client behavior
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from tracker_core.attendance import AttendanceRecord
+from tracker_core.clock import Clock, VirtualClock
+from tracker_core.engine import TrackerEngine
+from tracker_core.idle import FakeIdleSource, IdleSampler
+from tracker_core.power import FakePowerSource, format_report
+from tracker_core.reminders import DayRollover, break_reminder_message
+from tracker_core.scheduler import Scheduler
+from tracker_core.server_clock import ServerClock
+
+from fake_api import FakeSession, create_store
+
+# The Laravel app's default timezone
+SERVER_TIMEZONE = 'UTC'
+
+
+class FakeAttendanceServer:
+    """In-memory version of the Laravel attendance API running on the virtual clock"""
+
+    def __init__(self, clock, skew_seconds=0, timezone=SERVER_TIMEZONE):
+        self.clock = clock
+        self.skew_seconds = skew_seconds
+        self.timezone = timezone
+        self.records = {}
+        self.calls = []
+
+    def server_now(self):
+        # Wall clock time in the server's timezone, whatever the client's is
+        return datetime.fromtimestamp(self.clock.time() + self.skew_seconds, ZoneInfo(self.timezone))
+
+    def handle(self, method, path):
+        now = self.server_now()
+        self.calls.append((self.clock.now(), method, path))
+        today = now.strftime('%Y-%m-%d')
+        record = self.records.get(today)
+        hms = now.strftime('%H:%M:%S')
+
+        if path == '/attendance/today':
+            return 200, {'success': True, 'date': today, 'timezone': self.timezone, 'data': record}
+        if path == '/attendance/check-in':
+            self.records[today] = {
+                'date': today, 'check_in': hms, 'check_out': None,
+                'break_start': None, 'break_end': None,
+                'total_break_minutes': 0, 'total_work_minutes': 0,
+                'status': 'present' if hms <= '09:00:00' else 'late',
+            }
+        elif path == '/attendance/break-start':
+            record['break_start'] = hms
+        elif path == '/attendance/break-end':
+            started = datetime.strptime(f"{today} {record['break_start']}", '%Y-%m-%d %H:%M:%S')
+            record['break_end'] = hms
+            record['total_break_minutes'] += int((now.replace(tzinfo=None) - started).total_seconds() // 60)
+        elif path == '/attendance/check-out':
+            record['check_out'] = hms
+        else:
+            return 404, {'success': False, 'message': 'Not found'}
+        return 200, {'success': True, 'data': self.records[today]}
+
+
+class AttendanceSession(FakeSession):
+    """Routes ApiClient requests to the fake server"""
+
+    def __init__(self, server):
+        super().__init__(server.clock)
+        self.server = server
+
+    def respond(self, method, path):
+        return self.server.handle(method, path)
+
+    def server_time(self):
+        return self.clock.time() + self.server.skew_seconds
+
+
+class SimulatedClient:
+    """Runs the tracker engine the desktop clients share against the fake server"""
+
+    def __init__(self, clock, server, power_saver=False, power_source=None):
+        self.clock = clock
+        # Settings come from the environment only; the file is never created
+        path = os.path.join(tempfile.gettempdir(), 'employee-tracker-test', 'config.env')
+        store = create_store(path, POWER_SAVER='true' if power_saver else 'false')
+        self.engine = TrackerEngine(lambda title, message, category: None, clock, store,
+                                    AttendanceSession(server), power_management=True,
+                                    power_source=power_source or FakePowerSource(), watch_settings=False)
+        self.api = self.engine.api
+        self.scheduler = self.engine.scheduler
+        self.power = self.engine.power
+        self.reminders = []
+        self.refreshes = []
+        self.progress_ticks = 0
+        self.engine.subscribe('changed', lambda: self.refreshes.append(self.clock.now()))
+        self.engine.subscribe('tick', self.tick_progress)
+        self.reminder_messages = []
+        self.engine.subscribe('reminder', lambda title, message: self.reminders.append(self.clock.now()))
+        self.engine.subscribe('reminder', lambda title, message: self.reminder_messages.append(message))
+        self.engine.start()
+
+    @property
+    def current_attendance(self):
+        return self.engine.current_attendance
+
+    def action(self, name):
+        outcome = self.engine.perform(name)
+        assert outcome and outcome[0], outcome
+
+    def tick_progress(self):
+        self.progress_ticks += 1
+
+
+def at(hour, minute, day=29):
+    """Local datetime on the simulated Monday"""
+    return datetime(2025, 9, day, hour, minute)
+
+
+def server_at(hour, minute, day=29, timezone=SERVER_TIMEZONE):
+    """The moment the server's wall clock shows hour:minute on the simulated Monday"""
+    return datetime(2025, 9, day, hour, minute, tzinfo=ZoneInfo(timezone))
+
+
+def other_timezone():
+    """A server timezone whose UTC offset differs from this machine's"""
+    for name in ('Asia/Kolkata', 'America/New_York'):
+        moment = server_at(12, 0, timezone=name)
+        if moment.utcoffset() != moment.astimezone().utcoffset():
+            return name
+
+
+def assert_near(actual, expected, tolerance=1.5):
+    delta = abs((actual - expected).total_seconds())
+    assert delta <= tolerance, f"{actual} is not within {tolerance}s of {expected}"
+
+
+def run_workday(skew_minutes=0, power_saver=False, power_source=None, server_timezone=SERVER_TIMEZONE):
+    """Simulate a 10-hour workday on the server's wall clock, which runs `skew_minutes` ahead"""
+    skew = skew_minutes * 60
+
+    def local(hour, minute, day=29):
+        # Local time at which the server clock shows hour:minute
+        return datetime.fromtimestamp(server_at(hour, minute, day, server_timezone).timestamp() - skew)
+
+    clock = VirtualClock(local(8, 30))
+    server = FakeAttendanceServer(clock, skew, server_timezone)
+    client = SimulatedClient(clock, server, power_saver, power_source)
+
+    clock.advance_to(local(9, 0))
+    client.action('check_in')
+    clock.advance_to(local(13, 45))
+    client.action('start_break')
+    clock.advance_to(local(14, 15))
+    client.action('end_break')
+    clock.advance_to(local(18, 30))
+    client.action('check_out')
+    clock.advance_to(local(0, 30, day=30))
+    return client, server, local
+
+
+def test_workday_reminders():
+    """Reminders fire exactly 4 hours after check-in and repeat until the break"""
+    print("🧪 Simulating a workday...")
+    started = time.perf_counter()
+    client, server, local = run_workday()
+    elapsed = time.perf_counter() - started
+
+    assert len(client.reminders) == 2, client.reminders
+    assert_near(client.reminders[0], local(13, 0))
+    assert_near(client.reminders[1], local(13, 30))
+    assert "more than 4 hours." in client.reminder_messages[0], client.reminder_messages
+    # The message follows the configured working time
+    assert "more than 1 hour 30 minutes." in break_reminder_message(90)
+    assert "more than 45 minutes." in break_reminder_message(45)
+    assert elapsed < 1.0, f"simulation took {elapsed:.2f}s"
+    print(f"✅ Reminders at {[r.strftime('%H:%M:%S') for r in client.reminders]} in {elapsed * 1000:.0f} ms")
+
+
+def test_no_polling_between_actions():
+    """No API calls are made while nothing happens"""
+    client, server, local = run_workday()
+    idle_calls = [call for call in server.calls if local(9, 1) < call[0] < local(13, 44)]
+    assert not idle_calls, idle_calls
+    # Initial load, 4 actions with a refresh each, and one rollover refresh
+    assert len(server.calls) == 1 + 4 * 2 + 1, server.calls
+    print(f"✅ {len(server.calls)} API calls for the whole day")
+
+
+def test_day_rollover():
+    """Cached attendance is dropped with exactly one refresh at the server's midnight"""
+    client, server, local = run_workday()
+    night = [refresh for refresh in client.refreshes if refresh > local(18, 31)]
+    assert len(night) == 1, night
+    assert_near(night[0], local(0, 0, day=30), tolerance=DayRollover.GRACE_SECONDS + 1.5)
+    assert client.current_attendance is None
+    assert set(client.scheduler.timers) == {DayRollover.TIMER}
+    print(f"✅ Rolled over at {night[0].strftime('%H:%M:%S')}")
+
+
+def test_skewed_server_clock():
+    """Reminders and rollover follow the server clock when the local clock is off"""
+    client, server, local = run_workday(skew_minutes=15)
+    assert abs(client.api.server_clock.offset - 15 * 60) < 1.5
+    assert_near(client.reminders[0], local(13, 0))
+    night = [refresh for refresh in client.refreshes if refresh > local(18, 31)]
+    assert_near(night[0], local(0, 0, day=30), tolerance=DayRollover.GRACE_SECONDS + 1.5)
+    print(f"✅ Server offset {client.api.server_clock.offset:.1f}s; reminder at {client.reminders[0].strftime('%H:%M:%S')} local")
+
+
+def test_server_timezone():
+    """Worked time, reminders and the day rollover follow the server's timezone, not the client's"""
+    timezone = other_timezone()
+    start = datetime.fromtimestamp(server_at(9, 0, timezone=timezone).timestamp())
+    clock = VirtualClock(start)
+    client = SimulatedClient(clock, FakeAttendanceServer(clock, timezone=timezone))
+    client.action('check_in')
+    clock.advance(10 * 60)
+    server_clock = client.api.server_clock
+    assert server_clock.timezone_name == timezone
+    assert abs(client.current_attendance.work_seconds(server_clock.time()) - 10 * 60) <= 1.5
+    assert abs(client.scheduler.due_time('break-reminder') - (start.timestamp() + 4 * 3600)) <= 1.5
+
+    client, server, local = run_workday(server_timezone=timezone)
+    assert_near(client.reminders[0], local(13, 0))
+    # The day rolls over once, at the server's midnight rather than the client's
+    night = [refresh for refresh in client.refreshes if refresh > local(18, 31)]
+    assert len(night) == 1, night
+    assert_near(night[0], local(0, 0, day=30), tolerance=DayRollover.GRACE_SECONDS + 1.5)
+    assert client.current_attendance is None
+    print(f"✅ Server in {timezone}; reminder at {client.reminders[0].strftime('%H:%M:%S')}, "
+          f"rollover at {night[0].strftime('%H:%M:%S')} local")
+
+
+def test_attendance_record():
+    """Attendance is parsed once into epochs with its state and action flags precomputed"""
+    server_clock = ServerClock(VirtualClock(server_at(13, 30)))
+    record = AttendanceRecord.from_api({
+        'date': '2025-09-29T00:00:00.000000Z', 'check_in': '09:00:00', 'check_out': None,
+        'break_start': '13:00:00', 'break_end': None,
+        'total_break_minutes': 0, 'total_work_minutes': 0, 'status': 'present',
+    }, server_clock)
+    assert AttendanceRecord.from_api(None, server_clock) is None
+    assert record.date == '2025-09-29'
+    assert record.check_in == server_at(9, 0).timestamp()
+    assert record.state == 'on_break'
+    assert (record.can_check_in, record.can_check_out, record.can_start_break, record.can_end_break) == \
+        (False, True, False, True)
+    assert record.time_text('check_out', 'Not checked out') == 'Not checked out'
+    assert record.time_text('break_start', '') == server_at(13, 0).astimezone().strftime('%H:%M:%S')
+
+    now = server_at(13, 30).timestamp()
+    assert record.break_seconds(now) == 30 * 60
+    assert record.work_seconds(now) == 4 * 3600
+    assert record.break_reminder_due() is None, "no reminder once the break started"
+
+    working = AttendanceRecord.from_api({'check_in': '09:00', 'status': 'late'}, server_clock)
+    assert working.date == '2025-09-29', "Without a date the record is on the server clock's day"
+    assert working.state == 'working'
+    assert working.break_reminder_due(240) == server_at(13, 0).timestamp()
+
+    # Times are read in the timezone the API reports, not the client's
+    server_clock.set_timezone('Asia/Kolkata')
+    kolkata = AttendanceRecord.from_api({'check_in': '09:00:00', 'status': 'present'}, server_clock, '2025-09-29')
+    assert kolkata.check_in == server_at(9, 0, timezone='Asia/Kolkata').timestamp()
+    assert kolkata.check_in == server_at(3, 30).timestamp()
+    assert not hasattr(working, '__dict__')
+    print(f"✅ {record} and {working}")
+
+
+def test_idle_auto_break():
+    """The idle sampler starts and ends a break with few wakeups"""
+    clock = VirtualClock(at(9, 0))
+    scheduler = Scheduler(clock)
+    scheduler.start()
+    source = FakeIdleSource(clock)
+    events = []
+    sampler = IdleSampler(scheduler, source, 15 * 60,
+                          lambda idle: events.append(('idle', clock.now())),
+                          lambda away: events.append(('active', clock.now())))
+    sampler.start()
+
+    # Two hours of steady input, then 45 minutes away
+    for _ in range(2 * 60):
+        clock.advance(60)
+        source.touch()
+    active_samples = sampler.samples
+    clock.advance(45 * 60)
+    source.touch()
+    clock.advance(5 * 60)
+
+    assert [kind for kind, _ in events] == ['idle', 'active'], events
+    assert_near(events[0][1], at(11, 15))
+    assert_near(events[1][1], at(11, 45), tolerance=sampler.max_interval)
+    # One sample per threshold window while active, not one per second
+    assert active_samples <= 2 * 60 // 15 + 1, active_samples
+    print(f"✅ Auto break {events[0][1].strftime('%H:%M')}-{events[1][1].strftime('%H:%M')}, {sampler.stats()}")
+
+
+def test_power_saver():
+    """Power saver mode merges timers into fewer wakeups and suspends the ring while locked"""
+    normal, _, _ = run_workday()
+    saver, _, _ = run_workday(power_saver=True)
+    locked, _, _ = run_workday(power_saver=True, power_source=FakePowerSource(locked=True))
+
+    normal_wakeups = normal.scheduler.stats()['wakeups']
+    saver_wakeups = saver.scheduler.stats()['wakeups']
+    locked_wakeups = locked.scheduler.stats()['wakeups']
+    assert saver_wakeups * 3 < normal_wakeups, (saver_wakeups, normal_wakeups)
+    assert locked_wakeups < saver_wakeups, (locked_wakeups, saver_wakeups)
+    assert locked.progress_ticks == 0
+    # Only the deferrable timers are coalesced; reminders still arrive on time
+    assert len(saver.reminders) == 2 and len(locked.reminders) == 2
+    assert saver.reminders == normal.reminders, (saver.reminders, normal.reminders)
+    scheduler = saver.scheduler
+    scheduler.schedule_in('test-exact', 7, lambda: None)
+    scheduler.schedule_in('test-deferred', 7, lambda: None, coalesce=True)
+    assert scheduler.due_time('test-exact') == saver.clock.time() + 7
+    assert scheduler.due_time('test-deferred') % saver.power.coalesce_seconds == 0
+    # Timers never cost extra API calls
+    assert saver.api.calls == normal.api.calls
+
+    report = format_report(saver.power.stats(saver.api))
+    assert 'power saver' in report
+    print(f"✅ Wakeups per day: normal {normal_wakeups}, power saver {saver_wakeups}, locked {locked_wakeups}")
+
+
+class JumpingClock(Clock):
+    """The system clock plus an offset, like a wall clock after the machine resumes from sleep"""
+
+    def __init__(self):
+        self.offset = 0
+
+    def time(self):
+        return time.time() + self.offset
+
+
+def test_wall_clock_jump():
+    """A timer whose deadline passes while the machine sleeps runs at the next re-check, not a wait later"""
+    clock = JumpingClock()
+    scheduler = Scheduler(clock, max_wait=0.05)
+    fired = []
+    scheduler.start()
+    try:
+        scheduler.schedule_in('reminder', 3600, lambda: fired.append(clock.time()))
+        time.sleep(0.1)
+        assert not fired
+        # An hour of sleep passes on the wall clock but not on the monotonic clock the wait counts
+        clock.offset = 3600
+        deadline = time.monotonic() + 2
+        while not fired and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        scheduler.stop()
+    assert fired, "The timer did not run after the wall clock jumped past its deadline"
+    print(f"✅ Timer ran after the jump with {scheduler.stats()['wakeups']} wakeups")
+
+
+def test_failing_timer():
+    """A timer that raises is logged and does not stop the other timers due on a virtual clock"""
+    clock = VirtualClock(datetime(2025, 9, 29, 9, 0))
+    scheduler = Scheduler(clock)
+    scheduler.start()
+    fired = []
+
+    def fail():
+        fired.append('fail')
+        raise RuntimeError("boom")
+
+    scheduler.schedule_in('first', 60, fail)
+    scheduler.schedule_in('second', 60, lambda: fired.append('second'))
+    scheduler.schedule_in('later', 120, lambda: fired.append('later'))
+    clock.advance(180)
+
+    assert fired == ['fail', 'second', 'later'], fired
+    stats = scheduler.stats()
+    assert stats['timers_run'] == 3 and stats['pending'] == 0, stats
+    assert stats['wakeups'] == 2, stats
+
+
+def main():
+    """Main test function"""
+    print("🧪 Employee Tracker Virtual Clock Test Suite")
+    print("=" * 60)
+
+    tests = [
+        ("Workday Reminder Test", test_workday_reminders),
+        ("Idle Polling Test", test_no_polling_between_actions),
+        ("Day Rollover Test", test_day_rollover),
+        ("Clock Skew Test", test_skewed_server_clock),
+        ("Server Timezone Test", test_server_timezone),
+        ("Attendance Record Test", test_attendance_record),
+        ("Idle Auto Break Test", test_idle_auto_break),
+        ("Power Saver Test", test_power_saver),
+        ("Wall Clock Jump Test", test_wall_clock_jump),
+        ("Failing Timer Test", test_failing_timer),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        print(f"\n📋 Running {test_name}...")
+        try:
+            test_func()
+            print(f"✅ {test_name} PASSED")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+
+    print("\n" + "=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
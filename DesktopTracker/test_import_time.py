@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Import time budget check for Employee Tracker
+Measures each desktop entry point with `python -X importtime` and fails when one gets slower
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+
+# Cumulative import time budget per entry point in milliseconds. The tray
+# entry points are started on login, so they get the tightest budgets.
+# Set IMPORT_BUDGET_SCALE on slow machines, e.g. IMPORT_BUDGET_SCALE=2.
+IMPORT_BUDGETS_MS = {
+    'main': 200,
+    'tray_app': 225,
+    'background_service': 225,
+}
+
+# Modules an entry point must not load at import time; they are imported
+# on first use instead
+LAZY_MODULES = {
+    'main': ['tkinter.simpledialog', 'PIL', 'pystray'],
+    'tray_app': ['tkinter', 'PIL.ImageDraw', 'PIL.ImageFont'],
+    'background_service': ['tkinter', 'PIL.ImageDraw', 'PIL.ImageFont'],
+}
+
+RUNS = 3
+
+# Shows every tray icon from prebuilt assets and reports which drawing modules got loaded
+PREBUILT_ICONS_CODE = """
+import sys
+sys.path.insert(0, {src!r})
+from tracker_core import tray_icons
+cache = tray_icons.IconCache(asset_dir={asset_dir!r})
+for state in tray_icons.ICON_STYLES:
+    cache.get(state)
+    for step in range(0, tray_icons.RING_STEPS + 1, 8):
+        cache.get_progress(state, step // 2, step)
+print(','.join(name for name in ('PIL.ImageDraw', 'PIL.ImageFont') if name in sys.modules))
+"""
+
+
+def measure_imports(module):
+    """Import a module in a fresh interpreter; returns (cumulative ms, imported module names)"""
+    env = dict(os.environ)
+    # The dummy backend lets the tray entry points import without a display
+    env.setdefault('PYSTRAY_BACKEND', 'dummy')
+    code = f"import sys; sys.path.insert(0, {SRC_DIR!r}); import {module}"
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, env=env, timeout=60)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    cumulative_us = None
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not cumulative.strip().isdigit():
+            continue  # Header line
+        imported.add(name.strip())
+        # Nested imports are indented; the entry point is the top-level line
+        if name.rstrip() == f" {module}":
+            cumulative_us = int(cumulative)
+    return cumulative_us / 1000, imported
+
+
+def check_entry_point(module):
+    """Measure an entry point; returns (median ms, budget ms, eagerly imported lazy modules)"""
+    budget = IMPORT_BUDGETS_MS[module] * float(os.getenv('IMPORT_BUDGET_SCALE', 1))
+    timings = []
+    for _ in range(RUNS):
+        elapsed, imported = measure_imports(module)
+        timings.append(elapsed)
+    eager = [name for name in LAZY_MODULES[module] if name in imported]
+    return statistics.median(timings), budget, eager
+
+
+def assert_within_budget(module):
+    elapsed, budget, eager = check_entry_point(module)
+    print(f"⏱️  {module}: {elapsed:.1f} ms (budget {budget:.0f} ms)")
+    assert not eager, f"{module} imports {', '.join(eager)} at startup"
+    assert elapsed <= budget, f"{module} took {elapsed:.1f} ms to import, budget is {budget:.0f} ms"
+
+
+def test_main_import_time():
+    """The desktop GUI imports within its budget"""
+    assert_within_budget('main')
+
+
+def test_tray_app_import_time():
+    """The tray app imports within its budget without loading Tk"""
+    assert_within_budget('tray_app')
+
+
+def test_background_service_import_time():
+    """The background service imports within its budget without loading Tk"""
+    assert_within_budget('background_service')
+
+
+def test_prebuilt_tray_icons():
+    """With the build-time icon assets the tray icons are loaded, not drawn"""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import build_icons
+
+    asset_dir = tempfile.mkdtemp(prefix='tracker-icons-')
+    try:
+        build_icons.render_tray_assets(asset_dir)
+        code = PREBUILT_ICONS_CODE.format(src=SRC_DIR, asset_dir=asset_dir)
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, timeout=60)
+    finally:
+        shutil.rmtree(asset_dir, ignore_errors=True)
+    assert result.returncode == 0, f"Loading the tray icons failed:\n{result.stderr[-2000:]}"
+    drawing = result.stdout.strip()
+    assert not drawing, f"Loading prebuilt tray icons imported {drawing}"
+
+
+def main():
+    """Main test function"""
+    print("🧪 Employee Tracker Import Time Check")
+    print("=" * 60)
+
+    tests = [
+        ("Desktop GUI Import Test", test_main_import_time),
+        ("Tray App Import Test", test_tray_app_import_time),
+        ("Background Service Import Test", test_background_service_import_time),
+        ("Prebuilt Tray Icons Test", test_prebuilt_tray_icons),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        print(f"\n📋 Running {test_name}...")
+        try:
+            test_func()
+            print(f"✅ {test_name} PASSED")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+
+    print("\n" + "=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
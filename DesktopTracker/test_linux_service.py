@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Linux service installer test script for Employee Tracker
+Renders the systemd user units and the autostart entry without installing anything
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import install_linux_service as installer
+
+
+@contextlib.contextmanager
+def config_home():
+    """Point XDG_CONFIG_HOME at a temporary directory"""
+    directory = tempfile.mkdtemp(prefix='tracker-linux-service-')
+    previous = os.environ.get('XDG_CONFIG_HOME')
+    os.environ['XDG_CONFIG_HOME'] = directory
+    try:
+        yield directory
+    finally:
+        if previous is None:
+            os.environ.pop('XDG_CONFIG_HOME', None)
+        else:
+            os.environ['XDG_CONFIG_HOME'] = previous
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_systemd_units():
+    """The service restarts with backoff and only starts once configured; the path unit starts it"""
+    with config_home() as home:
+        config = os.path.join(home, 'employee-tracker', 'config.env')
+        files = installer.render_files(config, ['/usr/bin/python3', '/opt/tracker/src/background_service.py'])
+
+        service = files[os.path.join(home, 'systemd', 'user', 'employee-tracker.service')]
+        path_unit = files[os.path.join(home, 'systemd', 'user', 'employee-tracker.path')]
+        desktop = files[os.path.join(home, 'autostart', 'employee-tracker.desktop')]
+
+    assert 'ExecStart=/usr/bin/python3 /opt/tracker/src/background_service.py\n' in service
+    assert f'ConditionPathExists={config}\n' in service
+    assert 'Restart=on-failure\n' in service
+    assert f'RestartSteps={installer.RESTART_STEPS}\n' in service
+    assert f'RestartMaxDelaySec={installer.RESTART_MAX_DELAY_SEC}\n' in service
+    assert 'WantedBy=graphical-session.target\n' in service
+    assert f'PathChanged={config}\n' in path_unit
+    assert 'Unit=employee-tracker.service\n' in path_unit
+    assert 'systemctl --user start employee-tracker.service' in desktop
+
+
+def test_quoting():
+    """Paths with spaces and percent signs survive systemd and desktop entry parsing"""
+    with config_home() as home:
+        config = os.path.join(home, '100% sure', 'config.env')
+        command = ['/opt/Employee Tracker/EmployeeTrackerService']
+        files = installer.render_files(config, command, environment={'EMPLOYEE_TRACKER_CONFIG': config})
+        service = files[os.path.join(home, 'systemd', 'user', 'employee-tracker.service')]
+        desktop = installer.render_files(config, command, use_systemd=False)[
+            os.path.join(home, 'autostart', 'employee-tracker.desktop')]
+
+    escaped = config.replace('%', '%%')
+    assert 'ExecStart="/opt/Employee Tracker/EmployeeTrackerService"\n' in service
+    assert f'ConditionPathExists={escaped}\n' in service
+    assert f'Environment="EMPLOYEE_TRACKER_CONFIG={escaped}"\n' in service
+    assert 'Exec="/opt/Employee Tracker/EmployeeTrackerService"\n' in desktop
+
+
+def test_dry_run_writes_nothing():
+    """--dry-run prints every file and systemctl call and leaves the disk alone"""
+    with config_home() as home:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            exit_code = installer.main(['--dry-run'])
+        written = [os.path.join(folder, name) for folder, _, names in os.walk(home) for name in names]
+
+    printed = output.getvalue()
+    assert exit_code == 0
+    assert not written, f"Dry run wrote {written}"
+    assert '[Service]' in printed and '[Path]' in printed and '[Desktop Entry]' in printed
+    assert 'Would run: systemctl --user enable employee-tracker.service employee-tracker.path' in printed
+
+
+def main():
+    """Main test function"""
+    print("🧪 Employee Tracker Linux Service Installer Test")
+    print("=" * 60)
+
+    tests = [
+        ("Systemd Units Test", test_systemd_units),
+        ("Quoting Test", test_quoting),
+        ("Dry Run Test", test_dry_run_writes_nothing),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        print(f"\n📋 Running {test_name}...")
+        try:
+            test_func()
+            print(f"✅ {test_name} PASSED")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+
+    print("\n" + "=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
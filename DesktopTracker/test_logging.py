@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Structured logging test script for Employee Tracker
+Checks the JSON log lines, request correlation ids, rotation with compression and the non-blocking queue
+"""
+
+import gzip
+import json
+import logging
+import os
+import queue
+import shutil
+import sys
+import tempfile
+import time
+from logging.handlers import QueueListener
+
+import requests
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from tracker_core import logs
+from tracker_core.api_client import ApiClient
+from tracker_core.clock import VirtualClock
+
+from fake_api import BASE_URL, FakeSession
+
+
+class RecordingSession(FakeSession):
+    """Answers with the next status code; the base class keeps the headers of every request"""
+
+    def __init__(self, clock, statuses):
+        super().__init__(clock)
+        self.statuses = list(statuses)
+
+    def respond(self, method, path):
+        status = self.statuses.pop(0)
+        return status, {'success': status < 400}
+
+
+class SlowHandler(logging.Handler):
+    """A handler stuck on a slow disk"""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+        self.records = []
+
+    def emit(self, record):
+        time.sleep(self.delay)
+        self.records.append(record)
+
+
+def read_lines(path):
+    """Read the JSON lines of a plain or gzip-compressed log file"""
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_request_correlation():
+    """Each request sends its own X-Request-Id, and the log lines made for it carry the same id"""
+    directory = tempfile.mkdtemp(prefix='tracker-logs-')
+    root = logging.getLogger()
+    saved = (list(root.handlers), root.level)
+    try:
+        logs.setup_logging('test', directory=directory)
+        clock = VirtualClock()
+        session = RecordingSession(clock, [200, 500])
+        client = ApiClient(BASE_URL, clock, session)
+        client.request('GET', '/attendance/today', {'Accept': 'application/json'})
+        try:
+            client.request('POST', '/attendance/check-in', {})
+            assert False, "A 500 response should raise"
+        except requests.exceptions.HTTPError:
+            pass
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger('test').exception("Handled error")
+        logs.stop_logging()
+        entries = read_lines(os.path.join(directory, 'test.log'))
+    finally:
+        logs.stop_logging()
+        root.handlers[:], root.level = saved
+        shutil.rmtree(directory, ignore_errors=True)
+
+    first, second = (headers[logs.CORRELATION_HEADER] for headers in session.headers)
+    assert first != second
+    assert session.headers[0]['Accept'] == 'application/json'
+    requests_logged = [entry for entry in entries if entry['logger'] == 'tracker_core.api_client']
+    assert [entry['correlation_id'] for entry in requests_logged] == [first, second]
+    assert requests_logged[0]['status'] == 200 and requests_logged[0]['level'] == 'INFO'
+    assert requests_logged[1]['status'] == 500 and requests_logged[1]['level'] == 'WARNING'
+    assert requests_logged[1]['endpoint'] == '/attendance/check-in'
+
+    handled = entries[-1]
+    assert handled['message'] == "Handled error"
+    assert 'correlation_id' not in handled
+    assert 'ValueError: boom' in handled['exception']
+
+
+def test_rotation():
+    """Files are rotated by size and by age, compressed, and only backup_count of them are kept"""
+    directory = tempfile.mkdtemp(prefix='tracker-logs-')
+    path = os.path.join(directory, 'test.log')
+    try:
+        handler = logs.create_file_handler(path, max_bytes=300, max_age_seconds=3600, backup_count=2)
+        handler.setFormatter(logs.JsonFormatter())
+        logger = logging.getLogger('test.rotation')
+        logger.propagate = False
+        logger.addHandler(handler)
+        for number in range(20):
+            logger.warning("Record %d", number)
+        by_size = sorted(os.listdir(directory))
+
+        # Age rotation: a file older than the limit is rotated on the next record
+        handler.rollover_at = time.time() - 1
+        logger.warning("After a day")
+        newest = read_lines(path)
+        rotated = read_lines(path + '.1.gz')
+        logger.removeHandler(handler)
+        handler.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    assert by_size == ['test.log', 'test.log.1.gz', 'test.log.2.gz'], by_size
+    assert [entry['message'] for entry in newest] == ["After a day"]
+    assert rotated[-1]['message'] == "Record 19"
+
+
+def test_logging_does_not_block():
+    """Logging calls return immediately while a slow handler writes on the listener thread"""
+    records = queue.SimpleQueue()
+    slow = SlowHandler(0.05)
+    listener = QueueListener(records, slow)
+    logger = logging.getLogger('test.async')
+    logger.propagate = False
+    handler = logs.queue_handler(records)
+    logger.addHandler(handler)
+    listener.start()
+    try:
+        started = time.monotonic()
+        for number in range(20):
+            logger.warning("Record %d", number)
+        elapsed = time.monotonic() - started
+    finally:
+        listener.stop()
+        logger.removeHandler(handler)
+
+    assert elapsed < 0.5, f"Logging blocked for {elapsed:.2f}s"
+    assert [record.getMessage() for record in slow.records] == [f"Record {number}" for number in range(20)]
+
+
+def main():
+    """Main test function"""
+    print("🧪 Employee Tracker Structured Logging Test")
+    print("=" * 60)
+
+    tests = [
+        ("Request Correlation Test", test_request_correlation),
+        ("Rotation Test", test_rotation),
+        ("Non-Blocking Logging Test", test_logging_does_not_block),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        print(f"\n📋 Running {test_name}...")
+        try:
+            test_func()
+            print(f"✅ {test_name} PASSED")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+
+    print("\n" + "=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
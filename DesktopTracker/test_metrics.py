@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Request metrics test script for Employee Tracker
+Checks the metrics registry, the localhost Prometheus exporter and the periodic dump against a fake API
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import urllib.error
+import urllib.request
+
+import requests
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from tracker_core.clock import VirtualClock
+from tracker_core.engine import TrackerEngine
+from tracker_core.metrics import MetricsExporter, MetricsRegistry
+
+from fake_api import FakeSession, create_store
+
+
+class ScriptedSession(FakeSession):
+    """Answers every request with the next (status, seconds) step, advancing the clock by the latency"""
+
+    def __init__(self, clock, steps):
+        super().__init__(clock)
+        self.steps = list(steps)
+
+    def respond(self, method, path):
+        status, seconds = self.steps.pop(0) if self.steps else (200, 0.01)
+        self.clock.advance(seconds)
+        if status is None:
+            raise requests.exceptions.ConnectionError("Connection refused")
+        return status, {'success': status < 400, 'data': None}
+
+
+def create_engine(clock, session, config_dir, **environ):
+    """Create an engine whose settings come from the environment only"""
+    store = create_store(os.path.join(config_dir, 'config.env'), **environ)
+    return TrackerEngine(lambda title, message, category: None, clock, store, session, watch_settings=False)
+
+
+def test_registry_format():
+    """Histogram buckets are cumulative and labels are escaped in the exposition format"""
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.5, 3.0):
+        registry.observe('tracker_api_request_duration_seconds', seconds, endpoint='/attendance/today')
+    registry.inc('tracker_api_responses_total', endpoint='/a"b', status=200)
+    registry.gauge('tracker_queue_depth', lambda: 4, queue='notifications')
+    text = registry.render()
+
+    assert '# TYPE tracker_api_request_duration_seconds histogram' in text
+    assert 'tracker_api_request_duration_seconds_bucket{endpoint="/attendance/today",le="0.1"} 1\n' in text
+    assert 'tracker_api_request_duration_seconds_bucket{endpoint="/attendance/today",le="1"} 2\n' in text
+    assert 'tracker_api_request_duration_seconds_bucket{endpoint="/attendance/today",le="+Inf"} 3\n' in text
+    assert 'tracker_api_request_duration_seconds_count{endpoint="/attendance/today"} 3\n' in text
+    assert 'tracker_api_responses_total{endpoint="/a\\"b",status="200"} 1\n' in text
+    assert 'tracker_queue_depth{queue="notifications"} 4\n' in text
+
+
+def test_request_metrics():
+    """Each request records its latency and status code; failures without a response count as errors"""
+    clock = VirtualClock()
+    session = ScriptedSession(clock, [(200, 0.2), (500, 0.04), (None, 3.0)])
+    config_dir = tempfile.mkdtemp(prefix='tracker-metrics-')
+    try:
+        engine = create_engine(clock, session, config_dir)
+        engine.start()
+        engine.make_api_request('GET', '/attendance/today')
+        engine.make_api_request('POST', '/attendance/check-in')
+        engine.stop()
+    finally:
+        shutil.rmtree(config_dir, ignore_errors=True)
+
+    metrics = engine.metrics
+    today = {'method': 'GET', 'endpoint': '/attendance/today'}
+    assert metrics.value('tracker_api_request_duration_seconds', **today) == 2
+    assert metrics.value('tracker_api_responses_total', status=200, **today) == 1
+    assert metrics.value('tracker_api_responses_total', status=500, **today) == 1
+    assert metrics.value('tracker_api_errors_total', method='POST', endpoint='/attendance/check-in',
+                         error='ConnectionError') == 1
+    # The connection error never got a response, so it has no latency sample
+    assert metrics.value('tracker_api_request_duration_seconds', method='POST', endpoint='/attendance/check-in') == 0
+    assert 'tracker_queue_depth{queue="timers"}' in metrics.render()
+
+
+def test_exporter():
+    """The exporter serves the registry in the Prometheus text format on localhost only"""
+    registry = MetricsRegistry()
+    registry.inc('tracker_api_responses_total', method='GET', endpoint='/attendance/today', status=200)
+    exporter = MetricsExporter(registry, 0)
+    assert exporter.start()
+    try:
+        with urllib.request.urlopen(f'http://127.0.0.1:{exporter.port}/metrics', timeout=5) as response:
+            content_type = response.headers['Content-Type']
+            body = response.read().decode('utf-8')
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{exporter.port}/other', timeout=5)
+            assert False, "Unknown paths should return 404"
+        except urllib.error.HTTPError as e:
+            assert e.code == 404
+    finally:
+        exporter.stop()
+
+    assert exporter.server is None
+    assert content_type.startswith('text/plain; version=0.0.4')
+    assert 'tracker_api_responses_total{endpoint="/attendance/today",method="GET",status="200"} 1' in body
+
+
+def test_periodic_dump():
+    """With METRICS_DUMP_MINUTES the metrics are written next to the settings file, and once more on exit"""
+    clock = VirtualClock()
+    config_dir = tempfile.mkdtemp(prefix='tracker-metrics-')
+    try:
+        engine = create_engine(clock, ScriptedSession(clock, []), config_dir, METRICS_DUMP_MINUTES='5')
+        engine.start()
+        started = clock.time()
+        dump_path = os.path.join(config_dir, 'metrics.json')
+        assert not os.path.exists(dump_path)
+
+        clock.advance(11 * 60)
+        assert engine.metrics_service.dumps == 2
+        with open(dump_path) as f:
+            snapshot = json.load(f)
+        engine.stop()
+        assert engine.metrics_service.dumps == 3
+    finally:
+        shutil.rmtree(config_dir, ignore_errors=True)
+
+    samples = snapshot['histograms']['tracker_api_request_duration_seconds']
+    assert samples[0]['endpoint'] == '/attendance/today' and samples[0]['count'] == 1
+    # The last periodic dump ran at the 10 minute mark
+    assert snapshot['time'] == started + 10 * 60
+
+
+def main():
+    """Main test function"""
+    print("🧪 Employee Tracker Request Metrics Test")
+    print("=" * 60)
+
+    tests = [
+        ("Registry Format Test", test_registry_format),
+        ("Request Metrics Test", test_request_metrics),
+        ("Exporter Test", test_exporter),
+        ("Periodic Dump Test", test_periodic_dump),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        print(f"\n📋 Running {test_name}...")
+        try:
+            test_func()
+            print(f"✅ {test_name} PASSED")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+
+    print("\n" + "=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
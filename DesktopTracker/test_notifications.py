@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Notification queue test script for Employee Tracker
+Checks de-duplication, burst coalescing and rate limits on a fake clock, then delivery on the worker thread
+"""
+
+import os
+import sys
+import threading
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from tracker_core.notifications import DEDUPE_SECONDS, RATE_LIMITS, NotificationQueue
+
+
+class FakeClock:
+    """A monotonic clock that only moves when told to"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def create_queue(clock):
+    """Create a queue that is drained by the test instead of a worker thread"""
+    queue = NotificationQueue(lambda title, message, category: None, clock=clock)
+    # Marked as running so post() doesn't start the worker
+    queue.running = True
+    return queue
+
+
+def drain(queue):
+    """Deliver every due category; returns the (title, message, category) tuples that would be shown"""
+    with queue.condition:
+        return queue._prepare(queue._next_batch())
+
+
+def test_deduplication():
+    """Repeated reminders and errors are dropped for DEDUPE_SECONDS; other categories are always shown"""
+    clock = FakeClock()
+    queue = create_queue(clock)
+
+    assert queue.post("Break", "Time for a break", 'reminder')
+    assert not queue.post("Break", "Time for a break", 'reminder'), "A queued duplicate should be dropped"
+    assert drain(queue) == [("Break", "Time for a break", 'reminder')]
+
+    clock.advance(DEDUPE_SECONDS - 1)
+    assert not queue.post("Break", "Time for a break", 'reminder'), "A recent duplicate should be dropped"
+    clock.advance(1)
+    assert queue.post("Break", "Time for a break", 'reminder')
+    assert drain(queue) == [("Break", "Time for a break", 'reminder')]
+
+    # Confirmations the user asked for are shown every time
+    for _ in range(2):
+        assert queue.post("Success", "Checked in", 'success')
+        assert drain(queue) == [("Success", "Checked in", 'success')]
+    assert queue.stats()['duplicates'] == 2
+
+
+def test_error_coalescing():
+    """Errors within the burst window are delivered as one summary"""
+    clock = FakeClock()
+    queue = create_queue(clock)
+
+    for number in range(3):
+        assert queue.post("Error", f"Request {number} failed", 'error')
+    assert queue.depth() == 3
+    assert queue.pending['error'][0] == clock() + 2.0
+
+    clock.advance(2)
+    assert drain(queue) == [("Error (+2 more)", "Request 0 failed", 'error')]
+    stats = queue.stats()
+    assert stats['coalesced'] == 2 and stats['delivered'] == 1 and stats['pending'] == 0
+    # Every message of the burst counts as sent for de-duplication
+    assert not queue.post("Error", "Request 2 failed", 'error')
+
+
+def test_rate_limit():
+    """Each category shows at most its limit per window"""
+    clock = FakeClock()
+    queue = create_queue(clock)
+    limit, window = RATE_LIMITS['info']
+
+    delivered = []
+    for number in range(limit + 2):
+        queue.post("Info", f"Message {number}", 'info')
+        delivered.extend(drain(queue))
+    assert len(delivered) == limit
+    assert queue.stats()['rate_limited'] == 2
+
+    clock.advance(window)
+    queue.post("Info", "After the window", 'info')
+    assert drain(queue) == [("Info", "After the window", 'info')]
+    assert queue.stats()['suppressed'] == 2
+
+
+def test_worker_delivery():
+    """The worker thread delivers each notification with its category"""
+    delivered = []
+    done = threading.Event()
+
+    def deliver(title, message, category):
+        delivered.append((title, message, category))
+        if len(delivered) == 2:
+            done.set()
+
+    queue = NotificationQueue(deliver, burst_seconds={})
+    try:
+        queue.post("Success", "Checked in", 'success')
+        queue.post("Reminder", "Time for a break", 'reminder')
+        assert done.wait(5), "Notifications were not delivered"
+    finally:
+        queue.stop()
+    assert sorted(delivered) == [("Reminder", "Time for a break", 'reminder'), ("Success", "Checked in", 'success')]
+
+
+def main():
+    """Main test function"""
+    print("🧪 Employee Tracker Notification Queue Test")
+    print("=" * 60)
+
+    tests = [
+        ("De-duplication Test", test_deduplication),
+        ("Error Coalescing Test", test_error_coalescing),
+        ("Rate Limit Test", test_rate_limit),
+        ("Worker Delivery Test", test_worker_delivery),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        print(f"\n📋 Running {test_name}...")
+        try:
+            test_func()
+            print(f"✅ {test_name} PASSED")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+
+    print("\n" + "=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
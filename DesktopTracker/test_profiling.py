@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Profiling hooks test script for Employee Tracker
+Runs time-boxed cProfile and tracemalloc captures on a virtual clock and checks the reports they write
+"""
+
+import os
+import pstats
+import shutil
+import sys
+import tempfile
+import tracemalloc
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from tracker_core import logs, profiling
+from tracker_core.clock import VirtualClock
+from tracker_core.scheduler import Scheduler
+
+
+def build_report_lines(count):
+    """Allocate enough to show up in the allocation diff"""
+    return [f"line {number}" * 4 for number in range(count)]
+
+
+def test_requested_seconds():
+    """EMPLOYEE_TRACKER_PROFILE takes seconds, capped at MAX_SECONDS; other values use the default"""
+    assert profiling.requested_seconds('') is None
+    assert profiling.requested_seconds('0') is None
+    assert profiling.requested_seconds('90') == 90
+    assert profiling.requested_seconds('100000') == profiling.MAX_SECONDS
+    assert profiling.requested_seconds('yes') == profiling.DEFAULT_SECONDS
+
+
+def test_capture_reports():
+    """A capture writes a pstats file, a profile summary and an allocation diff"""
+    directory = tempfile.mkdtemp(prefix='tracker-profile-')
+    try:
+        capture = profiling.ProfileCapture('test', directory)
+        assert capture.start()
+        assert not capture.start(), "A second capture should not start while one is running"
+        kept = build_report_lines(20000)
+        reports = capture.stop()
+
+        assert len(reports) == 3 and all(os.path.exists(path) for path in reports)
+        stats = pstats.Stats(reports[0])
+        assert any(name == 'build_report_lines' for _, _, name in stats.stats), "Profiled function missing"
+        with open(reports[1]) as f:
+            assert 'build_report_lines' in f.read()
+        with open(reports[2]) as f:
+            allocations = f.read()
+        assert 'test_profiling.py' in allocations
+        assert 'Traced memory' in allocations
+        assert not tracemalloc.is_tracing(), "tracemalloc should stop with the capture"
+        assert capture.stop() == []
+        del kept
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_scheduled_capture():
+    """A scheduled capture starts and stops on the scheduler thread and reports back once"""
+    directory = tempfile.mkdtemp(prefix='tracker-profile-')
+    clock = VirtualClock()
+    scheduler = Scheduler(clock)
+    scheduler.start()
+    written = []
+    try:
+        capture = profiling.ProfileCapture('test', directory)
+        assert profiling.schedule_capture(capture, scheduler, 30, written.append)
+        assert not profiling.schedule_capture(capture, scheduler, 30, written.append)
+
+        clock.advance(0)
+        assert capture.running
+        scheduler.schedule_in('work', 10, lambda: build_report_lines(1000))
+        clock.advance(30)
+
+        assert not capture.running
+        assert len(written) == 1 and len(written[0]) == 3
+        stats = pstats.Stats(written[0][0])
+        assert any(name == 'build_report_lines' for _, _, name in stats.stats)
+        # Another capture can be started once the last one is done
+        assert profiling.schedule_capture(capture, scheduler, 30)
+    finally:
+        scheduler.stop()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_launch_profile():
+    """With EMPLOYEE_TRACKER_PROFILE the launch is profiled, then the running app for that many seconds"""
+    directory = tempfile.mkdtemp(prefix='tracker-profile-')
+    environ = {profiling.PROFILE_VARIABLE: '45', logs.LOG_DIR_VARIABLE: directory}
+    saved = {name: os.environ.get(name) for name in environ}
+    os.environ.update(environ)
+    clock = VirtualClock()
+    scheduler = Scheduler(clock)
+    scheduler.start()
+    try:
+        assert profiling.profile_launch('test') is not None
+        build_report_lines(1000)
+        capture = profiling.ProfileCapture('test', directory)
+        assert profiling.finish_launch(capture, scheduler)
+        assert profiling.launch_capture is None
+        clock.advance(0)
+        assert scheduler.due_time(profiling.STOP_TIMER) == clock.time() + 45
+
+        clock.advance(45)
+        names = sorted(os.listdir(directory))
+    finally:
+        scheduler.stop()
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        shutil.rmtree(directory, ignore_errors=True)
+
+    assert len([name for name in names if name.endswith('-launch.pstats')]) == 1, names
+    assert len([name for name in names if name.endswith('-capture.pstats')]) == 1, names
+    assert len(names) == 6, names
+
+
+def main():
+    """Main test function"""
+    print("🧪 Employee Tracker Profiling Hooks Test")
+    print("=" * 60)
+
+    tests = [
+        ("Requested Seconds Test", test_requested_seconds),
+        ("Capture Reports Test", test_capture_reports),
+        ("Scheduled Capture Test", test_scheduled_capture),
+        ("Launch Profile Test", test_launch_profile),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        print(f"\n📋 Running {test_name}...")
+        try:
+            test_func()
+            print(f"✅ {test_name} PASSED")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+
+    print("\n" + "=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
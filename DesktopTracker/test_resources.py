@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Resource budget check for Employee Tracker
+Starts the tracker engine of each front-end against a stub API and fails when its memory or thread count grows
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(ROOT_DIR, 'src')
+
+# Resident memory (MB) and thread budgets per front-end once it has loaded
+# today's attendance. The window and tray icon are not created here, so the
+# budgets cover the front-end's imports plus the engine features it enables:
+# the main thread, the scheduler and the notification worker. When watchdog is
+# installed the settings watcher adds WATCHDOG_THREADS (observer and emitter).
+# Set RESOURCE_BUDGET_SCALE on unusual platforms, e.g. RESOURCE_BUDGET_SCALE=1.5.
+RSS_BUDGET_MB = {
+    'main': 40,
+    'tray_app': 40,
+    'background_service': 40,
+}
+THREAD_BUDGETS = {
+    'main': 3,
+    'tray_app': 3,
+    'background_service': 3,
+}
+WATCHDOG_THREADS = 2
+
+# Runs in a fresh interpreter: import the front-end, start its engine, report the footprint
+MEASURE_CODE = """
+import json, sys
+sys.path.insert(0, {src!r})
+import {module} as frontend
+from tracker_core import startup_trace
+from tracker_core.engine import TrackerEngine
+engine = TrackerEngine(lambda title, message, category: None, **frontend.ENGINE_FEATURES)
+engine.start()
+usage = startup_trace.resource_usage()
+usage['loaded'] = engine.current_attendance is not None
+usage['api_calls'] = engine.api.calls
+usage['watchdog'] = bool(engine.settings_watcher and engine.settings_watcher.observer)
+engine.stop()
+print(json.dumps(usage))
+"""
+
+
+def measure_engine(module, base_url):
+    """Start a front-end's engine in a fresh interpreter; returns its resource usage"""
+    config_dir = tempfile.mkdtemp(prefix='tracker-resources-')
+    env = dict(os.environ,
+               API_BASE_URL=base_url,
+               API_TOKEN='budget-token',
+               EMPLOYEE_TRACKER_CONFIG=os.path.join(config_dir, 'config.env'))
+    # The dummy backend lets the tray front-ends import without a display
+    env.setdefault('PYSTRAY_BACKEND', 'dummy')
+    result = subprocess.run([sys.executable, '-c', MEASURE_CODE.format(src=SRC_DIR, module=module)],
+                            capture_output=True, text=True, env=env, timeout=60)
+    shutil.rmtree(config_dir, ignore_errors=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Starting the {module} engine failed:\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def assert_within_budget(module):
+    sys.path.insert(0, ROOT_DIR)
+    from benchmark_startup import start_stub_api
+
+    server, base_url = start_stub_api()
+    try:
+        usage = measure_engine(module, base_url)
+    finally:
+        server.shutdown()
+
+    scale = float(os.getenv('RESOURCE_BUDGET_SCALE', 1))
+    rss_budget = RSS_BUDGET_MB[module] * scale
+    thread_budget = THREAD_BUDGETS[module] + (WATCHDOG_THREADS if usage['watchdog'] else 0)
+    print(f"🧵 {module}: {usage['rss_mb']} MB (budget {rss_budget:.0f} MB), "
+          f"{usage['threads']} threads (budget {thread_budget})")
+    assert usage['loaded'], f"{module} did not load today's attendance"
+    assert usage['api_calls'] == 1, f"{module} made {usage['api_calls']} API calls on startup"
+    assert usage['threads'] <= thread_budget, \
+        f"{module} runs {usage['threads']} threads, budget is {thread_budget}"
+    if usage['rss_mb'] is not None:
+        assert usage['rss_mb'] <= rss_budget, f"{module} uses {usage['rss_mb']} MB, budget is {rss_budget:.0f} MB"
+
+
+def test_main_resources():
+    """The desktop GUI engine stays within its memory and thread budget"""
+    assert_within_budget('main')
+
+
+def test_tray_app_resources():
+    """The tray app engine stays within its memory and thread budget"""
+    assert_within_budget('tray_app')
+
+
+def test_background_service_resources():
+    """The background service engine stays within its memory and thread budget"""
+    assert_within_budget('background_service')
+
+
+def main():
+    """Main test function"""
+    print("🧪 Employee Tracker Resource Budget Check")
+    print("=" * 60)
+
+    tests = [
+        ("Desktop GUI Resource Test", test_main_resources),
+        ("Tray App Resource Test", test_tray_app_resources),
+        ("Background Service Resource Test", test_background_service_resources),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        print(f"\n📋 Running {test_name}...")
+        try:
+            test_func()
+            print(f"✅ {test_name} PASSED")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+
+    print("\n" + "=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
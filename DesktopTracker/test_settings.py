@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Settings test script for Employee Tracker
+Tests typed settings, atomic writes that keep unknown keys, and hot reload
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from tracker_core.clock import VirtualClock
+from tracker_core.power import SUSPENDED_INTERVAL_SECONDS
+from tracker_core.scheduler import Scheduler
+from tracker_core.settings import Settings, SettingsStore, SettingsWatcher
+
+SAMPLE_CONFIG = """# API Configuration
+API_BASE_URL=http://tracker.test/api
+API_TOKEN=old-token
+
+# Application Settings
+REMINDER_INTERVAL_MINUTES=45
+POWER_SAVER=yes
+IDLE_BREAK_MINUTES=soon
+CUSTOM_KEY=keep me
+"""
+
+
+def make_store(content=SAMPLE_CONFIG, environ=None):
+    """Create a store on a temporary settings file"""
+    directory = tempfile.mkdtemp(prefix='tracker-settings-')
+    path = os.path.join(directory, 'config.env')
+    if content is not None:
+        with open(path, 'w') as f:
+            f.write(content)
+    return SettingsStore(path, environ={} if environ is None else environ)
+
+
+def cleanup(store):
+    shutil.rmtree(os.path.dirname(store.path), ignore_errors=True)
+
+
+def test_typed_settings():
+    """Values are typed, with defaults for missing or invalid entries"""
+    store = make_store()
+    try:
+        settings = store.load()
+        assert settings.api_base_url == 'http://tracker.test/api'
+        assert settings.reminder_interval_minutes == 45
+        assert settings.power_saver is True
+        assert settings.idle_break_minutes == 15, "invalid values fall back to the default"
+        assert settings.daily_target_minutes == 480
+        assert settings.always_on_top is True
+        assert 'old-token' not in repr(settings)
+        print(f"✅ {settings}")
+    finally:
+        cleanup(store)
+
+
+def test_environment_override():
+    """Environment variables win over the file"""
+    store = make_store(environ={'API_TOKEN': 'from-env'})
+    try:
+        assert store.load().api_token == 'from-env'
+        print("✅ Environment overrides the settings file")
+    finally:
+        cleanup(store)
+
+
+def test_save_keeps_unknown_keys():
+    """Saving the token rewrites only that line and leaves no temp files"""
+    store = make_store()
+    try:
+        store.load()
+        store.save(api_token='new-token', daily_target_minutes=450)
+        with open(store.path) as f:
+            content = f.read()
+
+        assert 'API_TOKEN=new-token' in content
+        assert 'old-token' not in content
+        assert 'CUSTOM_KEY=keep me' in content
+        assert '# Application Settings' in content
+        assert content.index('API_TOKEN') < content.index('REMINDER_INTERVAL_MINUTES'), "keys keep their place"
+        assert content.rstrip().endswith('DAILY_TARGET_MINUTES=450')
+        assert os.listdir(os.path.dirname(store.path)) == ['config.env']
+        assert store.settings.api_token == 'new-token'
+        assert not store.changed(), "our own write is not an external change"
+
+        reloaded = make_store(content)
+        assert reloaded.load() == store.settings
+        cleanup(reloaded)
+        print("✅ Token saved, unknown keys and comments kept")
+    finally:
+        cleanup(store)
+
+
+def test_new_file_is_private():
+    """A settings file created by a save or by create() is only readable by the user"""
+    store = make_store(content=None)
+    try:
+        store.load()
+        store.save(api_token='secret')
+        if os.name == 'posix':
+            assert os.stat(store.path).st_mode & 0o077 == 0
+        assert Settings({'API_TOKEN': 'secret'}) == store.settings
+        print("✅ New settings file created with private permissions")
+    finally:
+        cleanup(store)
+
+    # setup.py creates the file the same way, and never over an existing one
+    store = make_store(content=None)
+    try:
+        assert store.create("API_TOKEN=\n")
+        if os.name == 'posix':
+            assert os.stat(store.path).st_mode & 0o077 == 0
+        assert not store.create("API_TOKEN=overwritten\n")
+        assert store.load().api_token == ''
+        assert not store.changed()
+        assert not [name for name in os.listdir(os.path.dirname(store.path)) if name.endswith('.tmp')]
+    finally:
+        cleanup(store)
+
+
+def test_hot_reload():
+    """External edits are picked up on the next poll and reported once"""
+    store = make_store()
+    clock = VirtualClock(datetime(2025, 9, 29, 9, 0))
+    scheduler = Scheduler(clock)
+    scheduler.start()
+    changes = []
+    watcher = SettingsWatcher(store, scheduler, lambda settings, changed: changes.append((settings, changed)),
+                              use_watchdog=False)
+    try:
+        store.load()
+        watcher.start()
+        clock.advance(watcher.poll_seconds * 3)
+        assert changes == [], "nothing changed yet"
+
+        with open(store.path, 'a') as f:
+            f.write("REMINDER_INTERVAL_MINUTES=20\n")
+        clock.advance(watcher.poll_seconds)
+        assert len(changes) == 1, changes
+        settings, changed = changes[0]
+        assert changed == {'reminder_interval_minutes'}, changed
+        assert settings.reminder_interval_minutes == 20
+
+        # Saving from the app doesn't trigger a reload
+        store.save(api_token='typed-in-settings-window')
+        clock.advance(watcher.poll_seconds * 2)
+        assert len(changes) == 1, changes
+
+        watcher.stop()
+        assert scheduler.next_due() is None
+        print(f"✅ Reloaded {sorted(changed)} after an external edit")
+    finally:
+        watcher.stop()
+        cleanup(store)
+
+
+def test_suspended_poll():
+    """While deferrable work is suspended the poll only runs every SUSPENDED_INTERVAL_SECONDS"""
+    store = make_store()
+    clock = VirtualClock(datetime(2025, 9, 29, 9, 0))
+    scheduler = Scheduler(clock)
+    scheduler.start()
+    changes = []
+    suspended = [True]
+    watcher = SettingsWatcher(store, scheduler, lambda settings, changed: changes.append(changed),
+                              use_watchdog=False, suspended=lambda: suspended[0])
+    try:
+        store.load()
+        watcher.start()
+        # The first poll runs on the normal interval and backs off from there
+        clock.advance(watcher.poll_seconds)
+        with open(store.path, 'a') as f:
+            f.write("REMINDER_INTERVAL_MINUTES=20\n")
+        clock.advance(SUSPENDED_INTERVAL_SECONDS - 1)
+        assert changes == [], "The edit should wait for the suspended poll"
+        clock.advance(1)
+        assert changes == [{'reminder_interval_minutes'}], changes
+
+        suspended[0] = False
+        clock.advance(SUSPENDED_INTERVAL_SECONDS)
+        assert scheduler.due_time(watcher.TIMER) - clock.time() <= watcher.poll_seconds
+    finally:
+        watcher.stop()
+        cleanup(store)
+
+
+def main():
+    """Main test function"""
+    print("🧪 Employee Tracker Settings Test Suite")
+    print("=" * 60)
+
+    tests = [
+        ("Typed Settings Test", test_typed_settings),
+        ("Environment Override Test", test_environment_override),
+        ("Atomic Save Test", test_save_keeps_unknown_keys),
+        ("New File Permissions Test", test_new_file_is_private),
+        ("Hot Reload Test", test_hot_reload),
+        ("Suspended Poll Test", test_suspended_poll),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        print(f"\n📋 Running {test_name}...")
+        try:
+            test_func()
+            print(f"✅ {test_name} PASSED")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+
+    print("\n" + "=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
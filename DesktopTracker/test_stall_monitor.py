@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Stall monitor test script for Employee Tracker
+Drives the heartbeat by hand on a fake Tk root and checks the lag histogram, stall capture and report
+"""
+
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from stall_monitor import LAG_BUCKETS_MS, StallMonitor
+
+
+class FakeRoot:
+    """Records after() calls instead of running a Tk loop"""
+
+    def __init__(self):
+        self.jobs = {}
+        self.cancelled = []
+        self.next_id = 0
+
+    def after(self, delay_ms, callback):
+        self.next_id += 1
+        job = f"after#{self.next_id}"
+        self.jobs[job] = (delay_ms, callback)
+        return job
+
+    def after_cancel(self, job):
+        self.cancelled.append(job)
+        self.jobs.pop(job, None)
+
+
+def beat_late(monitor, lag_ms):
+    """Run the pending heartbeat as if the loop got to it lag_ms late"""
+    monitor.expected_at = time.monotonic() - lag_ms / 1000
+    monitor._beat()
+
+
+def block_loop(seconds):
+    """Keep the loop thread busy past the heartbeat, like a slow handler would"""
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_lag_histogram():
+    """Each heartbeat lands in the bucket of its lag and schedules the next one"""
+    root = FakeRoot()
+    monitor = StallMonitor(root, interval_ms=250, threshold_ms=200)
+    monitor._schedule()
+    assert list(root.jobs.values())[0][0] == 250
+
+    beat_late(monitor, 0)
+    beat_late(monitor, 30)
+    beat_late(monitor, 60000)
+
+    assert monitor.beats == 3
+    assert monitor.histogram[0] == 1
+    assert monitor.histogram[LAG_BUCKETS_MS.index(50)] == 1
+    assert monitor.histogram[-1] == 1, "Lags past the last bucket go in the overflow bucket"
+    assert monitor.max_lag_ms >= 60000
+    assert len(root.jobs) == 4 and monitor.job == 'after#4'
+    assert not monitor.stalls, "Without the watchdog nothing is recorded as a stall"
+
+
+def test_stall_captured():
+    """A heartbeat late past the threshold records one stall with the loop thread's stack"""
+    root = FakeRoot()
+    monitor = StallMonitor(root, interval_ms=20, threshold_ms=50)
+    monitor.start()
+    try:
+        block_loop(0.4)
+        monitor._beat()
+    finally:
+        monitor.stop()
+
+    assert len(monitor.stalls) == 1, monitor.stalls
+    stall = monitor.stalls[0]
+    assert 'block_loop' in stall['stack'], stall['stack']
+    assert stall['duration_ms'] >= 350, stall['duration_ms']
+
+
+def test_below_threshold():
+    """A heartbeat that is late but under the threshold is not a stall"""
+    root = FakeRoot()
+    monitor = StallMonitor(root, interval_ms=20, threshold_ms=500)
+    monitor.start()
+    try:
+        block_loop(0.1)
+        monitor._beat()
+    finally:
+        monitor.stop()
+
+    assert monitor.beats == 1 and monitor.max_lag_ms > 0
+    assert not monitor.stalls, monitor.stalls
+
+
+def test_stop():
+    """Stopping cancels the pending heartbeat and a late one does not schedule another"""
+    root = FakeRoot()
+    monitor = StallMonitor(root)
+    monitor._schedule()
+    job = monitor.job
+    monitor.stop()
+    assert root.cancelled == [job] and monitor.job is None
+
+    beat_late(monitor, 10)
+    assert not root.jobs, "No heartbeat should be scheduled after stop()"
+
+
+def test_report():
+    """The report lists the beat count, every bucket and each stall with its stack"""
+    monitor = StallMonitor(FakeRoot(), max_stalls=2)
+    monitor._schedule()
+    beat_late(monitor, 3)
+    for number in range(3):
+        monitor.current_stall = {'started': time.time(), 'stack': f'  File "handler.py", line {number}\n'}
+        beat_late(monitor, 1000)
+
+    report = monitor.report()
+    lines = report.splitlines()
+    assert lines[0].startswith("Heartbeats: 4, max lag: 1000 ms, stalls: 2"), lines[0]
+    assert lines[1].split() == ['0-5', 'ms:', '1']
+    assert lines[1 + len(LAG_BUCKETS_MS)].split() == ['>5000', 'ms:', '0']
+    # Only the newest max_stalls are kept
+    assert 'line 0' not in report and 'line 1' in report and 'line 2' in report
+    assert report.count('Stall at') == 2
+
+
+def main():
+    """Main test function"""
+    print("🧪 Employee Tracker Stall Monitor Test")
+    print("=" * 60)
+
+    tests = [
+        ("Lag Histogram Test", test_lag_histogram),
+        ("Stall Capture Test", test_stall_captured),
+        ("Below Threshold Test", test_below_threshold),
+        ("Stop Test", test_stop),
+        ("Report Test", test_report),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        print(f"\n📋 Running {test_name}...")
+        try:
+            test_func()
+            print(f"✅ {test_name} PASSED")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+
+    print("\n" + "=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
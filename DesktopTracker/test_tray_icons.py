@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tray icon test script for Employee Tracker
+Checks the progress ring steps and that the tray icon is only swapped when its state or ring actually changes
+"""
+
+import os
+import sys
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from tracker_core.tray_icons import (MAX_PROGRESS_FRAMES, RING_BREAK_COLOR, RING_STEPS, RING_WORK_COLOR,
+                                     IconCache, TrayIconUpdater, ring_progress)
+
+HOUR = 3600
+TARGET = 8 * HOUR
+
+
+class FakeTrayIcon:
+    """Counts icon assignments like a pystray backend redrawing the tray"""
+
+    def __init__(self, icon=None):
+        self._icon = icon
+        self.redraws = 0
+
+    @property
+    def icon(self):
+        return self._icon
+
+    @icon.setter
+    def icon(self, image):
+        self._icon = image
+        self.redraws += 1
+
+
+def create_updater():
+    """Create an updater that renders its icons instead of loading the prebuilt frames"""
+    return TrayIconUpdater(IconCache(asset_dir=None))
+
+
+def test_unchanged_state_skipped():
+    """Applying the state the tray already shows does not redraw it"""
+    updater = create_updater()
+    tray_icon = FakeTrayIcon(updater.initial_icon())
+
+    assert not updater.apply(tray_icon, 'syncing'), "The initial state should not be drawn again"
+    assert updater.apply(tray_icon, 'present')
+    for _ in range(5):
+        assert not updater.apply(tray_icon, 'present')
+    assert updater.apply(tray_icon, 'offline')
+    assert updater.apply(tray_icon, 'present')
+
+    stats = updater.stats()
+    assert tray_icon.redraws == 3, tray_icon.redraws
+    assert stats['icon_updates'] == 3 and stats['skipped_updates'] == 6
+    assert stats['redundant_updates'] == 0
+    assert stats['key'] == ('present', None)
+
+
+def test_unchanged_progress_skipped():
+    """The ring is only redrawn when a progress step changes"""
+    updater = create_updater()
+    tray_icon = FakeTrayIcon(updater.initial_icon())
+
+    assert updater.apply(tray_icon, 'present', (3, 3))
+    assert not updater.apply(tray_icon, 'present', (3, 3))
+    assert updater.apply(tray_icon, 'present', (4, 4))
+    assert updater.apply(tray_icon, 'present', (4, 5)), "A longer break changes the ring"
+    assert updater.apply(tray_icon, 'late', (4, 5)), "A new state changes the icon behind the ring"
+    assert updater.apply(tray_icon, 'late'), "Dropping the ring changes the icon"
+    assert not updater.apply(tray_icon, 'late')
+
+    assert tray_icon.redraws == 5, tray_icon.redraws
+    assert updater.stats()['skipped_updates'] == 2
+    assert updater.stats()['redundant_updates'] == 0
+
+
+def test_ring_boundaries():
+    """Ring steps start empty, only move on whole steps, cap at a full ring and fill up without a target"""
+    step_seconds = TARGET // RING_STEPS
+    assert ring_progress(0, 0, TARGET) == (0, 0)
+    assert ring_progress(step_seconds - 1, 0, TARGET) == (0, 0)
+    assert ring_progress(step_seconds, 0, TARGET) == (1, 1)
+    assert ring_progress(TARGET, 0, TARGET) == (RING_STEPS, RING_STEPS)
+    assert ring_progress(10 * HOUR, 2 * HOUR, TARGET) == (RING_STEPS, RING_STEPS), "Overtime stays a full ring"
+    # Without a target there is nothing to measure against, so the ring shows as full
+    assert ring_progress(0, 0, 0) == (RING_STEPS, RING_STEPS)
+    assert ring_progress(HOUR, 0, -1) == (RING_STEPS, RING_STEPS)
+
+
+def test_ring_break_share():
+    """Break time extends the elapsed arc past the work arc, up to a full ring"""
+    assert ring_progress(4 * HOUR, HOUR, TARGET) == (24, 30)
+    assert ring_progress(0, 2 * HOUR, TARGET) == (0, 12)
+    assert ring_progress(7 * HOUR, 2 * HOUR, TARGET) == (42, RING_STEPS)
+
+
+def test_ring_colors():
+    """The work arc is drawn over the break arc, which runs up to the elapsed time"""
+    cache = IconCache(asset_dir=None)
+    size = 64
+    # The ring is 6 px wide, 6 px in from the edge, and starts at 12 o'clock
+    top = (size // 2 + 1, 8)
+    assert cache.get_progress('present', 0, 0, size).getpixel(top) not in (RING_WORK_COLOR[:3], RING_BREAK_COLOR[:3])
+    assert cache.get_progress('present', 0, RING_STEPS, size).getpixel(top) == RING_BREAK_COLOR[:3]
+    assert cache.get_progress('present', RING_STEPS, RING_STEPS, size).getpixel(top) == RING_WORK_COLOR[:3]
+
+    for step in range(MAX_PROGRESS_FRAMES + 5):
+        cache.get_progress('present', step, step, size)
+    assert len(cache._progress) == MAX_PROGRESS_FRAMES, "Old progress frames should be dropped"
+
+
+def main():
+    """Main test function"""
+    print("🧪 Employee Tracker Tray Icon Test")
+    print("=" * 60)
+
+    tests = [
+        ("Unchanged State Test", test_unchanged_state_skipped),
+        ("Unchanged Progress Test", test_unchanged_progress_skipped),
+        ("Ring Boundaries Test", test_ring_boundaries),
+        ("Ring Break Share Test", test_ring_break_share),
+        ("Ring Colors Test", test_ring_colors),
+    ]
+
+    passed = 0
+    for test_name, test_func in tests:
+        print(f"\n📋 Running {test_name}...")
+        try:
+            test_func()
+            print(f"✅ {test_name} PASSED")
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} FAILED: {e}")
+        except Exception as e:
+            print(f"❌ {test_name} ERROR: {e}")
+
+    print("\n" + "=" * 60)
+    print(f"📊 Test Results: {passed}/{len(tests)} tests passed")
+    if passed != len(tests):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
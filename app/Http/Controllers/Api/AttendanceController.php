@@ -170,6 +170,9 @@ public function checkOut(Request $request): JsonResponse
 
     /**
      * Get today's attendance for the authenticated user
+     *
+     * The record's times are "H:i:s" wall clock times, so the date and the
+     * timezone they belong to are sent along for clients in other timezones.
      */
     public function today(Request $request): JsonResponse
     {
@@ -182,6 +185,8 @@ public function today(Request $request): JsonResponse
 
         return response()->json([
             'success' => true,
+            'date' => $today->toDateString(),
+            'timezone' => config('app.timezone'),
             'data' => $attendance
         ]);
     }
@@ -0,0 +1,35 @@
+<?php
+
+namespace App\Http\Middleware;
+
+use Closure;
+use Illuminate\Http\Request;
+use Illuminate\Support\Facades\Log;
+use Illuminate\Support\Str;
+use Symfony\Component\HttpFoundation\Response;
+
+class RequestId
+{
+    /**
+     * Add the client's X-Request-Id to the log context and echo it back.
+     *
+     * The desktop tracker logs the same id, so client and server log lines
+     * for one request can be matched.
+     *
+     * @param  \Closure(\Illuminate\Http\Request): (\Symfony\Component\HttpFoundation\Response)  $next
+     */
+    public function handle(Request $request, Closure $next): Response
+    {
+        $requestId = $request->header('X-Request-Id');
+        if (!is_string($requestId) || !preg_match('/^[A-Za-z0-9._-]{1,64}$/', $requestId)) {
+            $requestId = (string) Str::uuid();
+        }
+
+        Log::withContext(['request_id' => $requestId]);
+
+        $response = $next($request);
+        $response->headers->set('X-Request-Id', $requestId);
+
+        return $response;
+    }
+}
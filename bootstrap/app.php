@@ -15,6 +15,9 @@
         $middleware->alias([
             'admin' => \App\Http\Middleware\AdminMiddleware::class,
         ]);
+        $middleware->api(prepend: [
+            \App\Http\Middleware\RequestId::class,
+        ]);
     })
     ->withExceptions(function (Exceptions $exceptions) {
         //